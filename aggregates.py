@@ -0,0 +1,76 @@
+import bisect
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from enrich_workers import ENRICHING
+from incremental import IncrementalIndex, UserRegistry
+
+
+class JobAggregates(IncrementalIndex):
+    """
+    Running dashboard numbers for one user's jobs.
+
+    Keeps a sorted array of timestamps (ns since epoch), per-day counts,
+    company counts and skill frequencies. `sync` only folds in rows past the
+    last one seen, so render cost doesn't grow with history.
+    """
+
+    def reset(self):
+        super().reset()
+        self.timestamps = []
+        self.days = Counter()
+        self.companies = Counter()
+        self.skills = Counter()
+
+    def add(self, ts, company, skills):
+        if not pd.isna(ts):
+            ns = pd.Timestamp(ts).value
+            if not self.timestamps or ns >= self.timestamps[-1]:
+                self.timestamps.append(ns)
+            else:
+                bisect.insort(self.timestamps, ns)
+            self.days[pd.Timestamp(ts).date()] += 1
+        if company == ENRICHING:
+            # Counted by date only until the background enrichment fills it in
+            return
+        self.companies[str(company)] += 1
+        for skill in str(skills or "").split(","):
+            skill = skill.strip()
+            if skill:
+                self.skills[skill] += 1
+
+    def fold(self, new, start):
+        for ts, company, skills in zip(new["Timestamp"], new["Company"], new["Top Skills List"]):
+            self.add(ts, company, skills)
+
+    def count_since(self, cutoff):
+        """Jobs at or after `cutoff`, by binary search over the sorted timestamps."""
+        return len(self.timestamps) - bisect.bisect_left(self.timestamps, pd.Timestamp(cutoff).value)
+
+    def window_counts(self, days=(1, 7, 30), now=None):
+        now = now or datetime.now()
+        return {d: self.count_since(now - timedelta(days=d)) for d in days}
+
+    def jobs_per_day(self):
+        return pd.Series(dict(sorted(self.days.items())), dtype="int64")
+
+    def top_companies(self, n=10):
+        return pd.Series(dict(self.companies.most_common(n)), dtype="int64")
+
+    def skill_freq(self):
+        return dict(self.skills)
+
+
+class AggregateRegistry(UserRegistry):
+    """Process-wide JobAggregates per user."""
+
+    def __init__(self):
+        super().__init__(lambda username: JobAggregates())
+
+    def get(self, username, df):
+        agg = self._index(username)
+        with agg.lock:
+            agg.sync(df)
+        return agg
@@ -1,16 +1,9 @@
 import streamlit as st
-import pandas as pd
-from datetime import datetime, timedelta
-from openai import OpenAI
-import re
+from datetime import datetime
 import os
-from dotenv import load_dotenv
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-import json
-import gspread
-from google.oauth2.service_account import Credentials
-import base64, json
+import time
+from tracing import STORE as SPANS, span, traced, begin_trace, end_trace
+from schema import JOB_HEADER, JOB_FRAME_WIDTH, JOB_FRAME_HEADER, CONTACT_HEADER
 
 st.set_page_config(page_title="Job Tracker", layout="wide")
 
@@ -20,73 +13,432 @@ st.set_page_config(page_title="Job Tracker", layout="wide")
 openai_key = st.secrets["OPENAI_API_KEY"]
 password_check = st.secrets["APP_PASSWORD"]
 
-def get_gsheet_client():
-    # 1. Base64-decode the JSON
-    b64 = st.secrets["GCP_SA_B64"]
-    creds_json = base64.b64decode(b64).decode("utf-8")
+@st.cache_resource
+def get_sheet_pool():
+    # One decoded service account, client and set of worksheet handles per process;
+    # every session's Sheets calls share one quota governor
+    governor = Governor(
+        reads_per_min=st.secrets.get("SHEETS_READS_PER_MIN", 55),
+        writes_per_min=st.secrets.get("SHEETS_WRITES_PER_MIN", 55),
+    )
+    return SheetPool(st.secrets["GCP_SA_B64"], st.secrets["GSHEET_ID"], governor=governor)
+
+@st.cache_resource
+def get_snapshot_store():
+    # Shared by every tab and session; reads only fetch rows appended since the last sync
+    return SnapshotStore(
+        ttl=st.secrets.get("SNAPSHOT_TTL", 60),
+        max_bytes=st.secrets.get("SNAPSHOT_MAX_MB", 200) * 1024 * 1024,
+    )
 
-    # 2. Parse it
-    creds_info = json.loads(creds_json)
+@st.cache_resource
+def get_description_store():
+    # Job descriptions live on disk and are loaded only for rows that need them
+    return DescriptionStore(
+        st.secrets.get("DESCRIPTION_STORE_PATH", os.path.join("data", "descriptions.sqlite3"))
+    )
 
-    # 3. Build the credentials and authorize
-    creds = Credentials.from_service_account_info(
-        creds_info,
-        scopes=["https://www.googleapis.com/auth/spreadsheets"]
+@st.cache_resource
+def get_summary_store():
+    # Detailed skills summaries, generated the first time a job's details are opened
+    return DescriptionStore(
+        st.secrets.get("DESCRIPTION_STORE_PATH", os.path.join("data", "descriptions.sqlite3")),
+        table="summaries",
     )
-    return gspread.authorize(creds)
 
+def job_frame_builder(username):
+    return lambda rows: compact_job_frame(rows, JOB_FRAME_HEADER, get_description_store(), username)
 
-def get_user_sheet(username):
-    client = get_gsheet_client()
-    sh = client.open_by_key(st.secrets["GSHEET_ID"])
-    try:
-        ws = sh.worksheet(username)
-    except gspread.WorksheetNotFound:
-        ws = sh.add_worksheet(title=username, rows="1000", cols="20")
-        ws.append_row(["Timestamp","Job Link","Company","Job Description","Top Skills List","Detailed Skills Summary"])
-    return ws
+def read_snapshot(username, title, header, cols="20", build=None, width=None):
+    pool = get_sheet_pool()
+    return get_snapshot_store().read(
+        username, title, header[:width] if width else header,
+        lambda start: pool.rows_from(username, title, header, start, cols=cols, width=width),
+        build=build,
+    )
 
-def append_job_row(username, row):
-    ws = get_user_sheet(username)
-    ws.append_row([
-        row["Timestamp"],
-        row["Job Link"],
-        row["Company"],
-        row["Job Description"],
-        row["Top Skills List"],
-        row["Detailed Skills Summary"]
+@st.cache_resource
+def get_llm_cache():
+    # Shared across sessions and restarts; reposted jobs enrich without an API call
+    return LLMCache(
+        st.secrets.get("LLM_CACHE_PATH", os.path.join("data", "llm_cache.sqlite3")),
+        max_entries=st.secrets.get("LLM_CACHE_MAX_ENTRIES", 20000),
+    )
+
+@st.cache_resource
+def get_search_indexes():
+    # Per-user inverted indexes, extended as new rows show up in the frame
+    return IndexRegistry()
+
+@st.cache_resource
+def get_aggregates():
+    # Per-user day/company/skill counts, updated as rows are appended or synced
+    return AggregateRegistry()
+
+@st.cache_resource
+def get_wordcloud_cache():
+    return WordCloudCache(max_entries=st.secrets.get("WORDCLOUD_CACHE_ENTRIES", 32))
+
+def sheet_layout(title):
+    # Every worksheet is either a user's jobs sheet or their contacts_ sheet
+    if title.startswith("contacts_"):
+        return CONTACT_HEADER, "10"
+    return JOB_HEADER, "20"
+
+@st.cache_resource
+def get_write_queue():
+    pool = get_sheet_pool()
+
+    def flush(username, title, rows):
+        header, cols = sheet_layout(title)
+        with span("sheets.append"):
+            pool.call(username, title, header, lambda ws: ws.append_rows(rows), cols=cols)
+
+    # Replays anything left in the journal from a previous run
+    return WriteQueue(
+        st.secrets.get("WRITE_JOURNAL", os.path.join("data", "write_journal.jsonl")),
+        flush,
+        on_commit=get_snapshot_store().mark_stale,
+    )
+
+def with_pending(df, username, title, header, build=None):
+    # Rows accepted but not yet in the sheet show up immediately
+    pending = [r[:len(header)] for r in get_write_queue().pending_rows(username, title)]
+    if not pending:
+        return df
+    build = build or (lambda rows: pd.DataFrame(rows, columns=header))
+    return concat_frames(df, build(pending))
+
+@st.cache_resource
+def get_shard_catalog():
+    # Jobs roll over to a new worksheet once the active one is too big or too old
+    return ShardCatalog(
+        get_sheet_pool().titles,
+        max_rows=st.secrets.get("SHARD_MAX_ROWS", 5000),
+        max_age_days=st.secrets.get("SHARD_MAX_DAYS", 180),
+    )
+
+@st.cache_resource
+def get_archive_cache():
+    # Archive shards no longer change, so a local copy never goes stale
+    return ArchiveCache(st.secrets.get("ARCHIVE_DIR", os.path.join("data", "archive")))
+
+def active_job_title(username):
+    """Worksheet new job rows go to, rolling over to a new shard when needed."""
+    catalog = get_shard_catalog()
+    title = catalog.active(username)
+    df = read_snapshot(username, title, JOB_HEADER, build=job_frame_builder(username), width=JOB_FRAME_WIDTH)
+    n_rows = len(df) + len(get_write_queue().pending_rows(username, title))
+    oldest = df["Timestamp"].min() if len(df) else None
+    if catalog.needs_rollover(n_rows, None if pd.isna(oldest) else oldest):
+        title = catalog.roll_over(
+            username, lambda t: get_sheet_pool().worksheet(username, t, JOB_HEADER)
+        )
+    return title
+
+@st.cache_resource
+def get_similar_jobs():
+    # Memory-mapped job vectors, one file pair per user
+    return SimilarJobs(st.secrets.get("VECTOR_DIR", os.path.join("data", "vectors")))
+
+@st.cache_resource
+def get_join_index():
+    # Per-user contacts <-> jobs hash join on canonical link, company as fallback
+    return JoinRegistry()
+
+def index_new_jobs(username, rows):
+    keys = [row_key(r["Timestamp"], r["Job Link"], r["Job Description"]) for r in rows]
+    get_similar_jobs().add(username, [
+        (key, "" if r["Top Skills List"] == ENRICHING else r["Top Skills List"], r["Job Description"])
+        for key, r in zip(keys, rows)
     ])
+    joins = get_join_index()
+    for key, r in zip(keys, rows):
+        joins.add_job(username, key, r, pd.to_datetime(r["Timestamp"], errors="coerce"))
 
-def fetch_job_df(username):
-    ws = get_user_sheet(username)
-    data = ws.get_all_records()
-    return pd.DataFrame(data)
+def append_job_row(username, row):
+    """Queue one job row; returns the worksheet title it goes to."""
+    title = active_job_title(username)
+    get_write_queue().enqueue(username, title, [row[c] for c in JOB_HEADER])
+    index_new_jobs(username, [row])
+    return title
+
+def append_job_rows(username, rows):
+    # Flushed by the write queue in append_rows batches
+    get_write_queue().enqueue_many(
+        username, active_job_title(username), [[r[c] for c in JOB_HEADER] for r in rows]
+    )
+    index_new_jobs(username, rows)
+
+def similar_jobs(username, key, k=10):
+    """Frame rows most like the job with `key`, best first, with a Similarity column."""
+    df = fetch_job_df(username)
+    with span("data.similar"):
+        hits = get_similar_jobs().similar_to(
+            username, df, lambda keys: load_descriptions(username, keys), key, k
+        )
+    scores = dict(hits)
+    out = df[df["Row Key"].isin(scores)].copy()
+    out["Similarity"] = out["Row Key"].map(scores).round(3)
+    return out.sort_values("Similarity", ascending=False, kind="mergesort")
+
+def read_job_shard(username, title, archived):
+    build = job_frame_builder(username)
+    if not archived:
+        df = read_snapshot(username, title, JOB_HEADER, build=build, width=JOB_FRAME_WIDTH)
+        return with_pending(df, username, title, JOB_FRAME_HEADER, build=build)
+    pool = get_sheet_pool()
+    archive = get_archive_cache()
+    fetch_all = lambda: pool.rows_from(username, title, JOB_HEADER, 2, width=JOB_FRAME_WIDTH)
+    return get_snapshot_store().read(
+        username, title, JOB_FRAME_HEADER,
+        lambda start: archive.rows_from(title, start, fetch_all),
+        build=build,
+        ttl=float("inf"),
+    )
 
-def get_contacts_sheet(username):
-    client = get_gsheet_client()
-    sh = client.open_by_key(st.secrets["GSHEET_ID"])
-    title = f"contacts_{username}"
-    try:
-        ws = sh.worksheet(title)
-    except gspread.WorksheetNotFound:
-        ws = sh.add_worksheet(title=title, rows="1000", cols="10")
-        ws.append_row(["Timestamp","Job Role","Company","Job Link","People Contacted"])
-    return ws
+def fetch_job_df(username, since=None):
+    """
+    Lean job frame (typed Timestamp, categorical Company/skills, descriptions
+    behind "Row Key") over the shards that can hold rows at or after `since`.
+    """
+    catalog = get_shard_catalog()
+    active = catalog.active(username)
+    df = None
+    for title in catalog.for_window(username, since):
+        # A shard with rows still queued for it isn't a finished archive yet
+        archived = title != active and not get_write_queue().pending_rows(username, title)
+        df = concat_frames(df, read_job_shard(username, title, archived))
+    return df
+
+def load_descriptions(username, keys):
+    return get_description_store().get_many(username, keys)
 
 def append_contact_row(username, row):
-    ws = get_contacts_sheet(username)
-    ws.append_row([
-        row["Timestamp"],
-        row["Job Role"],
-        row["Company"],
-        row["Job Link"],
-        row["People Contacted"]
-    ])
+    title = f"contacts_{username}"
+    get_write_queue().enqueue(username, title, [row[c] for c in CONTACT_HEADER])
+    get_join_index().add_contact(username, row)
 
 def fetch_contacts_df(username):
-    ws = get_contacts_sheet(username)
-    data = ws.get_all_records()
-    return pd.DataFrame(data)
+    title = f"contacts_{username}"
+    df = read_snapshot(username, title, CONTACT_HEADER, cols="10")
+    return with_pending(df, username, title, CONTACT_HEADER)
+
+@traced("data.filter")
+def filter_jobs(username, df, company_filter, keyword_filter, num_days):
+    filtered = df
+    if keyword_filter:
+        # Index lookup over skills and description, best matches first
+        hits = get_search_indexes().search(
+            username, df, keyword_filter,
+            load_text=lambda keys: load_descriptions(username, keys)
+        )
+        filtered = df.iloc[hits]
+    if company_filter:
+        filtered = filtered[
+            filtered["Company"].str.contains(company_filter, case=False, na=False, regex=False)
+        ]
+    if num_days > 0:
+        cutoff = pd.Timestamp.now() - pd.Timedelta(days=num_days)
+        filtered = filtered[filtered["Timestamp"] >= cutoff]
+    return filtered
+
+@st.cache_resource
+def get_dedup():
+    # Per-user canonical link keys and SimHash sketches of tracked jobs
+    return DedupRegistry()
+
+def check_duplicate(username, job_link, job_description):
+    return get_dedup().check(
+        username, fetch_job_df(username), lambda keys: load_descriptions(username, keys),
+        job_link, job_description
+    )
+
+def add_job(username, job_link, job_description):
+    # The row is saved right away; company and skills are filled in by a background worker
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    row = {
+        "Timestamp": timestamp,
+        "Job Link": job_link,
+        "Company": ENRICHING,
+        "Job Description": job_description,
+        "Top Skills List": ENRICHING,
+        "Detailed Skills Summary": ""
+    }
+    title = append_job_row(username, row)
+    get_enrichment_workers().submit(username, title, timestamp, job_link, job_description)
+    # The form's widgets already exist in this run; the next run clears them before they render
+    st.session_state["job_added"] = True
+    st.rerun()
+
+def clear_job_form():
+    for k in ("job_link_input", "job_desc_input"):
+        st.session_state[k] = ""
+
+def locate_job_row(pool, username, title, key):
+    """1-based sheet row of the job with row key `key` in `title`, or None."""
+    rows = pool.call(
+        username, title, JOB_HEADER, lambda ws: ws.get_values("A2:B"),
+        kind="read", key=("rows", title, "A2:B"),
+    )
+    for i, r in enumerate(rows):
+        if len(r) >= 2 and r[1] and row_key(r[0], r[1]) == key:
+            return i + 2
+    if all(len(r) >= 2 and r[1] for r in rows):
+        return None
+    # Link-less rows are keyed on their description too, so only then is column D read
+    rows = pool.call(
+        username, title, JOB_HEADER, lambda ws: ws.get_values("A2:D"),
+        kind="read", key=("rows", title, "A2:D"),
+    )
+    for i, r in enumerate(rows):
+        r = list(r) + [""] * (4 - len(r))
+        if not r[1] and row_key(r[0], r[1], r[3]) == key:
+            return i + 2
+    return None
+
+def load_summary(username, key, timestamp):
+    """Stored summary for a job: the local store first, then that row's cell in the sheet."""
+    store = get_summary_store()
+    text = store.get(username, key)
+    if text:
+        return text
+    pool = get_sheet_pool()
+    with span("data.summary_lookup"):
+        for title in get_shard_catalog().for_window(username, since=timestamp):
+            n = locate_job_row(pool, username, title, key)
+            if n is None:
+                continue
+            cell = pool.call(username, title, JOB_HEADER, lambda ws: ws.get_values(f"F{n}"), kind="read")
+            text = cell[0][0] if cell and cell[0] else ""
+            if text.startswith("Error:") or text == ENRICHING:
+                text = ""
+            if text:
+                store.put_many(username, [(key, text)])
+            return text
+    return ""
+
+def generate_summary(username, key, timestamp, description, placeholder):
+    """Stream a new summary into `placeholder`, then keep it locally and in the sheet."""
+    text = ""
+    for delta in stream_skills_summary(
+        OpenAI(api_key=openai_key), description, st.secrets.get("PROMPT_TOKEN_BUDGET", 1500)
+    ):
+        text += delta
+        placeholder.markdown(f"**Skills Summary:** {text}▌")
+    text = clean_gpt_output(text)
+    placeholder.markdown(f"**Skills Summary:** {text}")
+    get_summary_store().put_many(username, [(key, text)])
+
+    pool = get_sheet_pool()
+    for title in get_shard_catalog().for_window(username, since=timestamp):
+        # Only this worksheet's queued rows need to land before the lookup
+        get_write_queue().flush(username, title)
+        n = locate_job_row(pool, username, title, key)
+        if n is not None:
+            pool.call(username, title, JOB_HEADER, lambda ws: ws.batch_update([
+                {"range": f"F{n}", "values": [[text]]}
+            ]))
+            break
+    return text
+
+@st.cache_resource
+def get_enrichment_workers():
+    pool = get_sheet_pool()
+    queue = get_write_queue()
+    store = get_snapshot_store()
+    indexes, aggregates, joins = get_search_indexes(), get_aggregates(), get_join_index()
+    dedup, similar, archives = get_dedup(), get_similar_jobs(), get_archive_cache()
+    cache = get_llm_cache()
+    client = OpenAI(api_key=openai_key)
+    budget = st.secrets.get("PROMPT_TOKEN_BUDGET", 1500)
+
+    def enrich(link, description):
+        return enrich_job(client, link, description, cache=cache, strict=True, budget=budget)
+
+    def patch(username, title, timestamp, link, description, result):
+        # The row has to be in the sheet before its cells can be updated
+        if not queue.flush(username, title):
+            raise RowNotSaved(f"row not saved yet: {queue.stats(username)['last_error']}")
+        key = row_key(timestamp, link, description)
+        with span("sheets.patch_enrichment"):
+            n = locate_job_row(pool, username, title, key)
+            if n is None:
+                raise LookupError(f"row for {link} at {timestamp} not found in {title}")
+            # The summary column is left alone; it is filled in on demand
+            pool.call(username, title, JOB_HEADER, lambda ws: ws.batch_update([
+                {"range": f"C{n}", "values": [[result["company"]]]},
+                {"range": f"E{n}", "values": [[result["skills_list"]]]},
+            ]))
+        # Incremental syncs only see appended rows, so patched cells need a full re-read
+        store.invalidate(username, title)
+        archives.drop(title)  # the shard may have rolled over while the row was enriching
+        indexes.drop(username)
+        aggregates.drop(username)
+        joins.drop(username)
+        dedup.drop(username)
+        # The row was vectorised without skills when it was added
+        similar.add(username, [(key, result["skills_list"], description)], replace=True)
+
+    return EnrichmentWorkers(
+        st.secrets.get("ENRICH_JOURNAL", os.path.join("data", "enrich_journal.jsonl")),
+        enrich, patch,
+        workers=st.secrets.get("ENRICH_WORKERS", 2),
+    )
+
+def enrichment_status():
+    """Jobs still being enriched for this user; polls until they are done."""
+    workers = get_enrichment_workers()
+    status = workers.stats(st.session_state.username)
+    if status["failed"]:
+        st.warning(
+            f"{status['failed']} job(s) could not be enriched and still show \"{ENRICHING}\": "
+            f"{status['failed_error']}"
+        )
+        col_retry, col_dismiss = st.columns(2)
+        if col_retry.button("Retry enrichment"):
+            workers.retry_failed(st.session_state.username)
+            st.rerun()
+        if col_dismiss.button("Dismiss", help="backfill.py can fix these rows later"):
+            workers.dismiss_failed(st.session_state.username)
+            st.rerun()
+    if not status["pending"]:
+        if st.session_state.pop("enrichment_was_pending", False):
+            st.rerun()
+        return
+    st.session_state.enrichment_was_pending = True
+    note = f"Enriching {status['pending']} job(s) in the background"
+    if status["retrying"]:
+        note += f", {status['retrying']} retrying after: {status['last_error']}"
+    st.info(note)
+
+# Re-render just the status box every few seconds where the Streamlit version supports it
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+if _fragment:
+    enrichment_status = _fragment(run_every=3)(enrichment_status)
+
+PAGE_SIZES = [25, 50, 100, 200]
+
+def pager(key, df, date_column=None, ascending=False):
+    """Page size, page and jump-to-date controls; returns only the visible rows."""
+    col_size, col_page, col_jump = st.columns(3)
+    default_size = st.secrets.get("PAGE_SIZE", 50)
+    size = col_size.selectbox(
+        "Rows per page", PAGE_SIZES,
+        index=PAGE_SIZES.index(default_size) if default_size in PAGE_SIZES else 1,
+        key=f"{key}_page_size"
+    )
+    n_pages = page_count(len(df), size)
+    page_key = f"{key}_page"
+    if date_column is not None and len(df):
+        jump = col_jump.date_input("Jump to date", value=None, key=f"{key}_jump")
+        if jump and jump != st.session_state.get(f"{key}_jumped"):
+            st.session_state[page_key] = page_for_date(df[date_column], jump, ascending, size)
+        st.session_state[f"{key}_jumped"] = jump
+    # Filters can shrink the result; keep the stored page in range before the widget reads it
+    st.session_state[page_key] = min(max(1, st.session_state.get(page_key, 1)), n_pages)
+    page = col_page.number_input(f"Page (of {n_pages})", 1, n_pages, key=page_key)
+    return page_slice(df, page, size)
 
 # --- Custom Login ---
 if "authenticated" not in st.session_state:
@@ -109,8 +461,44 @@ if not st.session_state.authenticated:
         else:
             st.error("Invalid username or password")
 else:
+    # Heavy dependencies load only once someone is logged in; the login screen
+    # above needs nothing but streamlit (bench/startup.py guards this).
+    # wordcloud itself is imported by the background renderer on first use.
+    import pandas as pd
+    from openai import OpenAI
+    from sheets import SheetPool
+    from governor import Governor
+    from snapshots import SnapshotStore, concat_frames
+    from job_frame import DescriptionStore, compact_job_frame, attach_descriptions, row_key
+    from write_queue import WriteQueue
+    from enrich_workers import ENRICHING, EnrichmentWorkers, RowNotSaved
+    from enrichment import enrich_job, stream_skills_summary, clean_gpt_output
+    from company_rules import TIER_STATS as COMPANY_TIERS
+    from llm_cache import LLMCache
+    from search_index import IndexRegistry
+    from aggregates import AggregateRegistry
+    from wordcloud_cache import WordCloudCache
+    from shards import ShardCatalog, ArchiveCache
+    from dedup import DedupRegistry, find_duplicates
+    from similar_jobs import SimilarJobs
+    from join_index import JoinRegistry
+    from bulk_import import parse_upload, parse_pasted, run_import
+    from paging import stable_sort, page_count, page_slice, page_for_date
+
     username = st.session_state.username
     st.sidebar.success(f"Welcome, {username}")
+    sync = get_write_queue().stats(username)
+    if sync["pending"]:
+        st.sidebar.caption(f"Saving: {sync['pending']} pending, {sync['committed']} committed")
+        if sync["last_error"]:
+            st.sidebar.warning(f"Sheet sync retrying: {sync['last_error']}")
+    elif not sync["dead"]:
+        st.sidebar.caption(f"All changes saved ({sync['committed']} committed this session)")
+    if sync["dead"]:
+        st.sidebar.error(f"{sync['dead']} row(s) could not be saved: {sync['dead_error']}")
+        if st.sidebar.button("Retry failed saves"):
+            get_write_queue().retry_dead(username)
+            st.rerun()
     if st.sidebar.button("Logout"):
         st.session_state.authenticated = False
         st.session_state.username = ""
@@ -123,7 +511,15 @@ else:
     else:
         client = OpenAI(api_key=openai_key)
 
-    tab1, tab2, tab_dashboard, tab4 = st.tabs(["Add Job", "Data", "Dashboard", "Networking"])
+    # Explicit view router: unlike st.tabs, only the selected view runs (and
+    # fetches data) on each rerun
+    is_admin = username in st.secrets.get("ADMIN_USERS", [])
+    views = ["Add Job", "Data", "Dashboard", "Networking"] + (["Ops"] if is_admin else [])
+    view = st.radio(
+        "View", views, horizontal=True, key="active_view", label_visibility="collapsed"
+    )
+    view_started = time.perf_counter()
+    begin_trace()
 
     # --- Add Job Tab ---
     # with tab1:
@@ -131,62 +527,6 @@ else:
     #     job_link = st.text_input("Paste Job Link", placeholder="https://www.linkedin.com/jobs/view/...")
     #     job_description = st.text_area("Paste Job Description", height=300)
 
-    def extract_company_name(job_link: str, job_description: str) -> str:
-        """
-        Uses OpenAI to reliably extract the company name from a job link and description.
-        Falls back to "Unknown" on any error.
-        """
-        try:
-            prompt = (
-                "You are a data extraction assistant.  \n"
-                "Given a job posting, identify and return only the name of the hiring company.  \n"
-                "If you cannot determine it, return 'Unknown'.\n\n"
-                f"Job Link: {job_link}\n\n"
-                f"Job Description:\n{job_description}"
-            )
-            resp = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system",  "content": "You extract structured fields from unstructured text."},
-                    {"role": "user",    "content": prompt}
-                ]
-            )
-            company = resp.choices[0].message.content.strip()
-            # Make sure we never return an empty string
-            return company if company else "Unknown"
-        except Exception as e:
-            # On error, log and return Unknown
-            st.error(f"Error extracting company name: {e}")
-            return "Unknown"
-
-
-    def clean_gpt_output(text):
-        return re.sub(r"[\*\n]+", " ", text).strip()
-
-    def extract_skills_with_openai(text):
-        try:
-            simple_response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "Return only the top 5 skills from this job description as a comma-separated list, no bullets, no markdown, no explanation."},
-                    {"role": "user", "content": text}
-                ]
-            )
-            skill_list = clean_gpt_output(simple_response.choices[0].message.content)
-
-            detailed_response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "Write a clean, markdown-free summary of the top 5 required skills in paragraph form (no * or ** or -)."},
-                    {"role": "user", "content": text}
-                ]
-            )
-            skill_details = clean_gpt_output(detailed_response.choices[0].message.content)
-
-            return skill_list, skill_details
-        except Exception as e:
-            return f"Error: {e}", f"Error: {e}"
-
         # if st.button("Add to Tracker"):
         #     if job_link and job_description:
         #         company = extract_company_name(job_link, job_description)
@@ -209,8 +549,11 @@ else:
         #         st.warning("Please enter both job link and description.")
 
    # --- Add Job Tab ---
-    with tab1:
+    if view == "Add Job":
         st.header("Add Job to Tracker")
+        if st.session_state.pop("job_added", False):
+            clear_job_form()
+            st.success("Job added! Company and skills will appear once enrichment finishes.")
 
         # Wrap only the submission inside a form
         with st.form("job_form"):
@@ -227,163 +570,291 @@ else:
             submitted = st.form_submit_button("Add to Tracker")
 
         # A separate Clear button, outside the form
-        if st.button("Clear Form"):
-            for k in ("job_link_input", "job_desc_input"):
-                st.session_state[k] = ""
-            st.experimental_rerun()
+        st.button("Clear Form", on_click=clear_job_form)
+
+        enrichment_status()
+        stats = get_enrichment_workers().stats(username)["last"]
+        if stats and stats["cached"]:
+            cache_stats = get_llm_cache().stats()
+            saved = (
+                f", saving {stats['saved_s']:.1f}s and {stats['saved_tokens']} tokens measured on its first call"
+                if "saved_s" in stats else ""
+            )
+            st.caption(
+                f"Last job enriched from cache in {stats['latency_s'] * 1000:.0f}ms, no tokens used{saved} "
+                f"(cache hit rate {cache_stats['hit_rate']:.0%})"
+            )
+        elif stats and stats["fallback"]:
+            st.caption(f"Last job enriched with per-field calls in {stats['latency_s']:.1f}s")
+        elif stats:
+            st.caption(
+                f"Last job enriched in one call: {stats['latency_s']:.1f}s, "
+                f"{stats['prompt_tokens']}+{stats['completion_tokens']} tokens"
+            )
+        if stats and stats.get("company_tier") not in (None, "llm", "unknown"):
+            st.caption(f"Company taken from {stats['company_tier'].replace('_', ' ')} without asking the model")
+        if stats and stats.get("trim", {}).get("saved_tokens"):
+            trim = stats["trim"]
+            st.caption(
+                f"Description trimmed from ~{trim['tokens_before']} to ~{trim['tokens_after']} tokens"
+                + (" (cut to budget)" if trim["truncated"] else "")
+                + (f", an estimated ~{stats['est_trim_saved_s']:.1f}s saved" if "est_trim_saved_s" in stats else "")
+            )
 
         # Handle submission
         if submitted:
             if job_link and job_description:
-                company        = extract_company_name(job_link, job_description)
-                skills_list, skills_detail = extract_skills_with_openai(job_description)
-                timestamp      = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                row = {
-                    "Timestamp": timestamp,
-                    "Job Link": job_link,
-                    "Company": company,
-                    "Job Description": job_description,
-                    "Top Skills List": skills_list,
-                    "Detailed Skills Summary": skills_detail
-                }
-                append_job_row(username, row)
-                st.success("Job added successfully!")
-
-                # clear after submit
-                st.session_state["job_link_input"] = ""
-                st.session_state["job_desc_input"] = ""
-                st.experimental_rerun()
+                # Duplicate check happens before any API call is made
+                dup = check_duplicate(username, job_link, job_description)
+                if dup:
+                    st.session_state.duplicate_submission = {
+                        "link": job_link, "description": job_description, "dup": dup
+                    }
+                else:
+                    add_job(username, job_link, job_description)
             else:
                 st.warning("Please enter both job link and description.")
 
-        # --- Data Tab ---
-        with tab2:
-            st.markdown("## Job Tracker Data")
-            df = fetch_job_df(username)
+        pending_dup = st.session_state.get("duplicate_submission")
+        if pending_dup:
+            match = pending_dup["dup"]["match"]
+            why = (
+                "same job link" if pending_dup["dup"]["kind"] == "link"
+                else f"near-identical description, {pending_dup['dup']['distance']} bits apart"
+            )
+            st.warning(f"This looks like a job you already track: {match['Company']} added {match['Timestamp']} ({why}).")
+            col_add, col_keep = st.columns(2)
+            if col_add.button("Add anyway"):
+                st.session_state.duplicate_submission = None
+                add_job(username, pending_dup["link"], pending_dup["description"])
+            if col_keep.button("Keep existing"):
+                st.session_state.duplicate_submission = None
+                st.rerun()
+
+        # --- Bulk import ---
+        with st.expander("Bulk import"):
+            st.caption(
+                "Upload a CSV/JSONL with Job Link and Job Description columns (optional Timestamp), "
+                "or paste several postings separated by a line with ---."
+            )
+            upload = st.file_uploader("Postings file", type=["csv", "jsonl"], key="bulk_upload")
+            pasted = st.text_area("Or paste postings", height=200, key="bulk_pasted")
+            concurrency = st.slider(
+                "Parallel enrichments", 1, 16, value=st.secrets.get("BULK_CONCURRENCY", 4)
+            )
+            if st.button("Import Jobs"):
+                postings = parse_upload(upload.name, upload.getvalue()) if upload else []
+                postings += parse_pasted(pasted)
+                for i, p in enumerate(postings):
+                    p["Row"] = i + 1
+                # Drop postings already tracked (or repeated within the upload) before enrichment
+                postings, dups = get_dedup().split_batch(
+                    username, fetch_job_df(username), lambda keys: load_descriptions(username, keys), postings
+                )
+                dup_errors = [
+                    {"Row": i + 1, "Job Link": hit["match"]["Job Link"],
+                     "Error": f"duplicate of {hit['match']['Company']} ({hit['match']['Timestamp']}, {hit['kind']})"}
+                    for i, hit in dups
+                ]
+                if not postings:
+                    st.warning("Nothing new to import.")
+                    if dup_errors:
+                        st.dataframe(pd.DataFrame(dup_errors), use_container_width=True)
+                else:
+                    progress = st.progress(0.0, text=f"Enriching 0/{len(postings)}")
+                    written, errors = run_import(
+                        postings,
+                        lambda link, desc: enrich_job(
+                            client, link, desc, cache=get_llm_cache(), strict=True,
+                            budget=st.secrets.get("PROMPT_TOKEN_BUDGET", 1500)
+                        ),
+                        lambda rows: append_job_rows(username, rows),
+                        concurrency=concurrency,
+                        on_progress=lambda done, total: progress.progress(
+                            done / total, text=f"Enriching {done}/{total}"
+                        ),
+                    )
+                    errors = sorted(errors + dup_errors, key=lambda e: e["Row"])
+                    st.success(f"Imported {written} of {len(postings) + len(dups)} jobs.")
+                    if errors:
+                        st.error(f"{len(errors)} postings failed:")
+                        st.dataframe(pd.DataFrame(errors), use_container_width=True)
+
+    # --- Data Tab ---
+    elif view == "Data":
+        st.markdown("## Job Tracker Data")
+        # Only the shards that overlap the slider window are read
+        days = st.session_state.get("num_days_slider", 30)
+        df = fetch_job_df(username, since=datetime.now() - pd.Timedelta(days=days) if days > 0 else None)
+
+        if df.empty:
+            st.info("No job data found. Add a job in the \"Add Job\" tab.")
+        else:
+            # Initialize filter defaults
+            if "company_filter" not in st.session_state:
+                st.session_state.company_filter = ""
+            if "keyword_filter" not in st.session_state:
+                st.session_state.keyword_filter = ""
+            if "num_days_slider" not in st.session_state:
+                st.session_state.num_days_slider = 30
+
+            # Sidebar filter form
+            with st.sidebar:
+                st.markdown("### Filters")
+                with st.form("filter_form"):
+                    company_filter = st.text_input(
+                        "Filter by Company",
+                        value=st.session_state.company_filter
+                    )
+                    keyword_filter = st.text_input(
+                        "Search Keywords",
+                        value=st.session_state.keyword_filter
+                    )
+                    num_days = st.slider(
+                        "Show jobs from last N days",
+                        0, 60,
+                        value=st.session_state.num_days_slider,
+                        key="num_days_slider"
+                    )
+                    apply = st.form_submit_button("Apply Filters")
+                    reset = st.form_submit_button("Reset Filters")
+
+                    if reset:
+                        st.session_state.company_filter = ""
+                        st.session_state.keyword_filter = ""
+                        st.session_state.num_days_slider = 30
+                        st.experimental_rerun()
+                    if apply:
+                        st.session_state.company_filter = company_filter
+                        st.session_state.keyword_filter = keyword_filter
+
+            filtered = filter_jobs(
+                username, df,
+                st.session_state.company_filter,
+                st.session_state.keyword_filter,
+                st.session_state.num_days_slider,
+            )
 
-            if df.empty:
-                st.info("No job data found. Add a job in the \"Add Job\" tab.")
-            else:
-                # Ensure Timestamp is datetime
-                df["Timestamp"] = pd.to_datetime(df["Timestamp"])
-
-                # Initialize filter defaults
-                if "company_filter" not in st.session_state:
-                    st.session_state.company_filter = ""
-                if "keyword_filter" not in st.session_state:
-                    st.session_state.keyword_filter = ""
-                if "num_days_slider" not in st.session_state:
-                    st.session_state.num_days_slider = 30
-
-                # Sidebar filter form
-                with st.sidebar:
-                    st.markdown("### Filters")
-                    with st.form("filter_form"):
-                        company_filter = st.text_input(
-                            "Filter by Company",
-                            value=st.session_state.company_filter
-                        )
-                        keyword_filter = st.text_input(
-                            "Search Keywords",
-                            value=st.session_state.keyword_filter
-                        )
-                        num_days = st.slider(
-                            "Show jobs from last N days",
-                            0, 60,
-                            value=st.session_state.num_days_slider,
-                            key="num_days_slider"
+            # Sort, then page: only the visible slice is sent to the browser
+            st.markdown(f"### Showing {len(filtered)} jobs")
+            sort_options = ["Newest first", "Oldest first", "Company"]
+            if st.session_state.keyword_filter:
+                sort_options.insert(0, "Relevance")
+            order = st.selectbox("Sort by", sort_options, key="data_sort")
+            if order == "Newest first":
+                filtered = stable_sort(filtered, "Timestamp", ascending=False)
+            elif order == "Oldest first":
+                filtered = stable_sort(filtered, "Timestamp", ascending=True)
+            elif order == "Company":
+                filtered = stable_sort(filtered, "Company", ascending=True)
+            visible = pager(
+                "data", filtered,
+                date_column="Timestamp" if order in ("Newest first", "Oldest first") else None,
+                ascending=order == "Oldest first",
+            )
+            grid = visible.drop(columns=["Row Key"])
+            # Outreach per visible job: one hash lookup per row against the contacts index
+            joins = get_join_index().get(username, contacts_df=fetch_contacts_df(username))
+            outreach = [joins.contacts_for_job(link, company)
+                        for link, company in zip(visible["Job Link"], visible["Company"])]
+            grid["Contacts"] = [count for count, _, _ in outreach]
+            grid["Last Contacted"] = [str(last or "")[:10] for _, last, _ in outreach]
+            st.dataframe(grid, use_container_width=True, height=400)
+
+            # Descriptions and summaries are only loaded for the job being looked at
+            if len(visible):
+                pick = st.selectbox(
+                    "Job details",
+                    [None] + list(range(len(visible))),
+                    format_func=lambda i: "Select a job…" if i is None else
+                    f"{visible['Company'].iloc[i]} ({str(visible['Timestamp'].iloc[i])[:10]})",
+                )
+            if len(visible) and pick is not None:
+                key, ts = int(visible["Row Key"].iloc[pick]), visible["Timestamp"].iloc[pick]
+                description = get_description_store().get(username, key)
+                with st.expander("Job Description", expanded=True):
+                    st.markdown(f"**Job Link:** [Link]({visible['Job Link'].iloc[pick]})")
+                    summary_box = st.empty()
+                    summary = load_summary(username, key, ts)
+                    if summary:
+                        summary_box.markdown(f"**Skills Summary:** {summary}")
+                    elif visible["Top Skills List"].iloc[pick] != ENRICHING:
+                        # First time this job is opened: write the summary now
+                        try:
+                            generate_summary(username, key, ts, description, summary_box)
+                        except Exception as e:
+                            summary_box.warning(f"Could not generate the skills summary: {e}")
+                    st.write(description)
+                if st.checkbox("Show similar jobs", key="show_similar"):
+                    similar = similar_jobs(username, visible["Row Key"].iloc[pick])
+                    if similar.empty:
+                        st.caption("No similar jobs found yet.")
+                    else:
+                        st.dataframe(
+                            similar[["Similarity", "Timestamp", "Company", "Top Skills List", "Job Link"]],
+                            use_container_width=True,
                         )
-                        apply = st.form_submit_button("Apply Filters")
-                        reset = st.form_submit_button("Reset Filters")
-
-                        if reset:
-                            st.session_state.company_filter = ""
-                            st.session_state.keyword_filter = ""
-                            st.session_state.num_days_slider = 30
-                            st.experimental_rerun()
-                        if apply:
-                            st.session_state.company_filter = company_filter
-                            st.session_state.keyword_filter = keyword_filter
-
-                # Apply filters
-                filtered = df
-                if st.session_state.company_filter:
-                    filtered = filtered[
-                        filtered["Company"]
-                                .str.contains(st.session_state.company_filter, case=False, na=False)
-                    ]
-                if st.session_state.keyword_filter:
-                    filtered = filtered[
-                        filtered["Top Skills List"].str.contains(st.session_state.keyword_filter, case=False, na=False)
-                    | filtered["Detailed Skills Summary"].str.contains(st.session_state.keyword_filter, case=False, na=False)
-                    | filtered["Job Description"].str.contains(st.session_state.keyword_filter, case=False, na=False)
-                    ]
-                if st.session_state.num_days_slider > 0:
-                    cutoff = pd.Timestamp.now() - pd.Timedelta(days=st.session_state.num_days_slider)
-                    filtered = filtered[filtered["Timestamp"] >= cutoff]
-
-                # Show table & download
-                st.markdown(f"### Showing {len(filtered)} jobs")
-                st.dataframe(filtered, use_container_width=True, height=400)
-                csv = filtered.to_csv(index=False)
+
+            with st.expander("Find duplicates"):
+                st.caption("Scans your whole history for repeated links and near-identical descriptions.")
+                if st.button("Scan for duplicates"):
+                    dups = find_duplicates(
+                        fetch_job_df(username), lambda keys: load_descriptions(username, keys)
+                    )
+                    if dups:
+                        st.dataframe(pd.DataFrame(dups).drop(columns=["Row Key"]), use_container_width=True)
+                    else:
+                        st.success("No duplicates found.")
+
+            # The full filtered CSV is only built when asked for
+            if st.checkbox("Prepare CSV download"):
+                export = filtered
+                if st.checkbox("Include job descriptions in CSV"):
+                    export = attach_descriptions(filtered, get_description_store(), username)
+                csv = export.drop(columns=["Row Key"]).to_csv(index=False)
                 st.download_button("Download Filtered CSV", csv, "filtered_jobs.csv", "text/csv")
 
     # --- Dashboard Tab ---
-    with tab_dashboard:
+    elif view == "Dashboard":
         st.markdown("## Job Insights Dashboard")
 
-        # 1) Fetch & prepare data
+        # 1) Fetch data; aggregates only fold in rows added since the last render
         df = fetch_job_df(username)
         if df.empty or "Timestamp" not in df.columns:
             st.info("No job data to show. Add a job in the \"Add Job\" tab first.")
-
-        df["Timestamp"] = pd.to_datetime(df["Timestamp"])
-        df["Date"] = df["Timestamp"].dt.date
+        with span("dashboard.aggregate"):
+            agg = get_aggregates().get(username, df)
 
         # 2) Summary metrics
-        today = datetime.now()
-        last_day   = df[df['Timestamp'] >= today - timedelta(days=1)]
-        last_week  = df[df['Timestamp'] >= today - timedelta(days=7)]
-        last_month = df[df['Timestamp'] >= today - timedelta(days=30)]
+        windows = agg.window_counts((1, 7, 30))
         col1, col2, col3 = st.columns(3)
-        col1.metric("Last 1 Day",   f"{len(last_day)}")
-        col2.metric("Last 7 Days",  f"{len(last_week)}")
-        col3.metric("Last 30 Days", f"{len(last_month)}")
+        col1.metric("Last 1 Day",   f"{windows[1]}")
+        col2.metric("Last 7 Days",  f"{windows[7]}")
+        col3.metric("Last 30 Days", f"{windows[30]}")
         st.markdown("---")
 
         # 3) Jobs Over Time (line chart)
         st.subheader("Jobs Over Time")
-        jobs_per_day = df['Date'].value_counts().sort_index()
-        st.line_chart(jobs_per_day)
+        st.line_chart(agg.jobs_per_day())
 
         # 4) Top Companies (bar chart)
         st.subheader("Top Companies Applied To")
-        company_counts = df['Company'].value_counts().head(10)
-        st.bar_chart(company_counts)
+        st.bar_chart(agg.top_companies(10))
 
         # 5) Skill Word Cloud
         st.subheader("Skill Word Cloud")
-        # Prepare skill frequencies
-        all_skills = (
-            df['Top Skills List']
-            .dropna()
-            .str.split(',')
-            .explode()
-            .str.strip()
-        )
-        skill_freq = all_skills.value_counts().to_dict()
-        # Generate & display word cloud
-        from wordcloud import WordCloud
-        import matplotlib.pyplot as plt
-        wc = WordCloud(width=600, height=300, background_color="white").generate_from_frequencies(skill_freq)
-        fig, ax = plt.subplots(figsize=(8, 4))
-        ax.imshow(wc, interpolation="bilinear")
-        ax.axis("off")
-        st.pyplot(fig)
+        skill_freq = agg.skill_freq()
+        # Rendered off-thread and cached by frequency table; a stale image shows while refreshing
+        if not skill_freq:
+            st.info("No skills to show yet.")
+        else:
+            png, fresh = get_wordcloud_cache().get(username, skill_freq, wait=True)
+            if not fresh:
+                st.caption("Updating word cloud…")
+            st.image(png, use_container_width=True)
 
     # --- Networking Tab ---
-    with tab4:
+    elif view == "Networking":
         st.markdown("## People You’ve Reached Out To")
 
         show_form = st.toggle("Add New Contact", value=False)
@@ -410,8 +881,76 @@ else:
         if contacts_df.empty:
             st.info("You haven’t logged any contacts yet.")
         else:
-            for _, row in contacts_df.sort_values("Timestamp", ascending=False).iterrows():
+            contacts_df = stable_sort(contacts_df, "Timestamp", ascending=False)
+            st.caption(f"{len(contacts_df)} contacts")
+            # One expander per visible contact only
+            visible = pager("contacts", contacts_df, date_column="Timestamp", ascending=False)
+            joins = get_join_index().get(username, jobs_df=fetch_job_df(username))
+            for _, row in visible.iterrows():
                 with st.expander(f"{row['Job Role']} @ {row['Company']}"):
                     st.markdown(f"**People Contacted:** {row['People Contacted']}")
                     st.markdown(f"**Job Link:** [Link]({row['Job Link']})")
+                    applied, matched_on = joins.applied_on(row["Job Link"], row["Company"])
+                    if applied is not None:
+                        st.markdown(
+                            f"**Applied on:** {str(applied)[:10]}"
+                            + (" (matched by company)" if matched_on == "company" else "")
+                        )
                     st.caption(f"Logged on {row['Timestamp']}")
+
+    elif view == "Ops":
+        st.markdown("## Operations")
+        st.caption("Latency per operation over the last few thousand calls in this process.")
+        ops = SPANS.stats()
+        if not ops:
+            st.info("No operations recorded yet.")
+        else:
+            st.dataframe(pd.DataFrame([
+                {
+                    "Operation": name,
+                    "Calls": o["calls"],
+                    "Errors": o["errors"],
+                    "p50 (ms)": round(o["p50_s"] * 1000, 1),
+                    "p95 (ms)": round(o["p95_s"] * 1000, 1),
+                    "Max (ms)": round(o["max_s"] * 1000, 1),
+                    "Prompt tokens": o.get("tokens", {}).get("prompt"),
+                    "Completion tokens": o.get("tokens", {}).get("completion"),
+                }
+                for name, o in ops.items()
+            ]), use_container_width=True)
+            quota = get_sheet_pool().governor.stats()
+            st.markdown("### Sheets quota governor")
+            cols = st.columns(5)
+            cols[0].metric("Queue depth", quota["queue_depth"])
+            cols[1].metric("Throttled", quota["throttled"], help=f"{quota['throttle_wait_s']}s spent waiting")
+            cols[2].metric("Coalesced reads", quota["coalesced"])
+            cols[3].metric("Retries", quota["retries"])
+            cols[4].metric("Failures", quota["failures"], help=f"{quota['calls']} requests sent")
+
+            tiers = COMPANY_TIERS.snapshot()
+            if tiers["total"]:
+                st.markdown("### Company extraction")
+                st.caption(
+                    f"{tiers['llm_avoided']} of {tiers['total']} company names came from rules "
+                    "instead of the model"
+                )
+                st.dataframe(pd.DataFrame([
+                    {"Tier": tier, "Hits": t["hits"], "Hit rate": f"{t['rate']:.0%}"}
+                    for tier, t in tiers["tiers"].items()
+                ]), use_container_width=True)
+            col_json, col_prom = st.columns(2)
+            col_json.download_button("Export JSON", SPANS.to_json(), "ops_metrics.json", "application/json")
+            col_prom.download_button("Export Prometheus", SPANS.to_prometheus(), "ops_metrics.prom", "text/plain")
+
+    # Per-interaction timing for the view that actually ran
+    SPANS.record(f"view.{view}", time.perf_counter() - view_started)
+    trace = end_trace()
+    timings = st.session_state.setdefault("view_timings", {})
+    timings[view] = time.perf_counter() - view_started
+    st.sidebar.caption(
+        "Render time: " + ", ".join(f"{v} {t * 1000:.0f} ms" for v, t in timings.items())
+    )
+    if is_admin and trace:
+        with st.sidebar.expander("This rerun"):
+            for name, duration in trace:
+                st.caption(f"{name}: {duration * 1000:.0f} ms")
@@ -0,0 +1,175 @@
+"""
+Re-enrich job rows whose company or skills extraction failed or is out of date.
+
+Scans a user's job worksheets for rows with "Error: ..." skills, an
+"Unknown" company, a leftover "Enriching…" placeholder or (with
+--stale-before) rows enriched before a prompt change. They are re-enriched
+on a bounded pool, and the fixes are written back with one batch_update
+per --batch-size rows. Finished rows are recorded in a checkpoint file,
+so an interrupted run picks up where it stopped.
+
+    python backfill.py --user alice --dry-run
+    python backfill.py --user alice --concurrency 4 --stale-before 2024-06-01
+
+Credentials come from .streamlit/secrets.toml, like the app. A running app
+shows the patched cells once its cached snapshot of the shard is evicted
+(idle timeout) or the app restarts.
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import streamlit as st
+from openai import OpenAI
+
+from enrich_workers import ENRICHING
+from enrichment import PROMPT_VERSION, enrich_job
+from job_frame import row_key
+from llm_cache import LLMCache
+from retry import with_backoff
+from schema import JOB_HEADER
+from shards import ArchiveCache, parse_shards
+from sheets import SheetPool
+
+
+def needs_backfill(row, stale_before=None):
+    """Why a padded job row needs re-enrichment, or None."""
+    ts, _, company, _, skills, detail = row
+    if skills.startswith("Error:") or detail.startswith("Error:"):
+        return "error"
+    if ENRICHING in (company, skills, detail):
+        return "placeholder"
+    if company.strip() in ("", "Unknown"):
+        return "unknown"
+    if stale_before and ts[:10] < stale_before:
+        return "outdated"
+    return None
+
+
+class Checkpoint:
+    """Row ids already fixed by this backfill, rewritten atomically after each batch."""
+
+    def __init__(self, path, prompt_version):
+        self.path = path
+        self.done = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            # A prompt change invalidates what an earlier run considered done
+            if data.get("prompt_version") == prompt_version:
+                self.done = set(data.get("done", []))
+        self.prompt_version = prompt_version
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"prompt_version": self.prompt_version, "done": sorted(self.done)}, f)
+        os.replace(tmp, self.path)
+
+
+def scan(pool, username, stale_before=None):
+    """[(title, sheet row number, row id, reason, padded row)] across the user's job shards."""
+    found = []
+    for shard in parse_shards(username, pool.titles()):
+        rows = pool.rows_from(username, shard.title, JOB_HEADER, 2)
+        for i, raw in enumerate(rows):
+            row = [str(v) for v in list(raw[:6]) + [""] * (6 - len(raw[:6]))]
+            reason = needs_backfill(row, stale_before)
+            if reason:
+                found.append((shard.title, i + 2, f"{shard.title}:{row_key(row[0], row[1], row[3])}", reason, row))
+    return found
+
+
+def write_batch(pool, username, title, fixes):
+    """
+    One batch_update for many (row number, padded row, result) fixes: Company
+    in C, skills in E. A broken summary in F is cleared so the app writes a
+    new one the next time the job is opened; good summaries are kept.
+    """
+    data = []
+    for n, row, result in fixes:
+        data.append({"range": f"C{n}", "values": [[result["company"]]]})
+        if row[5].startswith("Error:") or row[5] == ENRICHING:
+            data.append({"range": f"E{n}:F{n}", "values": [[result["skills_list"], ""]]})
+        else:
+            data.append({"range": f"E{n}", "values": [[result["skills_list"]]]})
+    pool.call(username, title, JOB_HEADER, lambda ws: ws.batch_update(data))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--user", required=True)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=50, help="rows per batch_update")
+    parser.add_argument("--stale-before", help="also redo rows added before this date (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, help="stop after this many rows")
+    parser.add_argument("--checkpoint", help="default: data/backfill_<user>.json")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be redone")
+    args = parser.parse_args()
+
+    pool = SheetPool(st.secrets["GCP_SA_B64"], st.secrets["GSHEET_ID"])
+    checkpoint = Checkpoint(
+        args.checkpoint or os.path.join("data", f"backfill_{args.user}.json"), PROMPT_VERSION
+    )
+    todo = [c for c in scan(pool, args.user, args.stale_before) if c[2] not in checkpoint.done]
+    todo = todo[:args.limit] if args.limit else todo
+    reasons = {}
+    for c in todo:
+        reasons[c[3]] = reasons.get(c[3], 0) + 1
+    print(f"{len(todo)} rows to re-enrich {reasons} ({len(checkpoint.done)} already done)")
+    if args.dry_run or not todo:
+        return
+
+    client = OpenAI(api_key=st.secrets["OPENAI_API_KEY"])
+    cache = LLMCache(st.secrets.get("LLM_CACHE_PATH", os.path.join("data", "llm_cache.sqlite3")))
+    budget = st.secrets.get("PROMPT_TOKEN_BUDGET", 1500)
+    archives = ArchiveCache(st.secrets.get("ARCHIVE_DIR", os.path.join("data", "archive")))
+
+    def work(candidate):
+        _, _, _, _, row = candidate
+        return with_backoff(
+            lambda: enrich_job(client, row[1], row[3], cache=cache, strict=True, budget=budget)
+        )
+
+    pending = {}  # title -> [(row number, row id, padded row, result)]
+    fixed = failed = 0
+
+    def flush(title):
+        nonlocal fixed
+        batch = pending.pop(title, [])
+        if not batch:
+            return
+        write_batch(pool, args.user, title, [(n, row, result) for n, _, row, result in batch])
+        archives.drop(title)
+        checkpoint.done.update(rid for _, rid, _, _ in batch)
+        checkpoint.save()
+        fixed += len(batch)
+        print(f"  wrote {len(batch)} rows to {title} ({fixed}/{len(todo)})")
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = {executor.submit(work, c): c for c in todo}
+        for future in as_completed(futures):
+            title, n, rid, _, row = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"  failed {row[1]}: {e}", file=sys.stderr)
+                continue
+            if result["skills_list"].startswith("Error:"):
+                failed += 1
+                print(f"  failed {row[1]}: {result['skills_list']}", file=sys.stderr)
+                continue
+            pending.setdefault(title, []).append((n, rid, row, result))
+            if len(pending[title]) >= args.batch_size:
+                flush(title)
+    for title in list(pending):
+        flush(title)
+    print(f"Done: {fixed} rows fixed, {failed} failed (rerun to retry them)")
+
+
+if __name__ == "__main__":
+    main()
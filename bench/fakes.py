@@ -0,0 +1,175 @@
+"""
+In-process stand-ins for the gspread worksheet API and the OpenAI chat client.
+
+Both count every call, can add a fixed latency per call and can fail a
+fraction of calls, so benchmarks run offline and deterministically.
+"""
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import gspread
+
+
+class FakeAPIError(Exception):
+    """Looks enough like gspread/OpenAI errors for the retry helpers (status_code=429)."""
+
+    def __init__(self, message="injected failure", status_code=429):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code)
+
+
+class Faults:
+    def __init__(self, latency=0.0, failure_rate=0.0, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def hit(self, name):
+        with self._lock:
+            self.calls[name] += 1
+            fail = self._rng.random() < self.failure_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise FakeAPIError(f"injected failure in {name}")
+
+
+class FakeWorksheet:
+    def __init__(self, title, faults, rows=None):
+        self.title = title
+        self.faults = faults
+        self.rows = [list(r) for r in rows or []]
+
+    def append_row(self, values, **kwargs):
+        self.faults.hit("append_row")
+        self.rows.append(list(values))
+
+    def append_rows(self, values, **kwargs):
+        self.faults.hit("append_rows")
+        self.rows.extend(list(v) for v in values)
+
+    def get_all_records(self, **kwargs):
+        self.faults.hit("get_all_records")
+        if not self.rows:
+            return []
+        header = self.rows[0]
+        return [dict(zip(header, r)) for r in self.rows[1:]]
+
+    def get_values(self, range_name=None, **kwargs):
+        """Supports "A2:F" (to the last row), "A2:B5" and single cells like "F7"."""
+        self.faults.hit("get_values")
+        m = re.match(r"([A-Z]+)(\d+)(?::([A-Z]+)(\d+)?)?$", range_name or "")
+        if not m:
+            return [list(r) for r in self.rows]
+        col = lambda letters: gspread.utils.a1_to_rowcol(f"{letters}1")[1]
+        first, start = col(m.group(1)), int(m.group(2))
+        last = col(m.group(3)) if m.group(3) else first
+        if m.group(3) and not m.group(4):
+            end = len(self.rows)
+        else:
+            end = int(m.group(4) or start)
+        return [list(r[first - 1:last]) for r in self.rows[start - 1:end]]
+
+    def batch_update(self, data, **kwargs):
+        self.faults.hit("batch_update")
+        for item in data:
+            m = re.match(r"([A-Z]+)(\d+)", item["range"])
+            col = gspread.utils.a1_to_rowcol(f"{m.group(1)}1")[1]
+            row = int(m.group(2))
+            for r_off, values in enumerate(item["values"]):
+                target = self.rows[row - 1 + r_off]
+                for c_off, v in enumerate(values):
+                    idx = col - 1 + c_off
+                    target.extend([""] * (idx + 1 - len(target)))
+                    target[idx] = v
+
+
+class FakeSpreadsheet:
+    def __init__(self, faults):
+        self.faults = faults
+        self.sheets = {}
+
+    def worksheet(self, title):
+        self.faults.hit("worksheet")
+        if title not in self.sheets:
+            raise gspread.WorksheetNotFound(title)
+        return self.sheets[title]
+
+    def add_worksheet(self, title, rows=None, cols=None, **kwargs):
+        self.faults.hit("add_worksheet")
+        ws = FakeWorksheet(title, self.faults)
+        self.sheets[title] = ws
+        return ws
+
+    def worksheets(self):
+        self.faults.hit("worksheets")
+        return list(self.sheets.values())
+
+    def del_worksheet(self, ws):
+        self.faults.hit("del_worksheet")
+        self.sheets.pop(ws.title, None)
+
+    def seed(self, title, header, rows):
+        self.sheets[title] = FakeWorksheet(title, self.faults, [header] + list(rows))
+
+
+class FakeGspreadClient:
+    def __init__(self, faults, spreadsheet=None):
+        self.faults = faults
+        self.spreadsheet = spreadsheet or FakeSpreadsheet(faults)
+
+    def open_by_key(self, key):
+        self.faults.hit("open_by_key")
+        return self.spreadsheet
+
+
+class FakeCredentials:
+    valid = True
+
+    def refresh(self, request):
+        pass
+
+
+class FakeOpenAI:
+    """Answers the app's prompts with canned but well-formed content."""
+
+    def __init__(self, faults, prompt_tokens_per_char=0.25, **kwargs):
+        self.faults = faults
+        self.ratio = prompt_tokens_per_char
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, model, messages, response_format=None, stream=False, **kwargs):
+        self.faults.hit("chat.completions.create")
+        prompt_chars = sum(len(m["content"]) for m in messages)
+        if response_format and response_format.get("type") == "json_object":
+            content = json.dumps({
+                "company": "Acme",
+                "skills": ["Python", "SQL", "Pandas", "AWS", "Communication"],
+            })
+        elif "top 5 skills" in messages[0]["content"].lower() and "comma" in messages[0]["content"].lower():
+            content = "Python, SQL, Pandas, AWS, Communication"
+        elif "structured fields" in messages[0]["content"]:
+            content = "Acme"
+        else:
+            content = "The role needs Python, SQL, Pandas, AWS and communication skills."
+        usage = SimpleNamespace(prompt_tokens=int(prompt_chars * self.ratio), completion_tokens=len(content) // 4)
+        if stream:
+            words = content.split(" ")
+            return iter(
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(
+                    content=w + ("" if i == len(words) - 1 else " ")
+                ))])
+                for i, w in enumerate(words)
+            )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=usage,
+        )
@@ -0,0 +1,226 @@
+"""
+Offline benchmark harness for the tracker.
+
+Runs app.py under streamlit's AppTest with gspread and OpenAI replaced by
+the in-process fakes in bench/fakes.py, seeded with synthetic data, and
+also times the data layer (snapshot, compact frame, index, aggregates)
+directly. Output is JSON so runs can be diffed between commits:
+
+    python -m bench.harness --sizes 100,10000,100000 --latency 0.05 --out before.json
+    python -m bench.harness --sizes 100,10000,100000 --latency 0.05 --out after.json
+    python -m bench.harness --compare before.json after.json
+"""
+import argparse
+import base64
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+from bench.fakes import Faults, FakeCredentials, FakeGspreadClient, FakeOpenAI, FakeWorksheet
+from bench.synthetic import make_contacts, make_jobs
+from schema import CONTACT_HEADER, JOB_FRAME_HEADER, JOB_FRAME_WIDTH, JOB_HEADER
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VIEWS = ["Add Job", "Data", "Dashboard", "Networking"]
+USER = "bench"
+
+
+@contextlib.contextmanager
+def fake_backends(faults, gclient):
+    """Route the app's gspread and OpenAI construction to the fakes."""
+    import openai
+    import sheets
+
+    with mock.patch.object(sheets.gspread, "authorize", lambda creds: gclient), \
+         mock.patch.object(sheets.Credentials, "from_service_account_info",
+                           lambda info, scopes=None: FakeCredentials()), \
+         mock.patch.object(openai, "OpenAI", lambda **kw: FakeOpenAI(faults)):
+        yield
+
+
+def timed(fn):
+    started = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - started, out
+
+
+def summarize(samples):
+    return {
+        "cold_s": round(samples[0], 4),
+        "warm_median_s": round(statistics.median(samples[1:]), 4) if len(samples) > 1 else None,
+        "warm_max_s": round(max(samples[1:]), 4) if len(samples) > 1 else None,
+    }
+
+
+def bench_app(n_jobs, n_contacts, repeat, faults, tmp):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    st.cache_resource.clear()
+    gclient = FakeGspreadClient(faults)
+    gclient.spreadsheet.seed(USER, JOB_HEADER, make_jobs(n_jobs))
+    gclient.spreadsheet.seed(f"contacts_{USER}", CONTACT_HEADER, make_contacts(n_contacts))
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=3600)
+    at.secrets["OPENAI_API_KEY"] = "bench"
+    at.secrets["APP_PASSWORD"] = "bench"
+    at.secrets["GCP_SA_B64"] = base64.b64encode(b"{}").decode()
+    at.secrets["GSHEET_ID"] = "bench"
+    for name in ("WRITE_JOURNAL", "LLM_CACHE_PATH", "DESCRIPTION_STORE_PATH", "ARCHIVE_DIR", "VECTOR_DIR",
+                 "ENRICH_JOURNAL"):
+        at.secrets[name] = os.path.join(tmp, name.lower())
+    # Fake Sheets have no quota; keep the governor from pacing the benchmark
+    at.secrets["SHEETS_READS_PER_MIN"] = at.secrets["SHEETS_WRITES_PER_MIN"] = 10 ** 6
+    at.session_state["authenticated"] = True
+    at.session_state["username"] = USER
+
+    report = {"views": {}, "errors": []}
+    with fake_backends(faults, gclient):
+        tracemalloc.start()
+        at.run()
+        for view in VIEWS:
+            samples = []
+            for _ in range(repeat):
+                calls_before = sum(faults.calls.values())
+                elapsed, _ = timed(lambda: at.radio(key="active_view").set_value(view).run())
+                samples.append(elapsed)
+                report["errors"] += [str(e.value) for e in at.exception]
+            report["views"][view] = summarize(samples)
+            report["views"][view]["api_calls_last_rerun"] = sum(faults.calls.values()) - calls_before
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    report["peak_mem_mb"] = round(peak / 1024 / 1024, 2)
+    return report
+
+
+def bench_data_layer(n_jobs, faults, tmp):
+    import gspread
+
+    from aggregates import JobAggregates
+    from job_frame import DescriptionStore, compact_job_frame
+    from search_index import JobIndex
+    from similar_jobs import VectorIndex
+    from snapshots import SnapshotStore
+
+    ws = FakeWorksheet(USER, faults, [JOB_HEADER] + make_jobs(n_jobs))
+    store = SnapshotStore(ttl=0)
+    descriptions = DescriptionStore(os.path.join(tmp, "bench_descriptions.sqlite3"))
+    build = lambda rows: compact_job_frame(rows, JOB_FRAME_HEADER, descriptions, USER)
+    # The same columns the app reads: everything up to, not including, the summary
+    last_col = gspread.utils.rowcol_to_a1(1, JOB_FRAME_WIDTH)[:-1]
+    fetch = lambda start: ws.get_values(f"A{start}:{last_col}")
+
+    tracemalloc.start()
+    report = {}
+    report["snapshot_full_s"], df = timed(
+        lambda: store.read(USER, USER, JOB_FRAME_HEADER, fetch, build)
+    )
+    ws.rows.append(make_jobs(1, seed=1)[0])
+    report["snapshot_incremental_s"], df = timed(
+        lambda: store.read(USER, USER, JOB_FRAME_HEADER, fetch, build)
+    )
+    index = JobIndex()
+    report["index_build_s"], _ = timed(
+        lambda: index.sync(df, lambda keys: descriptions.get_many(USER, keys))
+    )
+    report["index_query_s"], hits = timed(lambda: index.search("python sql"))
+    vectors = VectorIndex(os.path.join(tmp, "bench_vectors"), USER)
+    report["vectors_build_s"], _ = timed(
+        lambda: vectors.sync(df, lambda keys: descriptions.get_many(USER, keys))
+    )
+    first = int(df["Row Key"].iloc[0])
+    query = vectors.matrix[vectors.positions[first]]
+    report["similar_query_s"], _ = timed(lambda: vectors.top_k(query, 10, exclude=first))
+    aggs = JobAggregates()
+    report["aggregates_build_s"], _ = timed(lambda: aggs.sync(df))
+    report["aggregates_windows_s"], _ = timed(lambda: aggs.window_counts())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report = {k: round(v, 4) for k, v in report.items()}
+    report["frame_mb"] = round(df.memory_usage(deep=True).sum() / 1024 / 1024, 2)
+    report["peak_mem_mb"] = round(peak / 1024 / 1024, 2)
+    return report
+
+
+def git_rev():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        return None
+
+
+def compare(old_path, new_path):
+    """Print relative change for every numeric leaf present in both reports."""
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    def walk(a, b, path):
+        if isinstance(a, dict) and isinstance(b, dict):
+            for k in a:
+                if k in b:
+                    yield from walk(a[k], b[k], f"{path}.{k}" if path else k)
+        elif isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool):
+            change = (b - a) / a if a else None
+            yield {"metric": path, "old": a, "new": b, "change": round(change, 4) if change is not None else None}
+
+    print(json.dumps(list(walk(old["results"], new["results"], "")), indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--contacts-ratio", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every fake API call")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--modes", default="app,data")
+    parser.add_argument("--out")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    sys.path.insert(0, ROOT)
+    modes = args.modes.split(",")
+    results = {}
+    for size in (int(s) for s in args.sizes.split(",")):
+        entry = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            if "data" in modes:
+                faults = Faults(args.latency, args.failure_rate)
+                entry["data"] = bench_data_layer(size, faults, tmp)
+                entry["data"]["api_calls"] = dict(faults.calls)
+            if "app" in modes:
+                faults = Faults(args.latency, args.failure_rate)
+                entry["app"] = bench_app(size, int(size * args.contacts_ratio), args.repeat, faults, tmp)
+                entry["app"]["api_calls"] = dict(faults.calls)
+        results[str(size)] = entry
+
+    report = {
+        "commit": git_rev(),
+        "python": sys.version.split()[0],
+        "params": vars(args),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, default=str)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Memory of the job frame before and after the compact layout.
+
+    python -m bench.job_frame_memory --rows 50000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from bench.synthetic import make_jobs
+from job_frame import DescriptionStore, compact_job_frame
+from schema import JOB_FRAME_HEADER, JOB_FRAME_WIDTH, JOB_HEADER
+
+
+def mb(n):
+    return round(n / 1024 / 1024, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    rows = make_jobs(args.rows)
+
+    started = time.perf_counter()
+    # What fetch_job_df used to build: every column an object string, format-less parse
+    before = pd.DataFrame(rows, columns=JOB_HEADER)
+    before["Timestamp"] = pd.to_datetime(before["Timestamp"])
+    before_s = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = DescriptionStore(os.path.join(tmp, "descriptions.sqlite3"))
+        started = time.perf_counter()
+        # What the app builds now: the sheet is read only up to JOB_FRAME_WIDTH columns
+        after = compact_job_frame([r[:JOB_FRAME_WIDTH] for r in rows], JOB_FRAME_HEADER, store, "bench")
+        after_s = time.perf_counter() - started
+
+    report = {
+        "rows": args.rows,
+        "before_mb": mb(before.memory_usage(deep=True).sum()),
+        "after_mb": mb(after.memory_usage(deep=True).sum()),
+        "before_build_s": round(before_s, 3),
+        "after_build_s": round(after_s, 3),
+        "before_by_column_mb": {c: mb(v) for c, v in before.memory_usage(deep=True).items()},
+        "after_by_column_mb": {c: mb(v) for c, v in after.memory_usage(deep=True).items()},
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
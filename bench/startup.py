@@ -0,0 +1,84 @@
+"""
+Cold-start benchmark for app.py.
+
+Each measurement runs in a fresh interpreter so nothing is already in
+sys.modules. Reports per-module import time, time until the login screen
+has rendered, and which heavy modules were loaded by then.
+
+    python -m bench.startup --max-login-s 3
+
+Exits non-zero if the login screen takes longer than --max-login-s or pulls
+in any module from HEAVY_MODULES.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["pandas", "openai", "gspread", "google.oauth2", "wordcloud", "matplotlib"]
+
+IMPORT_PROBE = """
+import json, sys, time
+t = time.perf_counter()
+import {module}
+print(json.dumps(time.perf_counter() - t))
+"""
+
+LOGIN_PROBE = """
+import json, sys, time
+t = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=60)
+at.secrets["OPENAI_API_KEY"] = "bench"
+at.secrets["APP_PASSWORD"] = "bench"
+at.run()
+elapsed = time.perf_counter() - t
+heavy = json.loads(sys.argv[1])
+print(json.dumps({
+    "login_screen_s": elapsed,
+    "login_rendered": any(el.value == "Login" for el in at.title),
+    "heavy_loaded": [m for m in heavy if m in sys.modules],
+}))
+"""
+
+
+def probe(code, *args):
+    out = subprocess.run(
+        [sys.executable, "-c", code, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-login-s", type=float, default=None)
+    args = parser.parse_args()
+
+    imports = {}
+    for module in ["streamlit"] + HEAVY_MODULES:
+        try:
+            imports[module] = min(probe(IMPORT_PROBE.format(module=module)) for _ in range(args.repeat))
+        except subprocess.CalledProcessError:
+            imports[module] = None
+
+    logins = [probe(LOGIN_PROBE, json.dumps(HEAVY_MODULES)) for _ in range(args.repeat)]
+    report = {
+        "python": sys.version.split()[0],
+        "import_s": imports,
+        "login_screen_s": min(r["login_screen_s"] for r in logins),
+        "login_rendered": all(r["login_rendered"] for r in logins),
+        "heavy_loaded_before_login": sorted({m for r in logins for m in r["heavy_loaded"]}),
+    }
+    print(json.dumps(report, indent=2))
+
+    failed = report["heavy_loaded_before_login"] or not report["login_rendered"]
+    if args.max_login_s is not None and report["login_screen_s"] > args.max_login_s:
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
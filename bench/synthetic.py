@@ -0,0 +1,58 @@
+"""Synthetic job and contact rows shaped like the real worksheets."""
+import random
+from datetime import datetime, timedelta
+
+COMPANIES = [
+    "Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises",
+    "Wonka", "Tyrell", "Cyberdyne", "Soylent", "Aperture", "Black Mesa", "Vandelay", "Pied Piper",
+]
+SKILLS = [
+    "Python", "SQL", "Pandas", "Machine Learning", "AWS", "Docker", "Kubernetes", "Spark",
+    "Tableau", "Statistics", "Java", "Go", "React", "TypeScript", "Airflow", "dbt", "Excel",
+    "Communication", "A/B Testing", "PyTorch", "TensorFlow", "Snowflake", "GCP", "Azure",
+]
+WORDS = (
+    "we are looking for an experienced engineer to join our team you will build scalable "
+    "data pipelines collaborate with stakeholders and ship features to millions of users "
+    "requirements include strong communication skills and experience with cloud platforms "
+    "benefits include health insurance paid time off and a 401k match equal opportunity employer"
+).split()
+
+
+def make_jobs(n, seed=0, days=365, desc_words=400):
+    """Rows in JOB_HEADER order, oldest first, with timestamps spread over `days`."""
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=days)
+    step = days * 86400 / max(n, 1)
+    rows = []
+    for i in range(n):
+        ts = start + timedelta(seconds=i * step)
+        company = rng.choice(COMPANIES)
+        skills = rng.sample(SKILLS, 5)
+        rows.append([
+            ts.strftime("%Y-%m-%d %H:%M:%S"),
+            f"https://boards.greenhouse.io/{company.lower().replace(' ', '')}/jobs/{1000000 + i}",
+            company,
+            " ".join(rng.choice(WORDS) for _ in range(desc_words)),
+            ", ".join(skills),
+            "The role needs " + ", ".join(skills) + ". " + " ".join(rng.choice(WORDS) for _ in range(60)),
+        ])
+    return rows
+
+
+def make_contacts(n, seed=0, days=365):
+    """Rows in CONTACT_HEADER order."""
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=days)
+    step = days * 86400 / max(n, 1)
+    rows = []
+    for i in range(n):
+        company = rng.choice(COMPANIES)
+        rows.append([
+            (start + timedelta(seconds=i * step)).strftime("%Y-%m-%d %H:%M:%S"),
+            rng.choice(["Data Scientist", "Data Engineer", "ML Engineer", "Analyst"]),
+            company,
+            f"https://boards.greenhouse.io/{company.lower().replace(' ', '')}/jobs/{1000000 + rng.randrange(n or 1)}",
+            f"Recruiter {i}, Hiring Manager {i}",
+        ])
+    return rows
@@ -0,0 +1,126 @@
+import csv
+import io
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from retry import with_backoff
+
+LINK_COLUMNS = ("job link", "link", "url", "job url")
+DESC_COLUMNS = ("job description", "description", "desc")
+TIME_COLUMNS = ("timestamp", "date", "applied", "applied on")
+
+
+def _pick(record, names):
+    for k, v in record.items():
+        if k and k.strip().lower() in names and v not in (None, ""):
+            return str(v).strip()
+    return ""
+
+
+def normalize_timestamp(value):
+    """Rewrite an uploaded date in the app's "%Y-%m-%d %H:%M:%S" format when it can be read."""
+    if not value:
+        return ""
+    try:
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        pass
+    for fmt in ("%m/%d/%Y %H:%M:%S", "%m/%d/%Y %H:%M", "%m/%d/%Y", "%d %b %Y", "%b %d, %Y"):
+        try:
+            return datetime.strptime(value, fmt).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            continue
+    return value
+
+
+def _posting(record):
+    return {
+        "Job Link": _pick(record, LINK_COLUMNS),
+        "Job Description": _pick(record, DESC_COLUMNS),
+        "Timestamp": normalize_timestamp(_pick(record, TIME_COLUMNS)),
+    }
+
+
+def parse_upload(filename, data):
+    """Read postings from an uploaded CSV or JSONL file."""
+    text = data.decode("utf-8-sig")
+    if filename.lower().endswith((".jsonl", ".ndjson")):
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        records = list(csv.DictReader(io.StringIO(text)))
+    return [_posting(r) for r in records]
+
+
+def parse_pasted(text):
+    """
+    Split pasted postings on lines containing only '---'. A block whose first
+    line is a URL uses it as the job link.
+    """
+    postings = []
+    for block in re.split(r"(?m)^\s*-{3,}\s*$", text or ""):
+        lines = block.strip().splitlines()
+        if not lines:
+            continue
+        link = ""
+        if re.match(r"https?://\S+$", lines[0].strip()):
+            link = lines.pop(0).strip()
+        postings.append({"Job Link": link, "Job Description": "\n".join(lines).strip(), "Timestamp": ""})
+    return postings
+
+
+def run_import(postings, enrich_fn, write_rows, concurrency=4, batch_size=100, on_progress=None):
+    """
+    Enrich postings on a bounded worker pool and write them in batches.
+
+    `enrich_fn(link, description)` returns the enrichment dict from
+    enrich_job(..., strict=True); rate-limit and transient errors it raises
+    are retried by `with_backoff`.
+    `write_rows(rows)` receives completed row dicts `batch_size` at a time.
+    Returns (written_count, errors) where errors is a list of
+    {"Row", "Job Link", "Error"} dicts.
+    """
+    errors = []
+    ready = []
+    written = 0
+    done = 0
+
+    def work(posting):
+        if not posting["Job Description"]:
+            raise ValueError("missing job description")
+        enriched = with_backoff(lambda: enrich_fn(posting["Job Link"], posting["Job Description"]))
+        if enriched["skills_list"].startswith("Error:"):
+            raise RuntimeError(enriched["skills_list"][len("Error:"):].strip())
+        return {
+            "Timestamp": posting["Timestamp"] or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "Job Link": posting["Job Link"],
+            "Company": enriched["company"],
+            "Job Description": posting["Job Description"],
+            "Top Skills List": enriched["skills_list"],
+            "Detailed Skills Summary": enriched["skills_detail"],
+        }
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {pool.submit(work, p): i for i, p in enumerate(postings)}
+        for fut in as_completed(futures):
+            i = futures[fut]
+            try:
+                ready.append(fut.result())
+            except Exception as e:
+                errors.append({
+                    "Row": postings[i].get("Row", i + 1), "Job Link": postings[i]["Job Link"], "Error": str(e)
+                })
+            if len(ready) >= batch_size:
+                write_rows(ready)
+                written += len(ready)
+                ready = []
+            done += 1
+            if on_progress:
+                on_progress(done, len(postings))
+
+    if ready:
+        write_rows(ready)
+        written += len(ready)
+    errors.sort(key=lambda e: e["Row"])
+    return written, errors
@@ -0,0 +1,160 @@
+"""
+Rule-based company extraction, tried before asking the model.
+
+Tiers, most to least reliable:
+  ats_url       the company slug in an ATS URL (Greenhouse, Lever, Workday, ...)
+  company_line  an explicit "Company: Acme" style line in the posting
+  description   phrasing such as "About Acme" or "Acme is hiring"
+  careers_site  a company's own careers domain (careers.acme.com, acme.com/careers)
+
+Each returns {"company", "confidence", "tier"}. Callers only go to the model
+when the best guess is under CONFIDENCE_THRESHOLD. TIER_STATS counts which
+tier answered, so the Ops view can show how many model calls the rules avoid.
+"""
+import re
+import threading
+from collections import Counter
+from urllib.parse import parse_qsl, urlsplit
+
+CONFIDENCE_THRESHOLD = 0.8
+
+# host pattern -> (where the slug is, confidence)
+ATS_HOSTS = [
+    (re.compile(r"^(?:boards|job-boards)(?:\.eu)?\.greenhouse\.io$"), "path", 0.95),
+    (re.compile(r"^jobs(?:\.eu)?\.lever\.co$"), "path", 0.95),
+    (re.compile(r"^jobs\.ashbyhq\.com$"), "path", 0.95),
+    (re.compile(r"^(?:jobs|careers)\.smartrecruiters\.com$"), "path", 0.9),
+    (re.compile(r"^apply\.workable\.com$"), "path", 0.9),
+    (re.compile(r"^jobs\.jobvite\.com$"), "path", 0.9),
+    (re.compile(r"^([a-z0-9-]+)\.wd\d+\.myworkdayjobs\.com$"), "host", 0.9),
+    (re.compile(r"^([a-z0-9-]+)\.bamboohr\.com$"), "host", 0.9),
+    (re.compile(r"^([a-z0-9-]+)\.recruitee\.com$"), "host", 0.9),
+    (re.compile(r"^([a-z0-9-]+)\.breezy\.hr$"), "host", 0.9),
+    (re.compile(r"^(?:careers|jobs)-([a-z0-9-]+)\.icims\.com$"), "host", 0.85),
+]
+# Job boards whose domain says nothing about the employer
+BOARD_HOSTS = re.compile(
+    r"(linkedin|indeed|glassdoor|ziprecruiter|monster|dice|wellfound|angel|builtin|simplyhired|"
+    r"google|otta|handshake|greenhouse|lever|workday|myworkdayjobs|icims|taleo|successfactors)\.",
+    re.I,
+)
+# "Organization:" is left out: on job boards it usually names a department or team
+COMPANY_LINE = re.compile(
+    r"^\s*(?:company(?: name)?|employer|hiring company)\s*[:\-–]\s*(.{2,60}?)\s*$",
+    re.I | re.M,
+)
+ABOUT_HEADING = re.compile(r"^\s*about\s+(?!the\b|us\b|you\b|this\b|our\b|the role\b)(.{2,50}?)\s*:?\s*$", re.I | re.M)
+HIRING = re.compile(
+    r"\b([A-Z][\w&.'-]*(?:\s+[A-Z][\w&.'-]*){0,3})\s+(?:is hiring|is looking for|is seeking|seeks)\b"
+)
+JOIN = re.compile(r"\b(?:join|at)\s+([A-Z][\w&.'-]*(?:\s+[A-Z][\w&.'-]*){0,3})(?=[,.!\n]| as | and )")
+NOT_COMPANY = {"the", "our", "us", "we", "you", "this", "a", "an", "team", "company", "linkedin", "unknown"}
+SUFFIXES = re.compile(r"\s*,?\s*\b(inc|llc|ltd|corp|co|gmbh|plc)\.?$", re.I)
+
+
+def slug_to_name(slug):
+    """'acme-robotics' -> 'Acme Robotics'; short all-letter slugs stay upper case ('ibm' -> 'IBM')."""
+    words = [w for w in re.split(r"[-_\s]+", slug) if w]
+    if len(words) == 1 and len(words[0]) <= 3 and words[0].isalpha():
+        return words[0].upper()
+    return " ".join(w.capitalize() for w in words)
+
+
+def _guess(company, confidence, tier):
+    company = SUFFIXES.sub("", company.strip(" \t.,:;-–|")).strip()
+    if not company or company.lower() in NOT_COMPANY or len(company) > 60:
+        return None
+    return {"company": company, "confidence": confidence, "tier": tier}
+
+
+def from_ats_url(link):
+    parts = urlsplit((link or "").strip())
+    host = parts.netloc.lower().split(":")[0]
+    for pattern, where, confidence in ATS_HOSTS:
+        m = pattern.match(host)
+        if not m:
+            continue
+        if where == "host":
+            return _guess(slug_to_name(m.group(1)), confidence, "ats_url")
+        segments = [s for s in parts.path.split("/") if s]
+        if segments and segments[0] not in ("embed", "job_app", "jobs", "o"):
+            return _guess(slug_to_name(segments[0]), confidence, "ats_url")
+        # boards.greenhouse.io/embed/job_app?for=acme&token=...
+        slug = dict(parse_qsl(parts.query)).get("for")
+        if slug:
+            return _guess(slug_to_name(slug), confidence, "ats_url")
+    return None
+
+
+def from_company_line(description):
+    m = COMPANY_LINE.search(description or "")
+    return _guess(m.group(1), 0.9, "company_line") if m else None
+
+
+def from_description(description):
+    text = description or ""
+    m = ABOUT_HEADING.search(text)
+    if m:
+        return _guess(m.group(1), 0.75, "description")
+    m = HIRING.search(text)
+    if m:
+        return _guess(m.group(1), 0.65, "description")
+    m = JOIN.search(text)
+    if m:
+        return _guess(m.group(1), 0.5, "description")
+    return None
+
+
+def from_careers_site(link):
+    parts = urlsplit((link or "").strip())
+    host = parts.netloc.lower().split(":")[0]
+    if not host or BOARD_HOSTS.search(host):
+        return None
+    labels = [l for l in host.split(".") if l not in ("www", "careers", "jobs", "apply", "boards")]
+    if len(labels) < 2:
+        return None
+    on_careers = host.startswith(("careers.", "jobs.")) or re.search(r"/(careers|jobs)\b", parts.path)
+    return _guess(slug_to_name(labels[-2]), 0.6 if on_careers else 0.4, "careers_site")
+
+
+def extract_company(link, description):
+    """Best rule-based guess, or None. Stops at the first tier that clears the threshold."""
+    best = None
+    for tier in (
+        lambda: from_ats_url(link),
+        lambda: from_company_line(description),
+        lambda: from_description(description),
+        lambda: from_careers_site(link),
+    ):
+        guess = tier()
+        if guess and (best is None or guess["confidence"] > best["confidence"]):
+            best = guess
+            if best["confidence"] >= CONFIDENCE_THRESHOLD:
+                break
+    return best
+
+
+class TierStats:
+    """Which tier produced each company name ("llm" and "unknown" included)."""
+
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, tier):
+        with self._lock:
+            self._counts[tier] += 1
+
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+        total = sum(counts.values())
+        return {
+            "total": total,
+            "tiers": {t: {"hits": n, "rate": n / total} for t, n in sorted(counts.items())},
+            # Every non-model answer is a company lookup the model didn't have to do
+            "llm_avoided": total - counts.get("llm", 0) - counts.get("unknown", 0),
+        }
+
+
+TIER_STATS = TierStats()
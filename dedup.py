@@ -0,0 +1,176 @@
+"""
+Duplicate and near-duplicate job detection.
+
+Links are reduced to a canonical key (ATS job id where we can find one,
+otherwise the URL without tracking parameters). Descriptions get a 64-bit
+SimHash; two postings within MAX_DISTANCE bits are treated as the same job.
+A per-user DedupIndex answers both checks before any API call is made.
+"""
+import hashlib
+import re
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from incremental import IncrementalIndex, UserRegistry
+
+MAX_DISTANCE = 3
+BANDS = 4  # 4 x 16-bit bands: any pair within 3 bits shares at least one band exactly
+TRACKING_PARAMS = re.compile(
+    r"^(utm_.*|gclid|fbclid|mc_[ce]id|ref|refid|trk|trackingid|src|source|gh_src|lever-origin|"
+    r"lever-source.*|ebp|eBP|recommendedflavor|origin|lipi|position|pagenum|alternatechannel)$",
+    re.I,
+)
+
+
+def canonicalize_link(url):
+    """Stable key for a job posting URL, e.g. 'linkedin:3812345678' or 'greenhouse:acme:4455'."""
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = parts.netloc.lower().split(":")[0]
+    host = host[4:] if host.startswith("www.") else host
+    path = parts.path.rstrip("/")
+    query = dict(parse_qsl(parts.query))
+
+    if host.endswith("linkedin.com"):
+        m = re.search(r"/jobs/view/(?:[^/]*-)?(\d+)", path)
+        job_id = m.group(1) if m else query.get("currentJobId")
+        if job_id:
+            return f"linkedin:{job_id}"
+    if "greenhouse.io" in host:
+        m = re.search(r"^/([^/]+)/jobs/(\d+)", path)
+        if m:
+            return f"greenhouse:{m.group(1).lower()}:{m.group(2)}"
+        if "gh_jid" in query:
+            return f"greenhouse:{query.get('for', '').lower()}:{query['gh_jid']}"
+    if "gh_jid" in query:
+        # Greenhouse embedded on a company careers page
+        return f"greenhouse:{host}:{query['gh_jid']}"
+    if host == "jobs.lever.co":
+        m = re.search(r"^/([^/]+)/([0-9a-f-]{36})", path, re.I)
+        if m:
+            return f"lever:{m.group(1).lower()}:{m.group(2).lower()}"
+    if "myworkdayjobs.com" in host:
+        m = re.search(r"_([A-Za-z]*-?\d[\w-]*)$", path)
+        if m:
+            return f"workday:{host.split('.')[0]}:{m.group(1).lower()}"
+
+    kept = sorted((k, v) for k, v in query.items() if not TRACKING_PARAMS.match(k))
+    return f"url:{host}{path}" + (f"?{urlencode(kept)}" if kept else "")
+
+
+def _tokens(text):
+    return re.findall(r"[a-z0-9]+", (text or "").lower())
+
+
+def simhash(text, shingle=3):
+    """64-bit SimHash over word shingles."""
+    words = _tokens(text)
+    grams = [" ".join(words[i:i + shingle]) for i in range(max(1, len(words) - shingle + 1))]
+    weights = [0] * 64
+    for gram in grams:
+        h = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def _bands(h):
+    return [(i, h >> (16 * i) & 0xFFFF) for i in range(BANDS)]
+
+
+class DedupIndex(IncrementalIndex):
+    """Per-user link keys and SimHash bands for the jobs already tracked."""
+
+    def reset(self):
+        super().reset()
+        self.links = {}
+        self.band_table = defaultdict(list)
+
+    def add(self, info, link, description):
+        key = canonicalize_link(link)
+        if key:
+            self.links.setdefault(key, info)
+        if description and description.strip():
+            h = simhash(description)
+            for band in _bands(h):
+                self.band_table[band].append((h, info))
+
+    def fold(self, new, start, load_text):
+        texts = load_text(new["Row Key"].tolist())
+        for key, ts, link, company in zip(new["Row Key"], new["Timestamp"], new["Job Link"], new["Company"]):
+            info = {"Row Key": int(key), "Timestamp": str(ts)[:19], "Company": str(company), "Job Link": link}
+            self.add(info, link, texts.get(int(key), ""))
+
+    def check(self, link, description):
+        """Return {"kind", "match", "distance"} for the closest existing job, or None."""
+        key = canonicalize_link(link)
+        if key and key in self.links:
+            return {"kind": "link", "match": self.links[key], "distance": 0}
+        if not (description or "").strip():
+            return None
+        h = simhash(description)
+        best = None
+        for band in _bands(h):
+            for other, info in self.band_table.get(band, ()):
+                d = hamming(h, other)
+                if d <= MAX_DISTANCE and (best is None or d < best["distance"]):
+                    best = {"kind": "near", "match": info, "distance": d}
+        return best
+
+
+def find_duplicates(df, load_text):
+    """
+    One-off pass over existing rows. Returns a list of
+    {"Row Key", "Timestamp", "Company", "Job Link", "Duplicate Of", "Kind"}.
+    """
+    index = DedupIndex()
+    out = []
+    texts = load_text(df["Row Key"].tolist())
+    for key, ts, link, company in zip(df["Row Key"], df["Timestamp"], df["Job Link"], df["Company"]):
+        info = {"Row Key": int(key), "Timestamp": str(ts)[:19], "Company": str(company), "Job Link": link}
+        text = texts.get(int(key), "")
+        hit = index.check(link, text)
+        if hit:
+            out.append({**info, "Duplicate Of": hit["match"]["Timestamp"] + " " + hit["match"]["Company"],
+                        "Kind": hit["kind"]})
+        else:
+            index.add(info, link, text)
+    return out
+
+
+class DedupRegistry(UserRegistry):
+    """Process-wide DedupIndex per user."""
+
+    def __init__(self):
+        super().__init__(lambda username: DedupIndex())
+
+    def check(self, username, df, load_text, link, description):
+        idx = self._index(username)
+        with idx.lock:
+            idx.sync(df, load_text)
+            return idx.check(link, description)
+
+    def split_batch(self, username, df, load_text, postings):
+        """Partition bulk postings into (new, duplicates) against history and each other."""
+        idx = self._index(username)
+        batch = DedupIndex()
+        fresh, dups = [], []
+        with idx.lock:
+            idx.sync(df, load_text)
+            for i, p in enumerate(postings):
+                hit = idx.check(p["Job Link"], p["Job Description"]) or batch.check(
+                    p["Job Link"], p["Job Description"]
+                )
+                if hit:
+                    dups.append((i, hit))
+                else:
+                    fresh.append(p)
+                    batch.add({"Timestamp": "this import", "Company": f"row {i + 1}", "Job Link": p["Job Link"]},
+                              p["Job Link"], p["Job Description"])
+        return fresh, dups
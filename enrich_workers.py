@@ -0,0 +1,155 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from journal import Journal
+from retry import backoff_delay, is_retryable
+
+# Cell value of Company and Top Skills List until a worker fills them in
+ENRICHING = "Enriching…"
+
+
+class EnrichmentFailed(Exception):
+    """Enrichment came back without usable company/skills."""
+
+
+class RowNotSaved(Exception):
+    """The row is still waiting in the write queue; the patch is retried."""
+
+
+class EnrichmentWorkers:
+    """
+    Background enrichment for rows already written with ENRICHING placeholders.
+
+    `submit` journals the task (like WriteQueue, so it survives a restart)
+    and a bounded pool runs `enrich_fn(link, description)`. The result goes
+    to `patch_fn(username, title, timestamp, link, description, result)`,
+    which updates the row's cells in place. Retryable errors (rate limits,
+    5xx, a row not saved yet) are retried with jittered exponential backoff
+    up to `max_attempts`; anything else, or running out of attempts, moves
+    the task to the failed list (see `retry_failed` / `dismiss_failed`).
+    Nothing is written to the sheet for a failed task.
+
+    Journal entries are {"op": "add", "id", "username", "title", "timestamp",
+    "link", "description"}; failed tasks are parked in the journal.
+    """
+
+    def __init__(self, journal_path, enrich_fn, patch_fn, workers=2,
+                 base=2.0, max_backoff=600.0, interval=1.0, max_attempts=8):
+        self.journal_path = journal_path
+        self.enrich_fn = enrich_fn
+        self.patch_fn = patch_fn
+        self.base = base
+        self.max_backoff = max_backoff
+        self.interval = interval
+        self.max_attempts = max_attempts
+
+        self._journal = Journal(journal_path)
+        self._tasks = self._journal.live  # id -> task, in insertion order
+        self._failed = self._journal.parked  # id -> task plus "error", given up on
+        self._attempts = {}  # id -> (attempts so far, earliest next run)
+        self._running = set()
+        self._done = {}  # username -> tasks finished since start
+        self._last_stats = {}  # username -> stats of the last finished enrichment
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich")
+
+        self._scheduler = threading.Thread(target=self._run, name="enrich-scheduler", daemon=True)
+        self._scheduler.start()
+
+    # --- public API ---
+    def submit(self, username, title, timestamp, link, description):
+        rec = {"op": "add", "id": uuid.uuid4().hex, "username": username, "title": title,
+               "timestamp": timestamp, "link": link, "description": description}
+        with self._lock:
+            self._journal.add([rec])
+        self._wake.set()
+        return rec["id"]
+
+    def stats(self, username):
+        with self._lock:
+            mine = [t for t in self._tasks.values() if t["username"] == username]
+            failed = [t for t in self._failed.values() if t["username"] == username]
+            return {
+                "pending": len(mine),
+                "retrying": sum(1 for t in mine if self._attempts.get(t["id"], (0, 0.0))[0]),
+                "done": self._done.get(username, 0),
+                "failed": len(failed),
+                "failed_error": failed[-1]["error"] if failed else None,
+                "last": self._last_stats.get(username),
+                "last_error": self.last_error,
+            }
+
+    def failed(self, username):
+        """[(timestamp, link, error)] of this user's tasks that were given up on."""
+        with self._lock:
+            return [(t["timestamp"], t["link"], t["error"]) for t in self._failed.values()
+                    if t["username"] == username]
+
+    def retry_failed(self, username):
+        """Queue a user's failed tasks again with fresh attempts; returns how many."""
+        with self._lock:
+            ids = [i for i, t in self._failed.items() if t["username"] == username]
+            if not ids:
+                return 0
+            self._journal.retry(ids)
+        self._wake.set()
+        return len(ids)
+
+    def dismiss_failed(self, username):
+        """Forget a user's failed tasks (their rows keep the placeholder for backfill.py)."""
+        with self._lock:
+            ids = [i for i, t in self._failed.items() if t["username"] == username]
+            if ids:
+                self._journal.done(ids)
+            if not self._tasks:
+                self._journal.compact()
+        return len(ids)
+
+    # --- workers ---
+    def _work(self, task_id):
+        with self._lock:
+            task = dict(self._tasks[task_id])
+        try:
+            result = self.enrich_fn(task["link"], task["description"])
+            if result["skills_list"].startswith("Error:"):
+                raise EnrichmentFailed(result["skills_list"])
+            self.patch_fn(task["username"], task["title"], task["timestamp"], task["link"],
+                          task["description"], result)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            with self._lock:
+                attempts = self._attempts.get(task_id, (0, 0.0))[0] + 1
+                self.last_error = error
+                self._running.discard(task_id)
+                if (isinstance(e, RowNotSaved) or is_retryable(e)) and attempts < self.max_attempts:
+                    next_at = time.time() + backoff_delay(attempts - 1, self.base, self.max_backoff)
+                    self._attempts[task_id] = (attempts, next_at)
+                    return
+                # Not worth retrying: park it where the user can see it
+                self._attempts.pop(task_id, None)
+                self._journal.park([task_id], error)
+            return
+        with self._lock:
+            self._journal.done([task_id])
+            self._attempts.pop(task_id, None)
+            self._running.discard(task_id)
+            self._done[task["username"]] = self._done.get(task["username"], 0) + 1
+            self._last_stats[task["username"]] = result.get("stats")
+            if not self._tasks:
+                self._journal.compact()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            now = time.time()
+            with self._lock:
+                due = [i for i in self._tasks
+                       if i not in self._running and self._attempts.get(i, (0, 0.0))[1] <= now]
+                self._running.update(due)
+            for task_id in due:
+                self._pool.submit(self._work, task_id)
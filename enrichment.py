@@ -0,0 +1,248 @@
+import json
+import re
+import time
+
+from company_rules import CONFIDENCE_THRESHOLD, TIER_STATS, extract_company
+from llm_cache import cache_key
+from prompt_budget import DEFAULT_BUDGET, prepare_description
+from retry import is_retryable
+from tracing import span
+
+MODEL = "gpt-3.5-turbo"
+# Bump whenever a prompt changes so cached results from the old prompt are not reused
+PROMPT_VERSION = "enrich-v4"
+
+ENRICH_PROMPT = (
+    "You are a data extraction assistant. From the job posting below return a JSON object "
+    "with exactly these keys:\n"
+    '  "company": the hiring company name, or "Unknown" if you cannot tell,\n'
+    '  "skills": a list of the top 5 skills as short strings.\n'
+    "Return only the JSON object."
+)
+# Used when the company already came from the URL or an explicit line in the posting
+SKILLS_PROMPT = (
+    "You are a data extraction assistant. From the job posting below return a JSON object "
+    "with exactly these keys:\n"
+    '  "skills": a list of the top 5 skills as short strings.\n'
+    "Return only the JSON object."
+)
+# The detailed summary is written on demand, when a job's details are first opened
+SUMMARY_PROMPT = (
+    "Write a clean, markdown-free summary of the top 5 required skills in paragraph form (no * or ** or -)."
+)
+
+
+def clean_gpt_output(text):
+    return re.sub(r"[\*\n]+", " ", text).strip()
+
+
+def _chat(client, op, **kwargs):
+    """One chat completion, timed as span `op` with its token usage."""
+    with span(op) as s:
+        resp = client.chat.completions.create(model=MODEL, **kwargs)
+        s.add_tokens(getattr(resp, "usage", None))
+        return resp
+
+
+def extract_company_name(client, job_link: str, job_description: str, on_error=None, budget=DEFAULT_BUDGET) -> str:
+    """
+    Uses OpenAI to reliably extract the company name from a job link and description.
+    Falls back to "Unknown" on any error. budget=0 sends an already trimmed description as is.
+    """
+    try:
+        if budget:
+            job_description, _ = prepare_description(job_description, budget)
+        prompt = (
+            "You are a data extraction assistant.  \n"
+            "Given a job posting, identify and return only the name of the hiring company.  \n"
+            "If you cannot determine it, return 'Unknown'.\n\n"
+            f"Job Link: {job_link}\n\n"
+            f"Job Description:\n{job_description}"
+        )
+        resp = _chat(
+            client, "llm.company",
+            messages=[
+                {"role": "system",  "content": "You extract structured fields from unstructured text."},
+                {"role": "user",    "content": prompt}
+            ]
+        )
+        company = resp.choices[0].message.content.strip()
+        # Make sure we never return an empty string
+        return company if company else "Unknown"
+    except Exception as e:
+        if on_error:
+            on_error(f"Error extracting company name: {e}")
+        return "Unknown"
+
+
+def extract_skills_with_openai(client, text, budget=DEFAULT_BUDGET):
+    """Top five skills as a comma-separated list, or "Error: ..." if the call failed."""
+    try:
+        if budget:
+            text, _ = prepare_description(text, budget)
+        simple_response = _chat(
+            client, "llm.skills_list",
+            messages=[
+                {"role": "system", "content": "Return only the top 5 skills from this job description as a comma-separated list, no bullets, no markdown, no explanation."},
+                {"role": "user", "content": text}
+            ]
+        )
+        return clean_gpt_output(simple_response.choices[0].message.content)
+    except Exception as e:
+        return f"Error: {e}"
+
+
+def stream_skills_summary(client, job_description, budget=DEFAULT_BUDGET):
+    """Yield the detailed skills summary as it is generated."""
+    text, _ = prepare_description(job_description, budget)
+    with span("llm.skills_summary"):
+        stream = client.chat.completions.create(
+            model=MODEL,
+            stream=True,
+            messages=[
+                {"role": "system", "content": SUMMARY_PROMPT},
+                {"role": "user", "content": text}
+            ]
+        )
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+
+
+def parse_enrichment(content, company=None):
+    """
+    Validate the JSON reply; returns (company, skills_list) or raises ValueError.
+    A known `company` is used as is and not expected in the reply.
+    """
+    data = json.loads(content)
+    if not isinstance(data, dict):
+        raise ValueError("enrichment reply is not an object")
+    company = company or data.get("company")
+    skills = data.get("skills")
+    if isinstance(skills, str):
+        skills = skills.split(",")
+    if not isinstance(company, str) or not isinstance(skills, list):
+        raise ValueError("enrichment reply is missing company or skills")
+    skills = [clean_gpt_output(str(s)) for s in skills if str(s).strip()][:5]
+    if not skills:
+        raise ValueError("enrichment reply has no skills")
+    return (clean_gpt_output(company) or "Unknown"), ", ".join(skills)
+
+
+def enrich_job(client, job_link, job_description, on_error=None, cache=None, strict=False,
+               budget=DEFAULT_BUDGET):
+    """
+    Extract company and top skills with one JSON-mode call. The detailed
+    summary is not generated here (see stream_skills_summary), so
+    "skills_detail" is always "".
+
+    Falls back to the per-field calls if the reply can't be validated.
+    Returns a dict with "company", "skills_list", "skills_detail" and "stats":
+    the call count, latency and token usage.
+    With an LLMCache, a previously seen posting is answered without any call;
+    the cost of the call that produced the entry is stored with it, so a hit
+    reports the measured "saved_s" and "saved_tokens".
+    With strict=True, retryable API errors are raised instead of falling back.
+    The description is trimmed to `budget` prompt tokens first (see
+    prompt_budget); stats["trim"] reports what that saved.
+    """
+    started = time.perf_counter()
+    # The budget changes what the model sees, so it is part of the cache key
+    key = cache_key(job_link, job_description, MODEL, f"{PROMPT_VERSION}/b{budget}") if cache else None
+    if cache:
+        hit = cache.get(key)
+        if hit:
+            cost = hit.pop("cost", None)
+            latency = time.perf_counter() - started
+            hit["stats"] = {"calls": 0, "latency_s": latency, "fallback": False, "cached": True}
+            if cost:
+                # Entries written before costs were recorded report no savings
+                hit["stats"]["saved_s"] = max(0.0, cost["latency_s"] - latency)
+                hit["stats"]["saved_tokens"] = cost["prompt_tokens"] + cost["completion_tokens"]
+            return hit
+
+    result = _enrich_uncached(client, job_link, job_description, on_error, started, strict, budget)
+    failed = result["skills_list"].startswith("Error:") or result["company"] == "Unknown"
+    if cache and not failed:
+        stats = result["stats"]
+        entry = {k: result[k] for k in ("company", "skills_list", "skills_detail")}
+        entry["cost"] = {"latency_s": stats["latency_s"], "prompt_tokens": stats.get("prompt_tokens", 0),
+                         "completion_tokens": stats.get("completion_tokens", 0)}
+        cache.put(key, entry)
+    return result
+
+
+def _company_from(guess, llm_company):
+    """Pick the company and the tier that produced it, and count it in TIER_STATS."""
+    if guess and guess["confidence"] >= CONFIDENCE_THRESHOLD:
+        company, tier = guess["company"], guess["tier"]
+    elif llm_company and llm_company != "Unknown":
+        company, tier = llm_company, "llm"
+    elif guess:
+        # A weak rule-based guess still beats "Unknown"
+        company, tier = guess["company"], guess["tier"]
+    else:
+        company, tier = "Unknown", "unknown"
+    TIER_STATS.record(tier)
+    return company, tier
+
+
+def _enrich_uncached(client, job_link, job_description, on_error, started, strict, budget):
+    # Rules run on the full text: "Company:" lines are often in the header that trimming drops
+    guess = extract_company(job_link, job_description)
+    known = guess["company"] if guess and guess["confidence"] >= CONFIDENCE_THRESHOLD else None
+    job_description, trim = prepare_description(job_description, budget)
+    try:
+        resp = _chat(
+            client, "llm.enrich",
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": SKILLS_PROMPT if known else ENRICH_PROMPT},
+                {"role": "user", "content": f"Job Link: {job_link}\n\nJob Description:\n{job_description}"}
+            ]
+        )
+        llm_company, skills_list = parse_enrichment(resp.choices[0].message.content, known)
+        skills_detail = ""
+    except Exception as e:
+        if strict and is_retryable(e):
+            raise
+        if on_error:
+            on_error(f"Structured enrichment failed, using per-field calls: {e}")
+        # The separate company call is only made when the rules weren't confident
+        llm_company = None if known else extract_company_name(client, job_link, job_description, on_error, budget=0)
+        company, tier = _company_from(guess, llm_company)
+        skills_list, skills_detail = extract_skills_with_openai(client, job_description, budget=0), ""
+        return {
+            "company": company,
+            "skills_list": skills_list,
+            "skills_detail": skills_detail,
+            "stats": {"calls": 2 if known else 3, "latency_s": time.perf_counter() - started,
+                      "fallback": True, "cached": False, "trim": trim,
+                      "company_tier": tier, "company_confidence": guess["confidence"] if guess else None},
+        }
+    company, tier = _company_from(guess, llm_company)
+
+    latency = time.perf_counter() - started
+    usage = getattr(resp, "usage", None)
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    total = prompt_tokens + completion_tokens + trim["saved_tokens"]
+    return {
+        "company": company,
+        "skills_list": skills_list,
+        "skills_detail": skills_detail,
+        "stats": {
+            "calls": 1,
+            "latency_s": latency,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "fallback": False,
+            "cached": False,
+            "trim": trim,
+            "company_tier": tier,
+            "company_confidence": guess["confidence"] if guess else None,
+            # Rough: latency scaled by the share of tokens that trimming removed
+            "est_trim_saved_s": latency * trim["saved_tokens"] / total if total else 0.0,
+        },
+    }
@@ -0,0 +1,125 @@
+"""
+Process-wide governor for Google Sheets API calls.
+
+Every session thread goes through one Governor, which
+  - coalesces identical concurrent reads into a single in-flight request
+    (single flight: followers wait for the leader's result),
+  - paces requests with token buckets sized to the Sheets per-minute
+    read and write quotas,
+  - retries 429 and 5xx responses with jittered exponential backoff
+    (retry.with_backoff).
+
+stats() exposes queue depth, throttling and coalescing counters for the
+Ops view.
+"""
+import threading
+import time
+from concurrent.futures import Future
+
+from retry import with_backoff
+from tracing import span
+
+# Sheets allows 60 read and 60 write requests per minute per user (the
+# service account is one user); stay a little under.
+READS_PER_MIN = 55
+WRITES_PER_MIN = 55
+
+
+class TokenBucket:
+    def __init__(self, per_minute, burst=None):
+        self.rate = per_minute / 60.0
+        self.capacity = burst or max(1, per_minute // 6)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token; returns how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class Governor:
+    def __init__(self, reads_per_min=READS_PER_MIN, writes_per_min=WRITES_PER_MIN,
+                 retries=5, base=1.0, cap=32.0):
+        self.buckets = {"read": TokenBucket(reads_per_min), "write": TokenBucket(writes_per_min)}
+        self.retries = retries
+        self.base = base
+        self.cap = cap
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._counts = {"calls": 0, "coalesced": 0, "throttled": 0, "throttle_wait_s": 0.0,
+                        "retries": 0, "failures": 0}
+        self._waiting = 0
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._counts[name] += n
+
+    def _acquire(self, kind):
+        wait = self.buckets[kind].reserve()
+        if wait > 0:
+            with self._lock:
+                self._waiting += 1
+                self._counts["throttled"] += 1
+                self._counts["throttle_wait_s"] += wait
+            try:
+                with span(f"sheets.throttle_{kind}"):
+                    time.sleep(wait)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+
+    def _execute(self, kind, fn):
+        def attempt():
+            # Every attempt, retries included, spends a quota token
+            self._acquire(kind)
+            self._count("calls")
+            return fn()
+
+        try:
+            return with_backoff(attempt, self.retries, self.base, self.cap,
+                                on_retry=lambda e: self._count("retries"))
+        except Exception:
+            self._count("failures")
+            raise
+
+    def run(self, kind, fn, key=None):
+        """
+        Run fn() as a "read" or "write" request. Reads with a `key` share one
+        in-flight call with any concurrent read for the same key; the result
+        object is shared, so callers must not mutate it.
+        """
+        if key is None or kind != "read":
+            return self._execute(kind, fn)
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self._counts["coalesced"] += 1
+        if not leader:
+            return future.result()
+        try:
+            result = self._execute(kind, fn)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            out = dict(self._counts)
+            out["queue_depth"] = self._waiting
+            out["in_flight_reads"] = len(self._inflight)
+        out["throttle_wait_s"] = round(out["throttle_wait_s"], 3)
+        return out
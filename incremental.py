@@ -0,0 +1,65 @@
+"""
+Shared plumbing for the per-user structures built from a sheet frame.
+
+Job and contact frames only ever grow at the end, so each structure keeps
+how many rows it has seen and a fingerprint of the last one, and `sync`
+folds in just the new tail. If the frame got shorter or the row at the old
+boundary changed (edited, deleted, re-sorted), it starts over.
+"""
+import threading
+
+
+class IncrementalIndex:
+    """
+    Base for anything folded row by row from a frame. Subclasses extend
+    `reset` (calling super) and implement `fold(new, start, *args)`, where
+    `new` is the unseen tail and `start` its first position in the frame.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.n_rows = 0
+        self._last_fp = None
+
+    def fingerprints(self, df):
+        """One hashable per row; the Row Key unless overridden."""
+        return [int(k) for k in df["Row Key"]]
+
+    def fold(self, new, start, *args):
+        raise NotImplementedError
+
+    def sync(self, df, *args):
+        """Fold in rows past the last one seen; rebuild if the frame no longer lines up."""
+        n = len(df)
+        if n < self.n_rows or (
+            self.n_rows and self.fingerprints(df.iloc[self.n_rows - 1:self.n_rows])[0] != self._last_fp
+        ):
+            self.reset()
+        if n == self.n_rows:
+            return
+        self.fold(df.iloc[self.n_rows:], self.n_rows, *args)
+        self.n_rows = n
+        self._last_fp = self.fingerprints(df.iloc[n - 1:n])[0]
+
+
+class UserRegistry:
+    """Process-wide index per user, built by `factory(username)` on first use."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def _index(self, username):
+        with self._lock:
+            if username not in self._indexes:
+                self._indexes[username] = self._factory(username)
+            return self._indexes[username]
+
+    def drop(self, username):
+        """Forget the user's index (it is rebuilt on next use); returns it, if any."""
+        with self._lock:
+            return self._indexes.pop(username, None)
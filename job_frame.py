@@ -0,0 +1,122 @@
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Columns kept out of the in-memory job frame and loaded on demand
+LAZY_COLUMNS = ("Job Description",)
+
+
+def row_key(timestamp, job_link, description=""):
+    """
+    Stable 63-bit id for a job row (same across processes, unlike hash()).
+    Rows without a link also hash their description, so link-less postings
+    saved in the same second get distinct keys.
+    """
+    text = f"{timestamp}\x1f{job_link}" if job_link else f"{timestamp}\x1f\x1f{description or ''}"
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+
+def parse_timestamps(values):
+    """Parse with the app's own format; only rows that don't match pay for format inference."""
+    values = pd.Series(values, dtype="object")
+    parsed = pd.to_datetime(values, format=TIMESTAMP_FORMAT, errors="coerce")
+    bad = parsed.isna() & values.astype(str).str.strip().ne("")
+    if bad.any():
+        parsed[bad] = pd.to_datetime(values[bad], errors="coerce")
+    return parsed.to_numpy(dtype="datetime64[ns]")
+
+
+def intern_skills(text):
+    """Canonical 'a, b, c' form built from interned tokens, so repeated skills share memory."""
+    tokens = [sys.intern(t.strip()) for t in str(text or "").split(",") if t.strip()]
+    return sys.intern(", ".join(tokens))
+
+
+class DescriptionStore:
+    """
+    On-disk home for job descriptions, keyed by (username, row key).
+
+    The job frame only carries the row key; descriptions are read back for
+    the rows that actually need them (keyword indexing, detail view, export).
+    Other per-row text (e.g. skills summaries) can live in its own `table`.
+    """
+
+    def __init__(self, path, table="descriptions"):
+        self.table = table
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            " username TEXT NOT NULL, key INTEGER NOT NULL, text TEXT NOT NULL,"
+            " PRIMARY KEY (username, key))"
+        )
+        self._db.commit()
+
+    def put_many(self, username, items):
+        with self._lock:
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO {self.table}(username, key, text) VALUES (?, ?, ?)",
+                [(username, int(k), str(t)) for k, t in items]
+            )
+            self._db.commit()
+
+    def get_many(self, username, keys):
+        keys = [int(k) for k in keys]
+        out = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                out.update(self._db.execute(
+                    f"SELECT key, text FROM {self.table} WHERE username = ? AND key IN ({marks})",
+                    [username, *chunk]
+                ).fetchall())
+        return out
+
+    def get(self, username, key):
+        return self.get_many(username, [key]).get(int(key), "")
+
+
+def compact_job_frame(rows, header, descriptions=None, username=None):
+    """
+    Build the lean job frame from raw sheet rows.
+
+    Timestamp becomes datetime64 (explicit format), Company and Top Skills
+    List become categoricals of interned strings, and Job Description moves
+    to `descriptions` with a "Row Key" column left in its place.
+    """
+    raw = pd.DataFrame(rows, columns=header)
+    keys = np.fromiter(
+        (row_key(ts, link, text)
+         for ts, link, text in zip(raw["Timestamp"], raw["Job Link"], raw["Job Description"])),
+        dtype="int64", count=len(raw)
+    )
+    lazy = [c for c in LAZY_COLUMNS if c in raw.columns]
+    if descriptions is not None and "Job Description" in lazy and len(raw):
+        descriptions.put_many(username, zip(keys, raw["Job Description"]))
+
+    df = raw.drop(columns=lazy)
+    df["Timestamp"] = parse_timestamps(raw["Timestamp"].to_numpy())
+    df["Company"] = df["Company"].map(lambda c: sys.intern(str(c))).astype("category")
+    df["Top Skills List"] = df["Top Skills List"].map(intern_skills).astype("category")
+    df["Row Key"] = keys
+    return df
+
+
+def attach_descriptions(df, descriptions, username):
+    """Return a copy of (a slice of) the job frame with Job Description filled back in."""
+    texts = descriptions.get_many(username, df["Row Key"].tolist())
+    out = df.copy()
+    out.insert(out.columns.get_loc("Company") + 1, "Job Description",
+               [texts.get(int(k), "") for k in df["Row Key"]])
+    return out
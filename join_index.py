@@ -0,0 +1,142 @@
+"""
+Join between a user's networking contacts and tracked jobs.
+
+Both sides are hashed on the canonical job link (dedup.canonicalize_link),
+with a normalized company name as the fallback key, so each job row or
+contact card is matched with one dict lookup instead of a scan of the
+other sheet.
+"""
+import re
+import threading
+
+from dedup import canonicalize_link
+from enrich_workers import ENRICHING
+from incremental import IncrementalIndex, UserRegistry
+
+# A legal suffix only counts as a whole trailing word, so "Co-op Bank" keeps its "Co"
+COMPANY_SUFFIX = re.compile(
+    r"[\s,]+(inc|incorporated|llc|ltd|limited|corp|corporation|co|company|gmbh|plc|sa|ag|bv|pty)\b\.?[\s,]*$", re.I
+)
+
+
+def normalize_company(name):
+    """'Acme, Inc.' / 'ACME inc' / 'Acme Co., Ltd.' / 'acme' -> 'acme'."""
+    name = str(name or "").strip().lower()
+    if name in ("", "unknown", ENRICHING.lower()):
+        return ""
+    while True:
+        stripped = COMPANY_SUFFIX.sub("", name)
+        if stripped == name:
+            break
+        name = stripped
+    return " ".join(re.findall(r"[a-z0-9]+", name))
+
+
+class _Side(IncrementalIndex):
+    """Rows of one sheet folded into link and company buckets."""
+
+    def __init__(self, fingerprints, link_col="Job Link", company_col="Company"):
+        self._fingerprints = fingerprints
+        self.link_col = link_col
+        self.company_col = company_col
+        super().__init__()
+
+    def reset(self):
+        super().reset()
+        self.by_link = {}
+        self.by_company = {}
+        self.seen = set()
+
+    def fingerprints(self, df):
+        return self._fingerprints(df)
+
+    def add(self, fp, link, company, ts):
+        if fp in self.seen:
+            return
+        self.seen.add(fp)
+        for table, key in ((self.by_link, canonicalize_link(link)), (self.by_company, normalize_company(company))):
+            if not key:
+                continue
+            count, last = table.get(key, (0, None))
+            table[key] = (count + 1, ts if last is None or (ts is not None and ts > last) else last)
+
+    def fold(self, new, start):
+        for fp, link, company, ts in zip(self.fingerprints(new), new[self.link_col], new[self.company_col],
+                                         new["Timestamp"]):
+            self.add(fp, link, company, ts)
+
+    def lookup(self, link, company):
+        """((count, latest timestamp), "link" | "company") or (None, None)."""
+        key = canonicalize_link(link)
+        if key and key in self.by_link:
+            return self.by_link[key], "link"
+        key = normalize_company(company)
+        if key and key in self.by_company:
+            return self.by_company[key], "company"
+        return None, None
+
+
+def job_fingerprints(df):
+    return [int(k) for k in df["Row Key"]]
+
+
+def contact_fingerprints(df):
+    return [hash((str(ts), str(link), str(role))) for ts, link, role in zip(df["Timestamp"], df["Job Link"], df["Job Role"])]
+
+
+class JoinIndex:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.jobs = _Side(job_fingerprints)
+        self.contacts = _Side(contact_fingerprints)
+
+    def sync_jobs(self, df):
+        self.jobs.sync(df)
+
+    def sync_contacts(self, df):
+        self.contacts.sync(df)
+
+    def add_job(self, row_key, row, ts):
+        """`ts` must be the same type the job frame uses (pd.Timestamp)."""
+        self.jobs.add(int(row_key), row["Job Link"], row["Company"], ts)
+
+    def add_contact(self, row):
+        fp = hash((str(row["Timestamp"]), str(row["Job Link"]), str(row["Job Role"])))
+        self.contacts.add(fp, row["Job Link"], row["Company"], str(row["Timestamp"]))
+
+    def contacts_for_job(self, link, company):
+        """(contact count, last contacted, matched on) for a job row."""
+        hit, how = self.contacts.lookup(link, company)
+        return (hit[0], hit[1], how) if hit else (0, None, None)
+
+    def applied_on(self, link, company):
+        """(latest matching job timestamp, matched on) for a contact card."""
+        hit, how = self.jobs.lookup(link, company)
+        return (hit[1], how) if hit else (None, None)
+
+
+class JoinRegistry(UserRegistry):
+    """Process-wide JoinIndex per user."""
+
+    def __init__(self):
+        super().__init__(lambda username: JoinIndex())
+
+    def get(self, username, jobs_df=None, contacts_df=None):
+        """The user's index with whichever sides were passed brought up to date."""
+        idx = self._index(username)
+        with idx.lock:
+            if jobs_df is not None:
+                idx.sync_jobs(jobs_df)
+            if contacts_df is not None:
+                idx.sync_contacts(contacts_df)
+        return idx
+
+    def add_job(self, username, row_key, row, ts):
+        idx = self._index(username)
+        with idx.lock:
+            idx.add_job(row_key, row, ts)
+
+    def add_contact(self, username, row):
+        idx = self._index(username)
+        with idx.lock:
+            idx.add_contact(row)
@@ -0,0 +1,106 @@
+"""
+Crash-safe JSONL journal behind the write queue and the enrichment workers.
+
+Every "add" record is an entry keyed by its id. An entry stays live until it
+is marked done, or is parked (with the error that stopped it) until it is
+retried or marked done. Each write is fsynced before it returns; replay
+rebuilds the live and parked entries and compact() rewrites the file with
+only those.
+
+Lines are {"op": "add", "id", ...}, {"op": "done", "ids": [...]},
+{"op": "park", "ids": [...], "error"} or {"op": "retry", "ids": [...]}.
+"""
+import json
+import os
+
+
+class Journal:
+    """
+    `live` and `parked` map id -> record in insertion order (parked records
+    carry an extra "error"). They are updated in place, never rebound, so
+    owners may keep references to them. Callers serialize access.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.live = {}
+        self.parked = {}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._replay()
+        self.compact()
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    # A torn last line from a crash mid-write
+                    continue
+                op = rec.get("op")
+                # Older journals wrote {"op": "commit", "ids"} and {"op": "done", "id"}
+                ids = rec["ids"] if "ids" in rec else [rec.get("id")]
+                if op == "add":
+                    self.live[rec["id"]] = rec
+                elif op in ("done", "commit"):
+                    self._done(ids)
+                elif op == "park":
+                    self._park(ids, rec.get("error"))
+                elif op == "retry":
+                    self._retry(ids)
+
+    def _write(self, recs):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(rec) + "\n" for rec in recs))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _done(self, ids):
+        for i in ids:
+            self.live.pop(i, None)
+            self.parked.pop(i, None)
+
+    def _park(self, ids, error):
+        for i in ids:
+            rec = self.live.pop(i, None)
+            if rec is not None:
+                self.parked[i] = {**rec, "error": error}
+
+    def _retry(self, ids):
+        for i in ids:
+            rec = self.parked.pop(i, None)
+            if rec is not None:
+                self.live[i] = {k: v for k, v in rec.items() if k != "error"}
+
+    def add(self, recs):
+        """Journal new {"op": "add", "id", ...} records with a single fsync."""
+        self._write(recs)
+        for rec in recs:
+            self.live[rec["id"]] = rec
+
+    def done(self, ids):
+        self._write([{"op": "done", "ids": list(ids)}])
+        self._done(ids)
+
+    def park(self, ids, error):
+        self._write([{"op": "park", "ids": list(ids), "error": error}])
+        self._park(ids, error)
+
+    def retry(self, ids):
+        self._write([{"op": "retry", "ids": list(ids)}])
+        self._retry(ids)
+
+    def compact(self):
+        """Rewrite the file with only the live and parked entries."""
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for rec in self.live.values():
+                f.write(json.dumps(rec) + "\n")
+            for rec in self.parked.values():
+                f.write(json.dumps({k: v for k, v in rec.items() if k != "error"}) + "\n")
+                f.write(json.dumps({"op": "park", "ids": [rec["id"]], "error": rec["error"]}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def normalize_text(text):
+    return re.sub(r"\s+", " ", text or "").strip().lower()
+
+
+def normalize_link(link):
+    # Tracking params and fragments don't change the posting
+    parts = urlsplit((link or "").strip())
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def cache_key(job_link, job_description, model, prompt_version):
+    raw = "\x1f".join([
+        normalize_link(job_link), normalize_text(job_description), model, prompt_version
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    On-disk (SQLite) cache of enrichment results, keyed by content hash.
+
+    Shared by every session through one connection and kept across restarts.
+    When the cache grows past `max_entries` the least recently used entries
+    are evicted. Hit/miss counters are persisted alongside the entries.
+    """
+
+    def __init__(self, path, max_entries=20000):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " created_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_used_at ON entries(used_at)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, n INTEGER NOT NULL)")
+        self._db.commit()
+
+    def _bump(self, name, by=1):
+        self._db.execute(
+            "INSERT INTO counters(name, n) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET n = n + excluded.n", (name, by)
+        )
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._bump("misses")
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE entries SET used_at = ? WHERE key = ?", (time.time(), key))
+            self._bump("hits")
+            self._db.commit()
+            return json.loads(row[0])
+
+    def put(self, key, value):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries(key, value, created_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now)
+            )
+            (count,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+            if count > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM entries WHERE key IN ("
+                    " SELECT key FROM entries ORDER BY used_at ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+                self._bump("evictions", count - self.max_entries)
+            self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            counters = dict(self._db.execute("SELECT name, n FROM counters").fetchall())
+            (entries,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "entries": entries,
+            "hits": hits,
+            "misses": misses,
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        }
@@ -0,0 +1,38 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+
+def stable_sort(df, column, ascending=True):
+    """Sort keeping ties in their original (sheet) order."""
+    return df.sort_values(column, ascending=ascending, kind="mergesort", na_position="last")
+
+
+def page_count(n_rows, page_size):
+    return max(1, math.ceil(n_rows / page_size))
+
+
+def page_slice(df, page, page_size):
+    """Rows of 1-based `page`; only this slice gets serialized to the browser."""
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+
+def page_for_date(timestamps, date, ascending, page_size):
+    """
+    1-based page holding the first row on or after `date` (ascending sort)
+    or on or before the end of `date` (descending sort).
+    """
+    ts = pd.to_datetime(pd.Series(timestamps), errors="coerce").to_numpy(dtype="datetime64[ns]")
+    # stable_sort puts missing timestamps last, so the valid ones are a sorted prefix
+    ts = ts[~np.isnat(ts)]
+    day = np.datetime64(pd.Timestamp(date), "ns")
+    if ascending:
+        pos = int(np.searchsorted(ts, day, side="left"))
+    else:
+        # Descending: search the reversed (ascending) array for the end of that day
+        end = day + np.timedelta64(1, "D")
+        pos = len(ts) - int(np.searchsorted(ts[::-1], end, side="left"))
+    pos = min(pos, max(len(ts) - 1, 0))
+    return pos // page_size + 1
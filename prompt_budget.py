@@ -0,0 +1,152 @@
+"""
+Trim job descriptions before they go into a prompt.
+
+Pasted postings carry a lot of text the model doesn't need: EEO and
+accommodation statements, benefits blurbs, pay-transparency legalese and
+LinkedIn page chrome. prepare_description() drops those sections and
+lines, collapses whitespace and, if the rest is still over the token
+budget, keeps requirements/qualifications/responsibilities paragraphs
+ahead of everything else.
+"""
+import re
+
+from tracing import span
+
+DEFAULT_BUDGET = 1500  # prompt tokens for the description itself
+CHARS_PER_TOKEN = 4
+
+# Headings that open a section we drop up to the next heading
+BOILERPLATE_HEADINGS = re.compile(
+    r"^(equal (employment )?opportunity|eeo( statement)?|diversity,? (equity|and inclusion).*|"
+    r"(our |the )?benefits( and perks| & perks)?|perks( and benefits| & benefits)?|what we offer|"
+    r"why (join|work (at|for|with)) .*|compensation( and benefits| & benefits)?|pay (range|transparency)|"
+    r"salary( range)?|reasonable accommodations?|accommodations?|e-?verify|privacy (notice|policy)|"
+    r"recruitment fraud.*|notice to (recruiters|agencies|applicants)|disclaimer)\s*:?$",
+    re.I,
+)
+PRIORITY_TERMS = (
+    r"requirements?|qualifications?|responsibilities|what you('ll| will) (do|bring|need)|"
+    r"skills|experience|must[- ]haves?|nice[- ]to[- ]haves?|about the role|the role|you have|"
+    r"who you are|what we('re| are) looking for"
+)
+# Headings that open a section we keep ahead of everything else when over budget
+PRIORITY_HEADINGS = re.compile(rf"^(.*\b({PRIORITY_TERMS})\b.*)\s*:?$", re.I)
+# A bare phrase like "What you'll do" is a heading even in sentence case
+PRIORITY_PHRASES = re.compile(rf"^((key|basic|minimum|preferred|required|your) )?({PRIORITY_TERMS})$", re.I)
+# Stand-alone boilerplate sentences, wherever they appear
+BOILERPLATE_LINES = re.compile(
+    r"(is an equal (employment )?opportunity|without regard to (race|age|sex)|"
+    r"regardless of (race|age|sex|gender)|protected veteran|"
+    r"reasonable accommodation|e-?verify|pay transparency|"
+    r"(base )?(salary|pay|compensation) (range|for this (role|position)) .*(\$|usd|based on)|"
+    r"in accordance with (applicable )?(state|local|federal) law|"
+    r"medical, dental,? (and|&) vision|401\(?k\)?|paid time off|"
+    r"will not be (asked|required) to disclose)",
+    re.I,
+)
+# LinkedIn (and similar board) page chrome
+CHROME_LINES = re.compile(
+    r"^(show (more|less)|see more|about the job|easy apply|apply( now)?|save|saved|"
+    r"\d+ (applicants?|people clicked apply)|over \d+ applicants|promoted|actively recruiting|"
+    r"meet the hiring team|message|set alert for similar jobs|job search faster with premium|"
+    r"see how you compare to .*|referrals increase your chances.*|see who .* has hired.*|"
+    r"(seniority level|employment type|job function|industries)\b.*|"
+    r"(\d+ )?(hours?|days?|weeks?|months?) ago.*|reposted .*|on-?site|remote|hybrid|full-time|part-time|"
+    r"·+|report this job|similar jobs|people also viewed.*)$",
+    re.I,
+)
+
+
+def estimate_tokens(text):
+    return (len(text or "") + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _is_heading(raw, line):
+    # Bullet items are short too, but never start a section
+    if re.match(r"\s*[-•*·]", raw):
+        return False
+    if len(line) > 60 or line.endswith((".", ",", ";")) or len(line.split()) > 8:
+        return False
+    if line.endswith(":") or BOILERPLATE_HEADINGS.match(line) or PRIORITY_PHRASES.match(line):
+        return True
+    # Otherwise only Title Case / ALL CAPS phrases ("About Acme", "Relevant Experience"),
+    # never a body line that merely mentions "experience" or "skills"
+    words = [w for w in line.split() if w[0].isalpha()]
+    long_words = [w for w in words if len(w) > 3]
+    if not long_words or not all(w[0].isupper() for w in long_words):
+        return False
+    return len(words) >= 2 or bool(PRIORITY_HEADINGS.match(line))
+
+
+def _paragraphs(text):
+    """[(heading kind, lines)] with boilerplate sections and lines removed."""
+    paragraphs, current, kind = [], [], "body"
+    skipping = False
+    seen = set()
+    for raw in text.splitlines():
+        line = re.sub(r"[ \t\u00a0\u200b]+", " ", raw).strip(" \t-•*·")
+        if not line:
+            if current:
+                paragraphs.append((kind, current))
+                current = []
+            continue
+        if CHROME_LINES.match(line):
+            continue
+        if _is_heading(raw, line):
+            if BOILERPLATE_HEADINGS.match(line):
+                skipping = True
+                continue
+            skipping = False
+            if current:
+                paragraphs.append((kind, current))
+                current = []
+            kind = "priority" if PRIORITY_HEADINGS.match(line) else "body"
+        if skipping or BOILERPLATE_LINES.search(line):
+            continue
+        # Pasted pages often repeat the same line (title, location, chrome)
+        folded = line.lower()
+        if folded in seen:
+            continue
+        seen.add(folded)
+        current.append(line)
+    if current:
+        paragraphs.append((kind, current))
+    return paragraphs
+
+
+def prepare_description(text, budget=DEFAULT_BUDGET):
+    """
+    Returns (trimmed text, info). `info` has tokens_before, tokens_after,
+    saved_tokens and truncated. Token counts are a chars/4 estimate.
+    """
+    text = text or ""
+    with span("llm.prepare") as s:
+        before = estimate_tokens(text)
+        paragraphs = [(kind, "\n".join(lines)) for kind, lines in _paragraphs(text)]
+        truncated = False
+        if budget and sum(estimate_tokens(p) for _, p in paragraphs) > budget:
+            truncated = True
+            # Fill the budget with priority sections first, then the rest in reading order
+            order = sorted(range(len(paragraphs)), key=lambda i: paragraphs[i][0] != "priority")
+            left, keep = budget, {}
+            for i in order:
+                cost = estimate_tokens(paragraphs[i][1])
+                if cost <= left:
+                    keep[i] = paragraphs[i][1]
+                    left -= cost
+                elif left > 20:
+                    keep[i] = paragraphs[i][1][:left * CHARS_PER_TOKEN].rsplit(" ", 1)[0]
+                    left = 0
+            paragraphs = [(kind, keep[i]) for i, (kind, _) in enumerate(paragraphs) if i in keep]
+        trimmed = "\n\n".join(p for _, p in paragraphs)
+        if not trimmed.strip():
+            # Never send an empty description because everything looked like boilerplate
+            trimmed = re.sub(r"\s+", " ", text).strip()[:budget * CHARS_PER_TOKEN if budget else None]
+        after = estimate_tokens(trimmed)
+        s.tokens = {"trimmed": max(0, before - after)}
+    return trimmed, {
+        "tokens_before": before,
+        "tokens_after": after,
+        "saved_tokens": max(0, before - after),
+        "truncated": truncated,
+    }
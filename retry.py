@@ -0,0 +1,38 @@
+"""
+Retry policy shared by every outbound call (Sheets, OpenAI): which errors
+are worth another attempt, and how long to wait before it.
+"""
+import random
+import time
+
+# openai exception types that carry no status code of their own
+RETRYABLE_ERRORS = ("RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError")
+
+
+def status_code(e):
+    """HTTP status of an API error (openai sets it on the error, gspread on its response)."""
+    return getattr(e, "status_code", None) or getattr(getattr(e, "response", None), "status_code", None)
+
+
+def is_retryable(e):
+    """Rate limits, timeouts, dropped connections and 5xx responses."""
+    status = status_code(e)
+    return status == 429 or (isinstance(status, int) and 500 <= status < 600) or type(e).__name__ in RETRYABLE_ERRORS
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    """Jittered exponential wait before retry number `attempt` (0 for the first retry)."""
+    return min(cap, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def with_backoff(fn, retries=5, base=1.0, cap=60.0, on_retry=None):
+    """Call fn(), retrying retryable errors up to `retries` times; on_retry(e) sees each one."""
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == retries or not is_retryable(e):
+                raise
+            if on_retry:
+                on_retry(e)
+            time.sleep(backoff_delay(attempt, base, cap))
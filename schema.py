@@ -0,0 +1,7 @@
+"""Worksheet layouts shared by the app, backfill.py and the benchmarks (no heavy imports)."""
+
+JOB_HEADER = ["Timestamp","Job Link","Company","Job Description","Top Skills List","Detailed Skills Summary"]
+# Bulk reads stop before Detailed Skills Summary; it is read or generated per job on demand
+JOB_FRAME_WIDTH = 5
+JOB_FRAME_HEADER = JOB_HEADER[:JOB_FRAME_WIDTH]
+CONTACT_HEADER = ["Timestamp","Job Role","Company","Job Link","People Contacted"]
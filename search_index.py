@@ -0,0 +1,116 @@
+import bisect
+import math
+import re
+from collections import defaultdict
+
+from incremental import IncrementalIndex, UserRegistry
+
+# Field weights: a hit in the skills list counts more than one buried in the description.
+# Detailed summaries are generated on demand for single jobs, so they are not searched.
+SEARCH_FIELDS = {
+    "Top Skills List": 3.0,
+    "Job Description": 1.0,
+}
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(str(text or "").lower())
+
+
+def row_fingerprint(row):
+    if "Row Key" in row:
+        return int(row["Row Key"])
+    return hash((str(row.get("Timestamp", "")), str(row.get("Job Link", ""))))
+
+
+class JobIndex(IncrementalIndex):
+    """
+    Token inverted index over one user's job rows.
+
+    Postings map token -> {row position: weighted term frequency}. Rows are
+    added incrementally as the frame grows; a sorted vocabulary supports
+    prefix matching. Queries AND their terms and rank by weighted tf-idf.
+    """
+
+    def reset(self):
+        super().reset()
+        self.postings = defaultdict(dict)
+        self.vocab = []
+        self._vocab_dirty = False
+
+    def fingerprints(self, df):
+        return [row_fingerprint(row) for _, row in df.iterrows()]
+
+    def add_row(self, pos, row):
+        counts = defaultdict(float)
+        for field, weight in SEARCH_FIELDS.items():
+            for tok in tokenize(row.get(field, "")):
+                counts[tok] += weight
+        for tok, tf in counts.items():
+            plist = self.postings[tok]
+            if not plist:
+                self._vocab_dirty = True
+            plist[pos] = tf
+
+    def fold(self, new, start, load_text=None):
+        """
+        Index the new rows. When descriptions are kept out of the frame,
+        `load_text(keys)` returns {row key: description} for them.
+        """
+        cols = [c for c in SEARCH_FIELDS if c in new.columns] + [
+            c for c in ("Timestamp", "Job Link", "Row Key") if c in new.columns
+        ]
+        new_rows = new[cols].to_dict("records")
+        if "Job Description" not in new.columns and "Row Key" in new.columns and load_text:
+            texts = load_text([r["Row Key"] for r in new_rows])
+            for r in new_rows:
+                r["Job Description"] = texts.get(int(r["Row Key"]), "")
+        for pos, row in enumerate(new_rows, start=start):
+            self.add_row(pos, row)
+
+    def _expand(self, term):
+        """Postings for every vocabulary token starting with `term`, merged."""
+        if self._vocab_dirty:
+            self.vocab = sorted(self.postings)
+            self._vocab_dirty = False
+        merged = {}
+        i = bisect.bisect_left(self.vocab, term)
+        while i < len(self.vocab) and self.vocab[i].startswith(term):
+            tok = self.vocab[i]
+            plist = self.postings[tok]
+            idf = math.log(1 + self.n_rows / len(plist))
+            for pos, tf in plist.items():
+                merged[pos] = merged.get(pos, 0.0) + tf * idf
+            i += 1
+        return merged
+
+    def search(self, query):
+        """Row positions matching every query term (as a prefix), best match first."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        scores = None
+        # Rarest term first keeps the running intersection small
+        for hits in sorted((self._expand(t) for t in terms), key=len):
+            if scores is None:
+                scores = dict(hits)
+            else:
+                scores = {pos: s + hits[pos] for pos, s in scores.items() if pos in hits}
+            if not scores:
+                return []
+        return sorted(scores, key=lambda pos: (-scores[pos], pos))
+
+
+class IndexRegistry(UserRegistry):
+    """Process-wide JobIndex per user."""
+
+    def __init__(self):
+        super().__init__(lambda username: JobIndex())
+
+    def search(self, username, df, query, load_text=None):
+        idx = self._index(username)
+        with idx.lock:
+            idx.sync(df, load_text)
+            return idx.search(query)
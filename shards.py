@@ -0,0 +1,132 @@
+"""
+Time-sharded job history.
+
+A user's jobs start in the worksheet named after them. Once that worksheet
+passes a row or age threshold, new rows go to a fresh worksheet named
+"<username>__YYYYMMDD" (the rollover date), and the older ones become
+read-mostly archives. Because shards are created in time order, each
+shard covers [its start, next shard's start], which is enough to pick the
+shards a recent-window query needs.
+"""
+import json
+import os
+import re
+import threading
+from datetime import date, datetime, timedelta
+
+
+class Shard:
+    def __init__(self, title, start=None):
+        self.title = title
+        self.start = start  # None for the original, unbounded worksheet
+
+    def __repr__(self):
+        return f"Shard({self.title!r}, {self.start})"
+
+
+def shard_title(username, day):
+    return f"{username}__{day:%Y%m%d}"
+
+
+def parse_shards(username, titles):
+    """Job shards among the spreadsheet's worksheet titles, oldest first."""
+    pattern = re.compile(rf"^{re.escape(username)}__(\d{{8}})$")
+    shards = [Shard(username)] if username in titles else []
+    for title in titles:
+        m = pattern.match(title)
+        if m:
+            shards.append(Shard(title, datetime.strptime(m.group(1), "%Y%m%d").date()))
+    shards.sort(key=lambda s: s.start or date.min)
+    return shards
+
+
+class ShardCatalog:
+    """
+    Per-user list of job shards, discovered from the spreadsheet's worksheet
+    titles once and updated in place on rollover.
+    """
+
+    def __init__(self, list_titles, max_rows=5000, max_age_days=180):
+        self.list_titles = list_titles
+        self.max_rows = max_rows
+        self.max_age_days = max_age_days
+        self._shards = {}
+        self._lock = threading.Lock()
+
+    def shards(self, username):
+        with self._lock:
+            if username not in self._shards:
+                found = parse_shards(username, self.list_titles())
+                self._shards[username] = found or [Shard(username)]
+            return list(self._shards[username])
+
+    def active(self, username):
+        return self.shards(username)[-1].title
+
+    def for_window(self, username, since=None):
+        """Titles of shards that can hold rows at or after `since` (all shards if None)."""
+        shards = self.shards(username)
+        if since is None:
+            return [s.title for s in shards]
+        since = since.date() if isinstance(since, datetime) else since
+        titles = []
+        for shard, nxt in zip(shards, shards[1:] + [None]):
+            # Rows dated on the rollover day can sit on either side of it
+            if nxt is None or nxt.start + timedelta(days=1) >= since:
+                titles.append(shard.title)
+        return titles
+
+    def needs_rollover(self, n_rows, oldest):
+        if n_rows >= self.max_rows:
+            return True
+        return oldest is not None and datetime.now() - oldest > timedelta(days=self.max_age_days)
+
+    def roll_over(self, username, create, today=None):
+        """Start a new active shard; `create(title)` makes the worksheet."""
+        today = today or date.today()
+        with self._lock:
+            shards = self._shards.setdefault(username, [Shard(username)])
+            if shards[-1].start == today:
+                return shards[-1].title
+            title = shard_title(username, today)
+            create(title)
+            shards.append(Shard(title, today))
+            return title
+
+
+class ArchiveCache:
+    """
+    Local, never-expiring copy of archive shards. Archives don't change once
+    rolled over, so after the first full read they are served from disk.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, title):
+        return os.path.join(self.directory, f"{title}.json")
+
+    def rows(self, title, fetch_all):
+        path = self._path(title)
+        with self._lock:
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    return json.load(f)
+        rows = fetch_all()
+        tmp = path + ".tmp"
+        with self._lock:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+            os.replace(tmp, path)
+        return rows
+
+    def rows_from(self, title, start_row, fetch_all):
+        """Same contract as SheetPool.rows_from, served from the local copy."""
+        return self.rows(title, fetch_all)[start_row - 2:]
+
+    def drop(self, title):
+        with self._lock:
+            if os.path.exists(self._path(title)):
+                os.remove(self._path(title))
@@ -0,0 +1,142 @@
+import base64
+import json
+import re
+import threading
+
+import gspread
+from google.auth.transport.requests import Request
+from google.oauth2.service_account import Credentials
+
+from governor import Governor
+from tracing import span
+
+SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+# What a 400 says when the worksheet behind a range or sheet id was deleted
+MISSING_SHEET = re.compile(r"unable to parse range|no grid with id|not found", re.I)
+
+
+def is_stale_handle_error(e):
+    """True when an APIError means the cached worksheet no longer exists."""
+    if isinstance(e, gspread.WorksheetNotFound):
+        return True
+    if isinstance(e, gspread.exceptions.APIError):
+        code = getattr(e.response, "status_code", None)
+        message = str((getattr(e, "error", None) or {}).get("message") or e)
+        return code == 404 or (code == 400 and bool(MISSING_SHEET.search(message)))
+    return False
+
+
+class SheetPool:
+    """
+    Process-wide Google Sheets connection.
+
+    Decodes the service account once, keeps one authorized gspread client,
+    one spreadsheet handle and a registry of worksheet handles keyed by
+    (username, title). Tokens are refreshed in place when they expire, so
+    reruns only pay for the data calls themselves. Every Sheets API request
+    goes through `governor` (quota pacing, 429/5xx retries, and coalescing
+    of identical concurrent reads).
+    """
+
+    def __init__(self, sa_b64, sheet_id, governor=None):
+        creds_info = json.loads(base64.b64decode(sa_b64).decode("utf-8"))
+        self._creds = Credentials.from_service_account_info(creds_info, scopes=SCOPES)
+        self._sheet_id = sheet_id
+        self._client = None
+        self._spreadsheet = None
+        self._handles = {}
+        self._lock = threading.RLock()  # guards the cached handles only, never held over a request
+        self._key_locks = {}  # (username, title) -> lock so a worksheet is opened or created once
+        self.governor = governor or Governor()
+
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                with span("sheets.authorize"):
+                    self._client = gspread.authorize(self._creds)
+            elif not self._creds.valid:
+                # Refresh the shared token instead of building a new client
+                with span("sheets.token_refresh"):
+                    self._creds.refresh(Request())
+            return self._client
+
+    def spreadsheet(self):
+        client = self.client()
+        with self._lock:
+            if self._spreadsheet is not None:
+                return self._spreadsheet
+        # Concurrent first opens share one call
+        with span("sheets.open_spreadsheet"):
+            sh = self.governor.run("read", lambda: client.open_by_key(self._sheet_id), key=("spreadsheet",))
+        with self._lock:
+            if self._spreadsheet is None:
+                self._spreadsheet = sh
+            return self._spreadsheet
+
+    def titles(self):
+        """Titles of every worksheet in the spreadsheet (one metadata call)."""
+        with span("sheets.list_worksheets"):
+            sh = self.spreadsheet()
+            return self.governor.run("read", lambda: [ws.title for ws in sh.worksheets()], key=("titles",))
+
+    def worksheet(self, username, title, header, rows="1000", cols="20"):
+        """Return the cached handle for `title`, creating the worksheet if missing."""
+        key = (username, title)
+        with self._lock:
+            ws = self._handles.get(key)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        if ws is not None:
+            self.client()
+            return ws
+        sh = self.spreadsheet()
+        with key_lock:
+            # Another session may have opened it while this one waited
+            with self._lock:
+                ws = self._handles.get(key)
+            if ws is not None:
+                return ws
+            with span("sheets.open_worksheet"):
+                try:
+                    ws = self.governor.run("read", lambda: sh.worksheet(title))
+                except gspread.WorksheetNotFound:
+                    ws = self.governor.run("write", lambda: sh.add_worksheet(title=title, rows=rows, cols=cols))
+                    self.governor.run("write", lambda: ws.append_row(header))
+            with self._lock:
+                self._handles[key] = ws
+            return ws
+
+    def drop(self, username, title=None):
+        """Forget cached handles for a user (or one of their worksheets)."""
+        with self._lock:
+            for key in list(self._handles):
+                if key[0] == username and (title is None or key[1] == title):
+                    del self._handles[key]
+
+    def call(self, username, title, header, fn, rows="1000", cols="20", kind="write", key=None):
+        """
+        Run fn(ws) against the cached worksheet as a governed `kind` request
+        ("read" or "write"; reads with a `key` are coalesced). If the worksheet
+        was deleted behind our back the handle is dropped and the call retried once.
+        """
+        ws = self.worksheet(username, title, header, rows, cols)
+        try:
+            return self.governor.run(kind, lambda: fn(ws), key)
+        except Exception as e:
+            if not is_stale_handle_error(e):
+                raise
+            self.drop(username, title)
+            ws = self.worksheet(username, title, header, rows, cols)
+            return self.governor.run(kind, lambda: fn(ws), key)
+
+    def rows_from(self, username, title, header, start_row, rows="1000", cols="20", width=None):
+        """
+        Values from 1-based `start_row` to the last row, one list per row,
+        limited to the first `width` columns (all of `header` by default).
+        """
+        last_col = gspread.utils.rowcol_to_a1(1, width or len(header))[:-1]
+        rng = f"A{start_row}:{last_col}"
+        with span("sheets.read"):
+            return self.call(
+                username, title, header, lambda ws: ws.get_values(rng), rows, cols,
+                kind="read", key=("rows", title, rng),
+            )
@@ -0,0 +1,181 @@
+"""
+Local "similar jobs" search.
+
+Each job's skills list and description are hashed into a fixed-width,
+L2-normalised float32 vector once (signed feature hashing of words and
+word pairs, sublinear tf). Vectors are appended to a per-user file and
+memory-mapped, so a query is a single matrix-vector product. IDF is
+applied on the query side from per-bucket document counts, which keeps
+stored rows immutable as the history grows.
+"""
+import math
+import os
+import re
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+from incremental import IncrementalIndex, UserRegistry
+from search_index import tokenize
+
+DIM = 512
+SKILL_WEIGHT = 3.0
+
+
+def _bucket(feature, dim):
+    h = zlib.crc32(feature.encode("utf-8"))
+    return h % dim, (1.0 if h >> 31 else -1.0)
+
+
+def vectorize(skills, description, dim=DIM):
+    """Hashed, sublinear-tf, unit-length vector for one job."""
+    counts = defaultdict(float)
+    for tok in tokenize(skills):
+        counts[tok] += SKILL_WEIGHT
+    words = tokenize(description)
+    for tok in words:
+        counts[tok] += 1.0
+    for a, b in zip(words, words[1:]):
+        counts[f"{a} {b}"] += 1.0
+    vec = np.zeros(dim, dtype=np.float32)
+    for feature, tf in counts.items():
+        i, sign = _bucket(feature, dim)
+        vec[i] += sign * (1.0 + math.log(tf))
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+class VectorIndex(IncrementalIndex):
+    """
+    One user's job vectors: `<name>.f32` (n x dim) and `<name>.keys` (int64 Row Keys).
+    Only the frame position is reset on a rebuild; persisted vectors are kept.
+    """
+
+    def __init__(self, directory, username, dim=DIM):
+        super().__init__()
+        self.dim = dim
+        name = re.sub(r"[^\w.-]", "_", username)
+        self.vec_path = os.path.join(directory, f"{name}.f32")
+        self.key_path = os.path.join(directory, f"{name}.keys")
+        self._load()
+
+    def _load(self):
+        keys = np.fromfile(self.key_path, dtype=np.int64) if os.path.exists(self.key_path) else np.empty(0, np.int64)
+        size = os.path.getsize(self.vec_path) if os.path.exists(self.vec_path) else 0
+        # A write cut short leaves the two files out of step; trust the shorter one
+        n = min(len(keys), size // (4 * self.dim))
+        self.keys = keys[:n]
+        self.positions = {int(k): i for i, k in enumerate(self.keys)}
+        self._map(n)
+        self.doc_freq = np.zeros(self.dim, dtype=np.float64)
+        for start in range(0, n, 10000):
+            self.doc_freq += (self.matrix[start:start + 10000] != 0).sum(axis=0)
+
+    def _map(self, n):
+        if n:
+            self.matrix = np.memmap(self.vec_path, dtype=np.float32, mode="r", shape=(n, self.dim))
+        else:
+            self.matrix = np.empty((0, self.dim), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, items, replace=False):
+        """
+        Vectorise and persist (row key, skills, description) items. Keys already
+        stored are skipped, or rewritten in place with replace=True (a row whose
+        skills were filled in later).
+        """
+        new_keys, vecs, seen, rewritten = [], [], set(), 0
+        for key, skills, description in items:
+            key = int(key)
+            if key in seen:
+                continue
+            seen.add(key)
+            if key in self.positions:
+                if replace:
+                    self._rewrite(self.positions[key], vectorize(skills, description, self.dim))
+                    rewritten += 1
+                continue
+            new_keys.append(key)
+            vecs.append(vectorize(skills, description, self.dim))
+        if not new_keys:
+            return rewritten
+        block = np.vstack(vecs)
+        os.makedirs(os.path.dirname(self.vec_path) or ".", exist_ok=True)
+        # Vectors go first so a crash never leaves a key without its row
+        with open(self.vec_path, "ab") as f:
+            f.write(block.tobytes())
+        with open(self.key_path, "ab") as f:
+            f.write(np.asarray(new_keys, dtype=np.int64).tobytes())
+        start = len(self.keys)
+        self.keys = np.concatenate([self.keys, np.asarray(new_keys, dtype=np.int64)])
+        for i, key in enumerate(new_keys, start=start):
+            self.positions[key] = i
+        self.doc_freq += (block != 0).sum(axis=0)
+        self._map(len(self.keys))
+        return len(new_keys) + rewritten
+
+    def _rewrite(self, pos, vec):
+        # Rows are fixed width, so one vector can be overwritten where it is
+        old = np.array(self.matrix[pos])
+        with open(self.vec_path, "r+b") as f:
+            f.seek(pos * 4 * self.dim)
+            f.write(vec.astype(np.float32).tobytes())
+        self.doc_freq += (vec != 0).astype(np.float64) - (old != 0)
+        self._map(len(self.keys))
+
+    def fold(self, new, start, load_text):
+        """Vectorise frame rows that were written elsewhere (other sessions, imports, older data)."""
+        missing = [int(k) for k in new["Row Key"] if int(k) not in self.positions]
+        if missing:
+            texts = load_text(missing)
+            skills = dict(zip(new["Row Key"].astype("int64"), new["Top Skills List"].astype(str)))
+            self.add((k, skills.get(k, ""), texts.get(k, "")) for k in missing)
+
+    def idf(self):
+        n = len(self.keys)
+        return (np.log((1.0 + n) / (1.0 + self.doc_freq)) + 1.0).astype(np.float32)
+
+    def top_k(self, query, k=10, exclude=None):
+        """[(row key, score)] best first, by cosine against the idf-weighted query."""
+        if not len(self.keys) or not query.any():
+            return []
+        scores = self.matrix @ (query * self.idf())
+        if exclude is not None and int(exclude) in self.positions:
+            scores[self.positions[int(exclude)]] = -np.inf
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(self.keys[i]), float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+
+class SimilarJobs(UserRegistry):
+    """Process-wide VectorIndex per user."""
+
+    def __init__(self, directory, dim=DIM):
+        super().__init__(lambda username: VectorIndex(directory, username, dim))
+        self.directory = directory
+        self.dim = dim
+
+    def add(self, username, items, replace=False):
+        idx = self._index(username)
+        with idx.lock:
+            return idx.add(items, replace)
+
+    def similar_to(self, username, df, load_text, key, k=10):
+        idx = self._index(username)
+        with idx.lock:
+            idx.sync(df, load_text)
+            pos = idx.positions.get(int(key))
+            if pos is None:
+                return []
+            return idx.top_k(np.array(idx.matrix[pos]), k, exclude=key)
+
+    def drop(self, username):
+        """Forget the user's vectors, files included."""
+        idx = super().drop(username)
+        for path in (idx.vec_path, idx.key_path) if idx else ():
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def pad_row(row, width):
+    """Sheets trims trailing empty cells; put them back so rows line up with the header."""
+    row = list(row[:width])
+    return row + [""] * (width - len(row))
+
+
+def concat_frames(a, b):
+    """Append frame b to a, keeping categorical columns categorical."""
+    if a is None or not len(a):
+        return b
+    out = pd.concat([a, b], ignore_index=True)
+    for col in a.columns:
+        if isinstance(a[col].dtype, pd.CategoricalDtype) and not isinstance(out[col].dtype, pd.CategoricalDtype):
+            out[col] = out[col].astype("category")
+    return out
+
+
+class Snapshot:
+    def __init__(self, header, build=None):
+        self.header = list(header)
+        self.build = build or (lambda rows: pd.DataFrame(rows, columns=self.header))
+        self.n_rows = 0
+        self.synced_at = 0.0
+        self.stale = True
+        self.nbytes = 0
+        self._df = None
+
+    def extend(self, new_rows):
+        if not new_rows:
+            return
+        width = len(self.header)
+        chunk = self.build([pad_row(r, width) for r in new_rows])
+        self._df = concat_frames(self._df, chunk)
+        self.n_rows += len(new_rows)
+        self.nbytes += int(chunk.memory_usage(deep=True).sum())
+
+    def frame(self):
+        if self._df is None:
+            self._df = self.build([])
+        # Shallow copy: callers may add/replace columns without touching the shared frame
+        return self._df.copy(deep=False)
+
+
+class SnapshotStore:
+    """
+    Per-user, per-worksheet in-memory copy of sheet rows shared by every tab
+    and session in the process.
+
+    A read within `ttl` seconds of the last sync is served from memory.
+    Otherwise only rows past the last known row are fetched and appended.
+    Snapshots idle for `idle_ttl` seconds are dropped, and the least recently
+    used ones are evicted once the total size passes `max_bytes`.
+    """
+
+    def __init__(self, ttl=60, idle_ttl=1800, max_bytes=200 * 1024 * 1024):
+        self.ttl = ttl
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+        self._snaps = OrderedDict()
+        self._used_at = {}
+        # Store lock guards the dicts only; fetches and builds run under a per-worksheet lock
+        self._lock = threading.RLock()
+        self._key_locks = {}
+
+    def read(self, username, title, header, fetch_rows, build=None, ttl=None):
+        """
+        Return a DataFrame for the worksheet. `fetch_rows(start_row)` must
+        return the sheet rows from 1-based row `start_row` to the end.
+        `build(rows)` turns raw rows into a frame chunk (plain DataFrame by default).
+        `ttl` overrides the store's TTL for this worksheet.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        key = (username, title)
+        with self._lock:
+            snap = self._snaps.get(key)
+            if snap is None or snap.header != list(header):
+                snap = Snapshot(header, build)
+                self._snaps[key] = snap
+            self._snaps.move_to_end(key)
+            self._used_at[key] = time.time()
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            now = time.time()
+            if snap.stale or now - snap.synced_at > ttl:
+                # Cleared before the fetch, so a mark_stale() that lands meanwhile is kept
+                snap.stale = False
+                try:
+                    # Row 1 is the header, data starts at row 2
+                    rows = fetch_rows(snap.n_rows + 2)
+                except BaseException:
+                    snap.stale = True
+                    raise
+                snap.extend(rows)
+                snap.synced_at = now
+            df = snap.frame()
+
+        with self._lock:
+            self._evict(time.time())
+        return df
+
+    def mark_stale(self, username, title):
+        """Force the next read to pick up newly appended rows."""
+        with self._lock:
+            snap = self._snaps.get((username, title))
+            if snap is not None:
+                snap.stale = True
+
+    def invalidate(self, username, title=None):
+        """Drop snapshots entirely so the next read is a full fetch."""
+        with self._lock:
+            for key in list(self._snaps):
+                if key[0] == username and (title is None or key[1] == title):
+                    del self._snaps[key]
+                    self._used_at.pop(key, None)
+
+    def _evict(self, now):
+        for key in list(self._snaps):
+            if now - self._used_at.get(key, 0) > self.idle_ttl:
+                del self._snaps[key]
+                self._used_at.pop(key, None)
+        total = sum(s.nbytes for s in self._snaps.values())
+        # Oldest first; always keep the snapshot that was just read
+        while total > self.max_bytes and len(self._snaps) > 1:
+            key, snap = self._snaps.popitem(last=False)
+            self._used_at.pop(key, None)
+            total -= snap.nbytes
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from aggregates import JobAggregates  # noqa: E402
+from enrich_workers import ENRICHING  # noqa: E402
+
+NOW = datetime(2024, 6, 30, 12, 0, 0)
+
+
+def frame(rows):
+    df = pd.DataFrame(rows, columns=["Row Key", "Timestamp", "Company", "Top Skills List"])
+    df["Timestamp"] = pd.to_datetime(df["Timestamp"])
+    return df
+
+
+ROWS = [
+    (1, "2024-05-31 12:00:00", "Acme", "Python, SQL"),  # exactly 30 days back
+    (2, "2024-05-31 11:59:59", "Acme", "Python"),  # one second too old for the 30-day window
+    (3, "2024-06-23 12:00:00", "Globex", "Go"),  # exactly 7 days back
+    (4, "2024-06-29 12:00:00", "Initech", "SQL"),  # exactly 1 day back
+    (5, "2024-06-30 11:00:00", ENRICHING, ENRICHING),
+]
+
+
+def test_window_boundaries_are_inclusive():
+    agg = JobAggregates()
+    agg.sync(frame(ROWS))
+    assert agg.window_counts(now=NOW) == {1: 2, 7: 3, 30: 4}
+
+
+def test_rows_still_enriching_count_by_date_only():
+    agg = JobAggregates()
+    agg.sync(frame(ROWS))
+    assert agg.top_companies().to_dict() == {"Acme": 2, "Globex": 1, "Initech": 1}
+    assert agg.skill_freq() == {"Python": 2, "SQL": 2, "Go": 1}
+    assert agg.jobs_per_day().sum() == 5
+
+
+def test_out_of_order_rows_keep_the_timestamps_sorted():
+    agg = JobAggregates()
+    agg.sync(frame(ROWS[2:]))
+    agg.sync(frame(ROWS[2:] + ROWS[:2]))
+    assert agg.timestamps == sorted(agg.timestamps)
+    assert agg.window_counts(now=NOW) == {1: 2, 7: 3, 30: 4}
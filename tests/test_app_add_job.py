@@ -0,0 +1,71 @@
+import base64
+import os
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from bench.fakes import FakeGspreadClient, Faults  # noqa: E402
+from bench.harness import ROOT, USER, fake_backends  # noqa: E402
+from bench.synthetic import make_jobs  # noqa: E402
+from schema import JOB_HEADER  # noqa: E402
+
+LINK = "https://example.com/jobs/new-1"
+DESCRIPTION = "A brand new posting about Rust and Kubernetes. " * 5
+
+
+@pytest.fixture
+def app(tmp_path):
+    import streamlit as st
+
+    st.cache_resource.clear()
+    faults = Faults()
+    gclient = FakeGspreadClient(faults)
+    gclient.spreadsheet.seed(USER, JOB_HEADER, make_jobs(20))
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60)
+    at.secrets["OPENAI_API_KEY"] = at.secrets["APP_PASSWORD"] = at.secrets["GSHEET_ID"] = "test"
+    at.secrets["GCP_SA_B64"] = base64.b64encode(b"{}").decode()
+    for name in ("WRITE_JOURNAL", "LLM_CACHE_PATH", "DESCRIPTION_STORE_PATH", "ARCHIVE_DIR", "VECTOR_DIR",
+                 "ENRICH_JOURNAL"):
+        at.secrets[name] = str(tmp_path / name.lower())
+    at.secrets["SHEETS_READS_PER_MIN"] = at.secrets["SHEETS_WRITES_PER_MIN"] = 10 ** 6
+    at.session_state["authenticated"] = True
+    at.session_state["username"] = USER
+    with fake_backends(faults, gclient):
+        yield at.run()
+    st.cache_resource.clear()
+
+
+def submit(at, link, description):
+    at.text_input(key="job_link_input").set_value(link)
+    at.text_area(key="job_desc_input").set_value(description)
+    return next(b for b in at.button if b.label == "Add to Tracker").click().run()
+
+
+def added(at):
+    return not at.exception and any(s.value.startswith("Job added!") for s in at.success)
+
+
+def test_submit_clears_the_form(app):
+    at = submit(app, LINK, DESCRIPTION)
+    assert added(at)
+    assert at.text_input(key="job_link_input").value == ""
+    assert at.text_area(key="job_desc_input").value == ""
+
+
+def test_add_anyway_after_a_duplicate_warning(app):
+    submit(app, LINK, DESCRIPTION)
+    at = submit(app, LINK, DESCRIPTION)
+    assert any("already track" in w.value for w in at.warning)
+    at = next(b for b in at.button if b.label == "Add anyway").click().run()
+    assert added(at)
+    assert at.text_input(key="job_link_input").value == ""
+
+
+def test_clear_form(app):
+    app.text_input(key="job_link_input").set_value(LINK)
+    at = next(b for b in app.button if b.label == "Clear Form").click().run()
+    assert not at.exception
+    assert at.text_input(key="job_link_input").value == ""
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+import retry
+from bulk_import import normalize_timestamp, parse_pasted, parse_upload, run_import
+
+
+def enrich(link, description):
+    return {"company": "Acme", "skills_list": "Python, SQL", "skills_detail": ""}
+
+
+def test_parse_upload_csv_with_column_aliases():
+    data = (
+        "URL,Description,Date\n"
+        "https://jobs.example.com/1,Build pipelines,2024-03-05\n"
+        ",No link here,03/06/2024\n"
+    ).encode("utf-8-sig")
+    assert parse_upload("jobs.csv", data) == [
+        {"Job Link": "https://jobs.example.com/1", "Job Description": "Build pipelines",
+         "Timestamp": "2024-03-05 00:00:00"},
+        {"Job Link": "", "Job Description": "No link here", "Timestamp": "2024-03-06 00:00:00"},
+    ]
+
+
+def test_parse_upload_jsonl():
+    data = "\n".join(json.dumps(r) for r in (
+        {"job link": "https://jobs.example.com/2", "job description": "Write Go"},
+        {"desc": "Only a description"},
+    )).encode()
+    postings = parse_upload("jobs.jsonl", data)
+    assert [p["Job Link"] for p in postings] == ["https://jobs.example.com/2", ""]
+    assert [p["Timestamp"] for p in postings] == ["", ""]
+
+
+def test_unreadable_dates_are_kept_as_given():
+    assert normalize_timestamp("last tuesday") == "last tuesday"
+
+
+def test_parse_pasted_splits_blocks_and_takes_a_leading_url():
+    postings = parse_pasted("https://jobs.example.com/3\nFirst posting\n---\nSecond posting\nline two\n---\n\n")
+    assert postings == [
+        {"Job Link": "https://jobs.example.com/3", "Job Description": "First posting", "Timestamp": ""},
+        {"Job Link": "", "Job Description": "Second posting\nline two", "Timestamp": ""},
+    ]
+
+
+def test_run_import_writes_in_batches_and_reports_failures():
+    batches = []
+    postings = [{"Job Link": f"https://jobs.example.com/{i}", "Job Description": f"job {i}", "Timestamp": ""}
+                for i in range(5)]
+    postings.insert(2, {"Job Link": "https://jobs.example.com/empty", "Job Description": "", "Timestamp": ""})
+    written, errors = run_import(postings, enrich, batches.append, concurrency=3, batch_size=2)
+    assert written == 5
+    assert sorted(len(b) for b in batches) == [1, 2, 2]
+    assert errors == [{"Row": 3, "Job Link": "https://jobs.example.com/empty", "Error": "missing job description"}]
+
+
+def test_run_import_retries_rate_limits_and_reports_bad_replies(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda s: None)
+
+    class RateLimitError(Exception):
+        pass
+
+    calls = []
+
+    def flaky(link, description):
+        calls.append(link)
+        if link == "limited" and calls.count(link) < 3:
+            raise RateLimitError("429")
+        if link == "bad":
+            return {"company": "", "skills_list": "Error: no skills", "skills_detail": ""}
+        return enrich(link, description)
+
+    rows = []
+    postings = [{"Job Link": link, "Job Description": "text", "Timestamp": "2024-01-01 09:00:00"}
+                for link in ("limited", "bad")]
+    written, errors = run_import(postings, flaky, rows.extend, concurrency=1)
+    assert written == 1 and calls.count("limited") == 3
+    assert rows[0]["Timestamp"] == "2024-01-01 09:00:00"
+    assert errors == [{"Row": 2, "Job Link": "bad", "Error": "no skills"}]
+
+
+def test_linkless_postings_imported_together_get_distinct_row_keys():
+    pytest.importorskip("pandas")
+    from job_frame import row_key
+
+    rows = []
+    postings = parse_pasted("First posting\n---\nSecond posting\n---\nThird posting")
+    written, errors = run_import(postings, enrich, rows.extend, concurrency=3)
+    assert written == 3 and not errors
+    assert len({row_key(r["Timestamp"], r["Job Link"], r["Job Description"]) for r in rows}) == 3
@@ -0,0 +1,30 @@
+import pytest
+
+from company_rules import CONFIDENCE_THRESHOLD, extract_company, from_ats_url, from_company_line, slug_to_name
+
+
+@pytest.mark.parametrize("link, company", [
+    ("https://boards.greenhouse.io/acme-robotics/jobs/123", "Acme Robotics"),
+    ("https://jobs.lever.co/acme/0b5f3c4e-1a2b-4c3d-8e9f-0a1b2c3d4e5f", "Acme"),
+    ("https://ibm.wd5.myworkdayjobs.com/External/job/X_R1", "IBM"),
+    ("https://www.linkedin.com/jobs/view/123", None),
+])
+def test_from_ats_url(link, company):
+    guess = from_ats_url(link)
+    assert (guess["company"] if guess else None) == company
+
+
+def test_company_line():
+    assert from_company_line("Role: Data Engineer\nCompany: Acme, Inc.\n")["company"] == "Acme"
+
+
+def test_organization_line_is_not_a_company():
+    text = "Organization: Data Platform team\nWe build pipelines."
+    assert from_company_line(text) is None
+    guess = extract_company("https://www.linkedin.com/jobs/view/123", text)
+    assert guess is None or guess["confidence"] < CONFIDENCE_THRESHOLD
+
+
+def test_slug_to_name():
+    assert slug_to_name("acme-robotics") == "Acme Robotics"
+    assert slug_to_name("ibm") == "IBM"
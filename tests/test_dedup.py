@@ -0,0 +1,29 @@
+import pytest
+
+from dedup import canonicalize_link
+
+
+@pytest.mark.parametrize("url, key", [
+    ("https://www.linkedin.com/jobs/view/3812345678/?trk=abc", "linkedin:3812345678"),
+    ("https://www.linkedin.com/jobs/view/data-engineer-at-acme-3812345678", "linkedin:3812345678"),
+    ("https://www.linkedin.com/jobs/search/?currentJobId=3812345678&keywords=data", "linkedin:3812345678"),
+    ("https://boards.greenhouse.io/Acme/jobs/4455?gh_src=x", "greenhouse:acme:4455"),
+    ("https://boards.greenhouse.io/embed/job_app?for=acme&token=4455&gh_jid=4455", "greenhouse:acme:4455"),
+    ("https://acme.com/careers?gh_jid=4455", "greenhouse:acme.com:4455"),
+    ("https://jobs.lever.co/Acme/0b5f3c4e-1a2b-4c3d-8e9f-0a1b2c3d4e5f/apply",
+     "lever:acme:0b5f3c4e-1a2b-4c3d-8e9f-0a1b2c3d4e5f"),
+    ("https://acme.wd5.myworkdayjobs.com/en-US/Careers/job/Remote/Data-Engineer_R-12345", "workday:acme:r-12345"),
+])
+def test_ats_job_ids(url, key):
+    assert canonicalize_link(url) == key
+
+
+def test_tracking_parameters_and_trailing_slash_are_ignored():
+    a = canonicalize_link("https://www.acme.com/jobs/42/?utm_source=x&ref=feed&id=7")
+    b = canonicalize_link("acme.com/jobs/42?id=7")
+    assert a == b == "url:acme.com/jobs/42?id=7"
+
+
+def test_empty_link():
+    assert canonicalize_link("") == ""
+    assert canonicalize_link(None) == ""
@@ -0,0 +1,112 @@
+import time
+
+from enrich_workers import EnrichmentWorkers, RowNotSaved
+
+RESULT = {"company": "Acme", "skills_list": "Python, SQL", "skills_detail": "", "stats": None}
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+def make_workers(tmp_path, enrich_fn=lambda link, desc: RESULT, patch_fn=lambda *args: None, **kwargs):
+    kwargs.setdefault("base", 0.0)
+    kwargs.setdefault("interval", 0.01)
+    return EnrichmentWorkers(str(tmp_path / "enrich.jsonl"), enrich_fn, patch_fn, **kwargs)
+
+
+def wait_until(check, timeout=5.0):
+    deadline = time.time() + timeout
+    while not check():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_patches_the_row(tmp_path):
+    patched = []
+    workers = make_workers(tmp_path, patch_fn=lambda *args: patched.append(args))
+    workers.submit("alice", "alice", "2024-01-01 00:00:00", "https://x/1", "desc")
+    wait_until(lambda: workers.stats("alice")["done"] == 1)
+    assert patched == [("alice", "alice", "2024-01-01 00:00:00", "https://x/1", "desc", RESULT)]
+    assert workers.stats("alice")["pending"] == 0
+
+
+def test_non_retryable_error_fails_at_once(tmp_path):
+    attempts = []
+
+    def patch(*args):
+        attempts.append(1)
+        raise LookupError("row not found")
+
+    workers = make_workers(tmp_path, patch_fn=patch)
+    workers.submit("alice", "alice", "ts", "https://x/1", "desc")
+    wait_until(lambda: workers.stats("alice")["failed"] == 1)
+    stats = workers.stats("alice")
+    assert len(attempts) == 1 and stats["pending"] == 0
+    assert stats["failed_error"] == "LookupError: row not found"
+
+
+def test_retryable_errors_stop_after_max_attempts(tmp_path):
+    attempts = []
+
+    def enrich(link, desc):
+        attempts.append(1)
+        raise RateLimited("slow down")
+
+    workers = make_workers(tmp_path, enrich_fn=enrich, max_attempts=3)
+    workers.submit("alice", "alice", "ts", "https://x/1", "desc")
+    wait_until(lambda: workers.stats("alice")["failed"] == 1)
+    time.sleep(0.05)
+    assert len(attempts) == 3
+
+
+def test_row_not_saved_is_retried(tmp_path):
+    attempts = []
+
+    def patch(*args):
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RowNotSaved("queued")
+
+    workers = make_workers(tmp_path, patch_fn=patch)
+    workers.submit("alice", "alice", "ts", "https://x/1", "desc")
+    wait_until(lambda: workers.stats("alice")["done"] == 1)
+    assert len(attempts) == 3 and workers.stats("alice")["failed"] == 0
+
+
+def test_error_results_are_not_written(tmp_path):
+    patched = []
+    workers = make_workers(
+        tmp_path, enrich_fn=lambda link, desc: {**RESULT, "skills_list": "Error: bad key"},
+        patch_fn=lambda *args: patched.append(args),
+    )
+    workers.submit("alice", "alice", "ts", "https://x/1", "desc")
+    wait_until(lambda: workers.stats("alice")["failed"] == 1)
+    assert patched == []
+
+
+def test_failed_tasks_survive_restart_and_can_be_retried(tmp_path):
+    broken = [True]
+
+    def patch(*args):
+        if broken[0]:
+            raise LookupError("row not found")
+
+    workers = make_workers(tmp_path, patch_fn=patch)
+    workers.submit("alice", "alice", "ts", "https://x/1", "desc")
+    wait_until(lambda: workers.stats("alice")["failed"] == 1)
+
+    restarted = make_workers(tmp_path, patch_fn=patch)
+    assert restarted.failed("alice") == [("ts", "https://x/1", "LookupError: row not found")]
+    broken[0] = False
+    assert restarted.retry_failed("alice") == 1
+    wait_until(lambda: restarted.stats("alice")["done"] == 1)
+    assert restarted.stats("alice")["failed"] == 0
+
+
+def test_dismiss_failed(tmp_path):
+    workers = make_workers(tmp_path, patch_fn=lambda *args: (_ for _ in ()).throw(LookupError("gone")))
+    workers.submit("alice", "alice", "ts", "https://x/1", "desc")
+    wait_until(lambda: workers.stats("alice")["failed"] == 1)
+    assert workers.dismiss_failed("alice") == 1
+    assert make_workers(tmp_path).failed("alice") == []
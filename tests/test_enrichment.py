@@ -0,0 +1,33 @@
+from bench.fakes import Faults, FakeOpenAI
+from enrichment import enrich_job
+from llm_cache import LLMCache
+
+DESCRIPTION = "Acme is hiring a data engineer.\nYou will build pipelines in Python and SQL on AWS."
+
+
+def test_one_call_reports_latency_and_tokens():
+    result = enrich_job(FakeOpenAI(Faults()), "https://jobs.example.com/1", DESCRIPTION)
+    stats = result["stats"]
+    assert stats["calls"] == 1 and not stats["cached"] and not stats["fallback"]
+    assert stats["prompt_tokens"] > 0 and stats["completion_tokens"] > 0
+
+
+def test_cache_hit_reports_measured_savings(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.sqlite"))
+    client = FakeOpenAI(Faults())
+    first = enrich_job(client, "https://jobs.example.com/1", DESCRIPTION, cache=cache)
+    hit = enrich_job(client, "https://jobs.example.com/1", DESCRIPTION, cache=cache)
+    assert hit["stats"]["cached"] and hit["stats"]["calls"] == 0
+    assert hit["stats"]["saved_tokens"] == first["stats"]["prompt_tokens"] + first["stats"]["completion_tokens"]
+    assert 0.0 <= hit["stats"]["saved_s"] <= first["stats"]["latency_s"]
+    assert "cost" not in hit and hit["skills_list"] == first["skills_list"]
+
+
+def test_entries_without_a_recorded_cost_report_no_savings(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.sqlite"))
+    client = FakeOpenAI(Faults())
+    enrich_job(client, "https://jobs.example.com/1", DESCRIPTION, cache=cache)
+    (key,) = [k for (k,) in cache._db.execute("SELECT key FROM entries")]
+    cache.put(key, {"company": "Acme", "skills_list": "Python", "skills_detail": ""})
+    hit = enrich_job(client, "https://jobs.example.com/1", DESCRIPTION, cache=cache)
+    assert hit["stats"]["cached"] and "saved_s" not in hit["stats"]
@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from governor import Governor, TokenBucket
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def test_token_bucket_waits_once_the_burst_is_spent():
+    bucket = TokenBucket(60, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+
+
+def test_retries_retryable_errors():
+    governor = Governor(base=0.0)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise HTTPError(429)
+        return "ok"
+
+    assert governor.run("read", flaky) == "ok"
+    stats = governor.stats()
+    assert stats["retries"] == 2 and stats["calls"] == 3 and stats["failures"] == 0
+
+
+def test_does_not_retry_client_errors():
+    governor = Governor(base=0.0)
+
+    def forbidden():
+        raise HTTPError(403)
+
+    with pytest.raises(HTTPError):
+        governor.run("write", forbidden)
+    assert governor.stats()["calls"] == 1
+    assert governor.stats()["failures"] == 1
+
+
+def test_gives_up_after_retries():
+    governor = Governor(retries=2, base=0.0)
+
+    def down():
+        raise HTTPError(503)
+
+    with pytest.raises(HTTPError):
+        governor.run("read", down)
+    assert governor.stats()["calls"] == 3
+
+
+def test_concurrent_reads_with_the_same_key_share_one_call():
+    governor = Governor()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def read():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return ["row"]
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(governor.run("read", read, key=("rows",))))
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(governor.run("read", read, key=("rows",))))
+    follower.start()
+    while not governor.stats()["coalesced"]:
+        pass
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert len(calls) == 1
+    assert results == [["row"], ["row"]]
+    assert governor.stats()["in_flight_reads"] == 0
+
+
+def test_writes_are_never_coalesced():
+    governor = Governor()
+    calls = []
+    governor.run("write", lambda: calls.append(1), key=("same",))
+    governor.run("write", lambda: calls.append(1), key=("same",))
+    assert len(calls) == 2 and governor.stats()["coalesced"] == 0
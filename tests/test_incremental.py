@@ -0,0 +1,47 @@
+import pytest
+
+from incremental import IncrementalIndex, UserRegistry
+
+
+class Collector(IncrementalIndex):
+    def reset(self):
+        super().reset()
+        self.rows = []
+        self.resets = getattr(self, "resets", -1) + 1
+
+    def fold(self, new, start):
+        self.rows.extend((pos, int(k)) for pos, k in enumerate(new["Row Key"], start=start))
+
+
+def test_registry_builds_once_per_user_and_drops():
+    built = []
+    reg = UserRegistry(lambda username: built.append(username) or object())
+    a = reg._index("alice")
+    assert reg._index("alice") is a
+    assert reg.drop("alice") is a
+    assert reg.drop("alice") is None
+    assert reg._index("alice") is not a
+    assert built == ["alice", "alice"]
+
+
+def test_sync_folds_only_the_new_tail():
+    pd = pytest.importorskip("pandas")
+    idx = Collector()
+    idx.sync(pd.DataFrame({"Row Key": [10, 11]}))
+    idx.sync(pd.DataFrame({"Row Key": [10, 11]}))
+    idx.sync(pd.DataFrame({"Row Key": [10, 11, 12]}))
+    assert idx.rows == [(0, 10), (1, 11), (2, 12)]
+    assert idx.resets == 0
+
+
+def test_sync_rebuilds_when_the_frame_no_longer_lines_up():
+    pd = pytest.importorskip("pandas")
+    idx = Collector()
+    idx.sync(pd.DataFrame({"Row Key": [10, 11, 12]}))
+    # Row at the old boundary changed (a row was deleted and another appended)
+    idx.sync(pd.DataFrame({"Row Key": [10, 12, 13]}))
+    assert idx.rows == [(0, 10), (1, 12), (2, 13)]
+    # Frame got shorter
+    idx.sync(pd.DataFrame({"Row Key": [10]}))
+    assert idx.rows == [(0, 10)]
+    assert idx.resets == 2
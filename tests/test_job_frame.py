@@ -0,0 +1,15 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+from job_frame import row_key  # noqa: E402
+
+
+def test_row_key_ignores_description_when_there_is_a_link():
+    assert row_key("2024-05-01 10:00:00", "https://x.test/1", "a") == row_key("2024-05-01 10:00:00", "https://x.test/1")
+
+
+def test_linkless_rows_in_the_same_second_get_distinct_keys():
+    keys = {row_key("2024-05-01 10:00:00", "", text) for text in ("first posting", "second", "third")}
+    assert len(keys) == 3
+    assert row_key("2024-05-01 10:00:00", "", "first posting") == row_key("2024-05-01 10:00:00", "", "first posting")
@@ -0,0 +1,70 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from join_index import JoinIndex, normalize_company  # noqa: E402
+
+JOBS = pd.DataFrame({
+    "Row Key": [1, 2, 3],
+    "Timestamp": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"]),
+    "Job Link": [
+        "https://www.linkedin.com/jobs/view/111/?trk=abc",
+        "https://boards.greenhouse.io/acme/jobs/222",
+        "https://boards.greenhouse.io/acme/jobs/333",
+    ],
+    "Company": ["Initech", "Acme, Inc.", "ACME"],
+})
+
+CONTACTS = pd.DataFrame({
+    "Timestamp": ["2024-01-05", "2024-02-03", "2024-02-10"],
+    "Job Role": ["Engineer", "Manager", "Recruiter"],
+    "Company": ["Initech LLC", "acme", "Globex"],
+    "Job Link": ["https://linkedin.com/jobs/view/111", "", ""],
+    "People Contacted": ["Ann", "Bob", "Cy"],
+})
+
+
+def index():
+    idx = JoinIndex()
+    idx.sync_jobs(JOBS)
+    idx.sync_contacts(CONTACTS)
+    return idx
+
+
+@pytest.mark.parametrize("name, key", [
+    ("Acme, Inc.", "acme"),
+    ("ACME inc", "acme"),
+    ("Globex Corporation", "globex"),
+    ("Acme Co., Ltd.", "acme"),
+    ("Co-op Bank", "co op bank"),
+    ("The Co-operative Group", "the co operative group"),
+    ("Costco Wholesale", "costco wholesale"),
+    ("Inc Magazine", "inc magazine"),
+    ("Unknown", ""),
+    ("", ""),
+])
+def test_normalize_company(name, key):
+    assert normalize_company(name) == key
+
+
+def test_contacts_match_jobs_on_the_canonical_link_first():
+    assert index().contacts_for_job(JOBS["Job Link"][0], "Initech") == (1, "2024-01-05", "link")
+
+
+def test_company_is_the_fallback_key():
+    assert index().contacts_for_job(JOBS["Job Link"][1], "Acme, Inc.") == (1, "2024-02-03", "company")
+    assert index().contacts_for_job("https://jobs.example.com/9", "Hooli") == (0, None, None)
+
+
+def test_applied_on_reports_the_latest_matching_job():
+    ts, how = index().applied_on("", "Acme")
+    assert (ts, how) == (pd.Timestamp("2024-03-01"), "company")
+    assert index().applied_on("", "Globex") == (None, None)
+
+
+def test_added_rows_are_not_counted_twice_after_a_sync():
+    idx = index()
+    row = {"Timestamp": "2024-03-02", "Job Role": "Lead", "Company": "Globex", "Job Link": ""}
+    idx.add_contact(row)
+    idx.sync_contacts(pd.concat([CONTACTS, pd.DataFrame([row])], ignore_index=True))
+    assert idx.contacts_for_job("", "Globex")[0] == 2
@@ -0,0 +1,53 @@
+import json
+
+from journal import Journal
+
+
+def lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def add(i, **fields):
+    return {"op": "add", "id": i, **fields}
+
+
+def test_entries_survive_reopen(tmp_path):
+    path = str(tmp_path / "j.jsonl")
+    journal = Journal(path)
+    journal.add([add("a", row=[1]), add("b", row=[2]), add("c", row=[3])])
+    journal.done(["a"])
+    journal.park(["b"], "403")
+
+    reopened = Journal(path)
+    assert list(reopened.live) == ["c"]
+    assert reopened.parked == {"b": {**add("b", row=[2]), "error": "403"}}
+
+
+def test_retry_moves_parked_entries_back(tmp_path):
+    path = str(tmp_path / "j.jsonl")
+    journal = Journal(path)
+    journal.add([add("a")])
+    journal.park(["a"], "boom")
+    journal.retry(["a"])
+    assert journal.live == {"a": add("a")} and journal.parked == {}
+    assert Journal(path).live == {"a": add("a")}
+
+
+def test_compact_keeps_only_live_and_parked(tmp_path):
+    path = str(tmp_path / "j.jsonl")
+    journal = Journal(path)
+    journal.add([add("a"), add("b"), add("c")])
+    journal.done(["a"])
+    journal.park(["c"], "boom")
+    journal.compact()
+    assert lines(path) == [add("b"), add("c"), {"op": "park", "ids": ["c"], "error": "boom"}]
+
+
+def test_replays_older_ops_and_skips_a_torn_line(tmp_path):
+    path = tmp_path / "j.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for rec in (add("a"), add("b"), add("c"), {"op": "commit", "ids": ["a"]}, {"op": "done", "id": "b"}):
+            f.write(json.dumps(rec) + "\n")
+        f.write('{"op": "add", "id": "d"')
+    assert list(Journal(str(path)).live) == ["c"]
@@ -0,0 +1,38 @@
+import time
+
+from llm_cache import LLMCache, cache_key
+
+
+def test_cache_key_ignores_whitespace_case_and_tracking_params():
+    a = cache_key("https://jobs.example.com/1?utm_source=x", "Build  pipelines\nin Python", "m", "v1")
+    b = cache_key("https://JOBS.example.com/1/", "build pipelines in python", "m", "v1")
+    assert a == b
+    assert a != cache_key("https://jobs.example.com/1", "build pipelines in python", "m", "v2")
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = LLMCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    cache.put("a", {"n": 1})
+    time.sleep(0.01)
+    cache.put("b", {"n": 2})
+    time.sleep(0.01)
+    assert cache.get("a") == {"n": 1}  # "a" is now the most recently used
+    time.sleep(0.01)
+    cache.put("c", {"n": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1} and cache.get("c") == {"n": 3}
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_hit_and_miss_counters_survive_a_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = LLMCache(path)
+    assert cache.get("k") is None
+    cache.put("k", {"company": "Acme"})
+    assert cache.get("k") == {"company": "Acme"}
+    assert cache.get("k") == {"company": "Acme"}
+
+    stats = LLMCache(path).stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+    assert stats["hit_rate"] == 2 / 3
@@ -0,0 +1,33 @@
+from datetime import date
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from paging import page_count, page_for_date  # noqa: E402
+
+
+def stamps(days):
+    return pd.Series(pd.to_datetime([f"2024-01-{d:02d} 12:00:00" for d in days]))
+
+
+def test_page_count():
+    assert page_count(0, 25) == 1
+    assert page_count(25, 25) == 1
+    assert page_count(26, 25) == 2
+
+
+@pytest.mark.parametrize("day, page", [(1, 1), (3, 2), (5, 3), (31, 3)])
+def test_page_for_date_ascending(day, page):
+    # One row per day, two rows per page
+    assert page_for_date(stamps(range(1, 7)), date(2024, 1, day), True, 2) == page
+
+
+@pytest.mark.parametrize("day, page", [(6, 1), (4, 2), (1, 3), (31, 1)])
+def test_page_for_date_descending(day, page):
+    assert page_for_date(stamps(range(6, 0, -1)), date(2024, 1, day), False, 2) == page
+
+
+def test_page_for_date_skips_missing_timestamps():
+    ts = pd.concat([stamps([1, 2, 3]), pd.Series([pd.NaT])], ignore_index=True)
+    assert page_for_date(ts, date(2024, 2, 1), True, 1) == 3
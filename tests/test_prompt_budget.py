@@ -0,0 +1,30 @@
+import pytest
+
+from prompt_budget import _is_heading, _paragraphs, prepare_description
+
+
+@pytest.mark.parametrize("line, heading", [
+    ("Requirements", True),
+    ("What you'll do", True),
+    ("QUALIFICATIONS", True),
+    ("Relevant Experience", True),
+    ("Skills:", True),
+    ("About Acme", True),
+    ("$100k-$150k depending on experience", False),
+    ("Strong SQL skills", False),
+    ("- Experience with Airflow", False),
+])
+def test_is_heading(line, heading):
+    assert _is_heading(line, line.strip(" -")) is heading
+
+
+def test_body_line_mentioning_experience_does_not_end_a_boilerplate_section():
+    text = "Salary\n$100k-$150k depending on experience\n\nRequirements\n5 years of SQL"
+    assert _paragraphs(text) == [("priority", ["Requirements", "5 years of SQL"])]
+
+
+def test_priority_sections_are_kept_first_when_over_budget():
+    text = "About Acme\n" + "Acme sells things. " * 60 + "\n\nRequirements\n5 years of Python and SQL"
+    trimmed, info = prepare_description(text, budget=30)
+    assert info["truncated"]
+    assert "Requirements\n5 years of Python and SQL" in trimmed
@@ -0,0 +1,73 @@
+import pytest
+
+import retry
+from retry import backoff_delay, is_retryable, with_backoff
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class Response:
+    status_code = 503
+
+
+class APIError(Exception):
+    # gspread keeps the status on the response
+    response = Response()
+
+
+@pytest.mark.parametrize("error, retryable", [
+    (HTTPError(429), True),
+    (HTTPError(500), True),
+    (HTTPError(503), True),
+    (APIError(), True),
+    (RateLimitError(), True),
+    (HTTPError(403), False),
+    (HTTPError(None), False),
+    (ValueError("bad json"), False),
+])
+def test_is_retryable(error, retryable):
+    assert is_retryable(error) is retryable
+
+
+def test_backoff_delay_is_capped_and_jittered():
+    for attempt in range(10):
+        assert 0.5 * min(8.0, 2 ** attempt) <= backoff_delay(attempt, 1.0, 8.0) <= 1.5 * min(8.0, 2 ** attempt)
+
+
+def test_with_backoff(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda s: None)
+    attempts, retried = [], []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise HTTPError(429)
+        return "ok"
+
+    assert with_backoff(flaky, on_retry=retried.append) == "ok"
+    assert len(attempts) == 3 and len(retried) == 2
+
+
+def test_with_backoff_gives_up(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda s: None)
+    attempts = []
+
+    def down():
+        attempts.append(1)
+        raise HTTPError(503)
+
+    with pytest.raises(HTTPError):
+        with_backoff(down, retries=2)
+    assert len(attempts) == 3
+
+    with pytest.raises(ValueError):
+        with_backoff(lambda: attempts.append(1) or int("x"))
+    assert len(attempts) == 4
@@ -0,0 +1,55 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from search_index import JobIndex, tokenize  # noqa: E402
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["Row Key", "Top Skills List", "Job Description"])
+
+
+ROWS = [
+    (1, "Python, SQL", "Data engineering with Airflow"),
+    (2, "Java", "Backend services; some python scripting"),
+    (3, "Go, Kubernetes", "Platform team running Postgres"),
+]
+
+
+def index(rows=ROWS):
+    idx = JobIndex()
+    idx.sync(frame(rows))
+    return idx
+
+
+def test_tokenize_keeps_language_names():
+    assert tokenize("C++, C# and Node.js") == ["c++", "c#", "and", "node.js"]
+
+
+def test_terms_match_as_prefixes():
+    assert set(index().search("kube")) == {2}
+    assert set(index().search("post")) == {2}
+
+
+def test_all_terms_must_match():
+    assert index().search("python airflow") == [0]
+    assert index().search("python kubernetes") == []
+
+
+def test_a_skills_hit_outranks_a_description_hit():
+    assert index().search("python") == [0, 1]
+
+
+def test_new_rows_are_indexed_incrementally_and_descriptions_load_lazily():
+    idx = index()
+    loaded = []
+
+    def load_text(keys):
+        loaded.extend(keys)
+        return {4: "Rust embedded firmware"}
+
+    df = frame(ROWS + [(4, "C", "")]).drop(columns=["Job Description"])
+    idx.sync(df, load_text)
+    assert loaded == [4]
+    assert idx.search("firmware") == [3]
+    assert idx.search("airflow") == [0]
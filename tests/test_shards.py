@@ -0,0 +1,44 @@
+from datetime import date, datetime
+
+import pytest
+
+from shards import ShardCatalog, parse_shards
+
+
+TITLES = ["alice", "contacts_alice", "alice__20240301", "alice__20240101", "bob", "bob__20240201"]
+
+
+def catalog():
+    return ShardCatalog(lambda: TITLES)
+
+
+def test_parse_shards_orders_by_start_and_ignores_other_users():
+    shards = parse_shards("alice", TITLES)
+    assert [s.title for s in shards] == ["alice", "alice__20240101", "alice__20240301"]
+    assert shards[0].start is None and shards[1].start == date(2024, 1, 1)
+
+
+@pytest.mark.parametrize("since, expected", [
+    (None, ["alice", "alice__20240101", "alice__20240301"]),
+    (date(2024, 6, 1), ["alice__20240301"]),
+    (datetime(2024, 2, 15, 12), ["alice__20240101", "alice__20240301"]),
+    (date(2023, 6, 1), ["alice", "alice__20240101", "alice__20240301"]),
+    # Rows from the rollover day itself may still be in the older shard
+    (date(2024, 3, 2), ["alice__20240101", "alice__20240301"]),
+    (date(2024, 3, 3), ["alice__20240301"]),
+])
+def test_for_window(since, expected):
+    assert catalog().for_window("alice", since) == expected
+
+
+def test_for_window_without_shards_uses_the_user_sheet():
+    assert ShardCatalog(lambda: []).for_window("carol", date(2024, 1, 1)) == ["carol"]
+
+
+def test_roll_over_adds_an_active_shard_once_a_day():
+    created = []
+    cat = catalog()
+    title = cat.roll_over("bob", created.append, today=date(2024, 5, 1))
+    assert title == "bob__20240501" and cat.active("bob") == title
+    assert cat.roll_over("bob", created.append, today=date(2024, 5, 1)) == title
+    assert created == [title]
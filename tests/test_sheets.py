@@ -0,0 +1,93 @@
+import threading
+
+import gspread
+import pytest
+
+from governor import Governor
+from sheets import SheetPool, is_stale_handle_error
+
+
+class Creds:
+    valid = True
+
+
+class Spreadsheet:
+    def __init__(self):
+        self.opened = []
+        self.release = threading.Event()
+
+    def worksheet(self, title):
+        self.opened.append(title)
+        if title == "slow":
+            assert self.release.wait(5)
+        return f"ws:{title}"
+
+
+def make_pool(sh):
+    # Skips the service-account decoding in __init__
+    pool = SheetPool.__new__(SheetPool)
+    pool._creds = Creds()
+    pool._sheet_id = "sheet"
+    pool._client = object()
+    pool._spreadsheet = sh
+    pool._handles = {}
+    pool._lock = threading.RLock()
+    pool._key_locks = {}
+    pool.governor = Governor(reads_per_min=6000, writes_per_min=6000)
+    return pool
+
+
+def test_a_slow_open_does_not_block_cached_handles():
+    sh = Spreadsheet()
+    pool = make_pool(sh)
+    assert pool.worksheet("alice", "jobs", []) == "ws:jobs"
+    slow = threading.Thread(target=pool.worksheet, args=("bob", "slow", []))
+    slow.start()
+    while "slow" not in sh.opened:
+        pass
+    # bob's open is still in flight; alice's cached lookup must not wait for it
+    assert pool.worksheet("alice", "jobs", []) == "ws:jobs"
+    sh.release.set()
+    slow.join(5)
+    assert pool.worksheet("bob", "slow", []) == "ws:slow"
+    assert sh.opened == ["jobs", "slow"]
+
+
+def test_concurrent_opens_of_one_worksheet_share_the_call():
+    sh = Spreadsheet()
+    pool = make_pool(sh)
+    threads = [threading.Thread(target=pool.worksheet, args=("bob", "slow", [])) for _ in range(3)]
+    for t in threads:
+        t.start()
+    while "slow" not in sh.opened:
+        pass
+    sh.release.set()
+    for t in threads:
+        t.join(5)
+    assert sh.opened == ["slow"]
+
+
+class Response:
+    def __init__(self, status_code, message):
+        self.status_code = status_code
+        self.text = message
+
+    def json(self):
+        return {"error": {"code": self.status_code, "message": self.text}}
+
+
+@pytest.mark.parametrize("status, message, stale", [
+    (404, "Requested entity was not found.", True),
+    (400, "Unable to parse range: 'contacts_ann'!A2:E", True),
+    (400, "Invalid requests[0].updateCells: No grid with id: 12345", True),
+    (400, "Invalid value at 'data.values' (type.googleapis.com/google.protobuf.ListValue)", False),
+    (400, "Range ('jobs'!F2) exceeds grid limits. Max rows: 1000", False),
+    (403, "The caller does not have permission", False),
+])
+def test_is_stale_handle_error(status, message, stale):
+    assert is_stale_handle_error(gspread.exceptions.APIError(Response(status, message))) is stale
+
+
+def test_worksheet_not_found_is_stale():
+    assert is_stale_handle_error(gspread.WorksheetNotFound("jobs"))
+    assert not is_stale_handle_error(ValueError("bad"))
@@ -0,0 +1,75 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from snapshots import SnapshotStore  # noqa: E402
+
+HEADER = ["Timestamp", "Job Link", "Company"]
+
+
+class Sheet:
+    """fetch_rows stand-in that records every requested start row."""
+
+    def __init__(self, rows):
+        self.rows = [list(r) for r in rows]
+        self.starts = []
+        self.fail = False
+
+    def __call__(self, start):
+        self.starts.append(start)
+        if self.fail:
+            raise ConnectionError("sheets down")
+        return self.rows[start - 2:]
+
+
+def test_only_new_rows_are_fetched_and_appended():
+    sheet = Sheet([["t1", "l1", "Acme"], ["t2", "l2"]])
+    store = SnapshotStore(ttl=0)
+    df = store.read("u", "jobs", HEADER, sheet)
+    assert df["Company"].tolist() == ["Acme", ""]  # trailing empty cells are padded back
+    sheet.rows.append(["t3", "l3", "Globex"])
+    df = store.read("u", "jobs", HEADER, sheet)
+    assert sheet.starts == [2, 4]
+    assert df["Job Link"].tolist() == ["l1", "l2", "l3"]
+
+
+def test_reads_within_ttl_are_served_from_memory_until_marked_stale():
+    sheet = Sheet([["t1", "l1", "Acme"]])
+    store = SnapshotStore(ttl=3600)
+    store.read("u", "jobs", HEADER, sheet)
+    sheet.rows.append(["t2", "l2", "Globex"])
+    assert len(store.read("u", "jobs", HEADER, sheet)) == 1
+    store.mark_stale("u", "jobs")
+    assert len(store.read("u", "jobs", HEADER, sheet)) == 2
+    assert sheet.starts == [2, 3]
+
+
+def test_invalidate_refetches_everything():
+    sheet = Sheet([["t1", "l1", "Acme"]])
+    store = SnapshotStore(ttl=3600)
+    store.read("u", "jobs", HEADER, sheet)
+    sheet.rows[0][2] = "Acme Corp"  # edited in place: an incremental sync would miss it
+    store.invalidate("u")
+    assert store.read("u", "jobs", HEADER, sheet)["Company"].tolist() == ["Acme Corp"]
+    assert sheet.starts == [2, 2]
+
+
+def test_a_failed_fetch_leaves_the_snapshot_stale():
+    sheet = Sheet([["t1", "l1", "Acme"]])
+    store = SnapshotStore(ttl=3600)
+    store.read("u", "jobs", HEADER, sheet)
+    store.mark_stale("u", "jobs")
+    sheet.fail = True
+    with pytest.raises(ConnectionError):
+        store.read("u", "jobs", HEADER, sheet)
+    sheet.fail = False
+    sheet.rows.append(["t2", "l2", "Globex"])
+    assert len(store.read("u", "jobs", HEADER, sheet)) == 2
+
+
+def test_callers_cannot_change_the_shared_frame():
+    sheet = Sheet([["t1", "l1", "Acme"]])
+    store = SnapshotStore(ttl=3600)
+    df = store.read("u", "jobs", HEADER, sheet)
+    df["Extra"] = 1
+    assert "Extra" not in store.read("u", "jobs", HEADER, sheet).columns
@@ -0,0 +1,141 @@
+import json
+
+import pytest
+
+from write_queue import WriteQueue
+
+
+def journal(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def make_queue(tmp_path, flush_fn, **kwargs):
+    # A long interval keeps the background worker out of the way unless rows are enqueued
+    kwargs.setdefault("interval", 3600)
+    return WriteQueue(str(tmp_path / "journal.jsonl"), flush_fn, **kwargs)
+
+
+class Sheets:
+    """flush_fn that fails for the titles in `broken` and records the rest."""
+
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.written = []
+
+    def __call__(self, username, title, rows):
+        if title in self.broken:
+            raise PermissionError(f"403 on {title}")
+        self.written.append((username, title, rows))
+
+
+def test_replay_keeps_uncommitted_rows_and_compacts(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for rec in (
+            {"op": "add", "id": "a", "username": "u", "title": "u", "row": ["1"]},
+            {"op": "add", "id": "b", "username": "u", "title": "u", "row": ["2"]},
+            {"op": "commit", "ids": ["a"]},
+        ):
+            f.write(json.dumps(rec) + "\n")
+        f.write('{"op": "add", "id": "c", "use')  # torn by a crash
+
+    queue = make_queue(tmp_path, Sheets())
+
+    assert queue.pending_rows("u", "u") == [["2"]]
+    assert [r["id"] for r in journal(path)] == ["b"]
+
+
+def test_flush_commits_and_compacts(tmp_path):
+    sheets = Sheets()
+    queue = make_queue(tmp_path, sheets)
+    queue.enqueue_many("u", "u", [["1"], ["2"]])
+
+    assert queue.flush()
+    assert [rows for _, _, rows in sheets.written] == [[["1"], ["2"]]]
+    assert queue.stats("u")["committed"] == 2
+    assert journal(tmp_path / "journal.jsonl") == []
+
+
+def test_failing_worksheet_does_not_block_others(tmp_path):
+    sheets = Sheets(broken={"alice"})
+    queue = make_queue(tmp_path, sheets)
+    queue.enqueue("alice", "alice", ["a"])
+    queue.enqueue("bob", "bob", ["b"])
+
+    assert not queue.flush()
+    assert ("bob", "bob", [["b"]]) in sheets.written
+    assert queue.stats("bob") == {
+        "pending": 0, "committed": 1, "failures": 0, "last_error": None, "dead": 0, "dead_error": None,
+    }
+    alice = queue.stats("alice")
+    assert alice["pending"] == 1 and alice["failures"] >= 1
+    assert "403" in alice["last_error"]
+
+
+def test_flush_of_one_worksheet_ignores_the_others(tmp_path):
+    queue = make_queue(tmp_path, Sheets(broken={"alice"}))
+    queue.enqueue("alice", "alice", ["a"])
+    queue.enqueue("bob", "bob", ["b"])
+
+    assert queue.flush("bob", "bob")
+    assert not queue.flush("alice", "alice")
+
+
+def test_failing_worksheet_backs_off(tmp_path):
+    calls = []
+
+    def flush_fn(username, title, rows):
+        calls.append(title)
+        raise PermissionError("403")
+
+    queue = make_queue(tmp_path, flush_fn, interval=60)
+    queue.enqueue("alice", "alice", ["a"])
+    with queue._flush_lock:
+        queue._flush(force=True)
+        n = len(calls)
+        # Inside its backoff window the worker leaves the worksheet alone
+        queue._flush()
+    assert len(calls) == n
+
+
+def test_poison_rows_are_dead_lettered_and_survive_restart(tmp_path):
+    sheets = Sheets(broken={"alice"})
+    queue = make_queue(tmp_path, sheets, max_attempts=2)
+    queue.enqueue("alice", "alice", ["a"])
+
+    for _ in range(2):
+        queue.flush()
+
+    assert queue.stats("alice")["pending"] == 0
+    assert queue.stats("alice")["dead"] == 1
+    assert queue.dead_rows("alice") == [("alice", ["a"], "PermissionError: 403 on alice")]
+    assert queue.flush()
+
+    restarted = make_queue(tmp_path, sheets)
+    assert restarted.dead_rows("alice") == [("alice", ["a"], "PermissionError: 403 on alice")]
+    assert restarted.pending_rows("alice", "alice") == []
+
+
+def test_retry_dead_requeues(tmp_path):
+    sheets = Sheets(broken={"alice"})
+    queue = make_queue(tmp_path, sheets, max_attempts=1)
+    queue.enqueue("alice", "alice", ["a"])
+    queue.flush()
+    assert queue.stats("alice")["dead"] == 1
+
+    sheets.broken.clear()
+    assert queue.retry_dead("alice") == 1
+    assert queue.flush()
+    assert queue.stats("alice")["dead"] == 0
+    assert ("alice", "alice", [["a"]]) in sheets.written
+    assert make_queue(tmp_path, sheets).dead_rows("alice") == []
+
+
+@pytest.mark.parametrize("batch_size, expected", [(2, [2, 2, 1]), (10, [5])])
+def test_flush_batches(tmp_path, batch_size, expected):
+    sheets = Sheets()
+    queue = make_queue(tmp_path, sheets, batch_size=batch_size)
+    queue.enqueue_many("u", "u", [[str(i)] for i in range(5)])
+    queue.flush()
+    assert [len(rows) for _, _, rows in sheets.written] == expected
@@ -0,0 +1,137 @@
+"""
+Lightweight span timing for the app's hot paths.
+
+    with span("sheets.read"):
+        ...
+
+    with span("llm.enrich") as s:
+        resp = client.chat.completions.create(...)
+        s.add_tokens(resp.usage)
+
+Every span lands in a rolling, process-wide SpanStore (STORE). A rerun can
+also collect its own spans with begin_trace()/end_trace(), which use a
+thread-local list so concurrent sessions don't mix.
+"""
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import wraps
+
+
+class SpanStore:
+    def __init__(self, window=2000):
+        self.window = window
+        self._spans = defaultdict(lambda: deque(maxlen=self.window))
+        self._calls = defaultdict(int)
+        self._errors = defaultdict(int)
+        self._tokens = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def record(self, name, duration, error=False, tokens=None):
+        with self._lock:
+            self._spans[name].append(duration)
+            self._calls[name] += 1
+            if error:
+                self._errors[name] += 1
+            for kind, n in (tokens or {}).items():
+                self._tokens[name][kind] += n or 0
+
+    def stats(self):
+        """Per operation: call/error counts, p50/p95/max over the window, token totals."""
+        with self._lock:
+            snapshot = {name: sorted(d) for name, d in self._spans.items()}
+            calls, errors = dict(self._calls), dict(self._errors)
+            tokens = {name: dict(t) for name, t in self._tokens.items()}
+        out = {}
+        for name, durations in sorted(snapshot.items()):
+            n = len(durations)
+            out[name] = {
+                "calls": calls.get(name, 0),
+                "errors": errors.get(name, 0),
+                "p50_s": durations[int(0.50 * (n - 1))] if n else None,
+                "p95_s": durations[int(0.95 * (n - 1))] if n else None,
+                "max_s": durations[-1] if n else None,
+            }
+            if name in tokens:
+                out[name]["tokens"] = tokens[name]
+        return out
+
+    def to_json(self):
+        return json.dumps(self.stats(), indent=2)
+
+    def to_prometheus(self, prefix="jobtracker"):
+        lines = [
+            f"# TYPE {prefix}_op_latency_seconds summary",
+            f"# TYPE {prefix}_op_calls_total counter",
+            f"# TYPE {prefix}_op_errors_total counter",
+            f"# TYPE {prefix}_llm_tokens_total counter",
+        ]
+        for name, s in self.stats().items():
+            label = f'op="{name}"'
+            for q, key in (("0.5", "p50_s"), ("0.95", "p95_s")):
+                if s[key] is not None:
+                    lines.append(f'{prefix}_op_latency_seconds{{{label},quantile="{q}"}} {s[key]:.6f}')
+            lines.append(f"{prefix}_op_calls_total{{{label}}} {s['calls']}")
+            lines.append(f"{prefix}_op_errors_total{{{label}}} {s['errors']}")
+            for kind, n in s.get("tokens", {}).items():
+                lines.append(f'{prefix}_llm_tokens_total{{{label},kind="{kind}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+
+STORE = SpanStore()
+_local = threading.local()
+
+
+def begin_trace():
+    _local.trace = []
+
+
+def end_trace():
+    trace = getattr(_local, "trace", None) or []
+    _local.trace = None
+    return trace
+
+
+class Span:
+    def __init__(self, name):
+        self.name = name
+        self.tokens = None
+
+    def add_tokens(self, usage):
+        """Attach OpenAI usage (prompt/completion token counts) to this span."""
+        if usage is not None:
+            self.tokens = {
+                "prompt": getattr(usage, "prompt_tokens", 0) or 0,
+                "completion": getattr(usage, "completion_tokens", 0) or 0,
+            }
+
+
+@contextmanager
+def span(name):
+    s = Span(name)
+    started = time.perf_counter()
+    error = False
+    try:
+        yield s
+    except BaseException:
+        error = True
+        raise
+    finally:
+        duration = time.perf_counter() - started
+        STORE.record(name, duration, error, s.tokens)
+        trace = getattr(_local, "trace", None)
+        if trace is not None:
+            trace.append((name, duration))
+
+
+def traced(name):
+    """Decorator form of span()."""
+    def wrap(fn):
+        @wraps(fn)
+        def inner(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
@@ -0,0 +1,80 @@
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from tracing import span
+
+DEFAULT_PARAMS = {"width": 600, "height": 300, "background_color": "white"}
+
+
+def render_png(freq, params):
+    """Lay out the cloud and encode it straight to PNG (no matplotlib figure)."""
+    with span("dashboard.wordcloud_render"):
+        from wordcloud import WordCloud
+
+        wc = WordCloud(**params).generate_from_frequencies(freq)
+        buf = io.BytesIO()
+        wc.to_image().save(buf, format="PNG", optimize=True)
+        return buf.getvalue()
+
+
+def cloud_key(freq, params):
+    payload = json.dumps([sorted(freq.items()), sorted(params.items())], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class WordCloudCache:
+    """
+    LRU cache of rendered word cloud PNGs keyed by the frequency table and
+    render parameters. Renders run on a small background pool; until a new
+    image is ready, callers get the last image rendered for that user.
+    """
+
+    def __init__(self, max_entries=32, workers=1):
+        self.max_entries = max_entries
+        self._images = OrderedDict()
+        self._latest = {}  # username -> key of the newest finished image
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wordcloud")
+
+    def _render(self, key, username, freq, params):
+        try:
+            png = render_png(freq, params)
+            with self._lock:
+                self._images[key] = png
+                self._images.move_to_end(key)
+                while len(self._images) > self.max_entries:
+                    self._images.popitem(last=False)
+                self._latest[username] = key
+            return png
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def get(self, username, freq, params=None, wait=False):
+        """
+        Returns (png bytes or None, fresh). `fresh` is False while a newer
+        render is still running. With wait=True the caller blocks for the
+        render when there is nothing to show yet.
+        """
+        params = {**DEFAULT_PARAMS, **(params or {})}
+        key = cloud_key(freq, params)
+        with self._lock:
+            if key in self._images:
+                self._images.move_to_end(key)
+                self._latest[username] = key
+                return self._images[key], True
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._pool.submit(self._render, key, username, dict(freq), params)
+                self._inflight[key] = future
+            stale = self._images.get(self._latest.get(username))
+        if stale is not None:
+            return stale, False
+        if wait:
+            return future.result(), True
+        return None, False
@@ -0,0 +1,163 @@
+import threading
+import time
+import uuid
+
+from journal import Journal
+from retry import backoff_delay
+
+
+class WriteQueue:
+    """
+    Write-behind queue for sheet appends.
+
+    Every row is written to a local Journal (and fsynced) before
+    `enqueue` returns, so it survives a crash or redeploy. A background
+    worker groups pending rows per worksheet and hands them to
+    `flush_fn(username, title, rows)` in one bulk call. Each worksheet is
+    flushed on its own: a failing one backs off exponentially without
+    holding up the others, and a batch that fails `max_attempts` times in a
+    row is parked on a dead-letter list (see `dead_rows` / `retry_dead`).
+    Rows still pending in the journal are replayed when the queue is created.
+
+    Journal entries are {"op": "add", "id", "username", "title", "row", "queued_at"}.
+    """
+
+    def __init__(self, journal_path, flush_fn, on_commit=None,
+                 batch_size=200, interval=2.0, max_backoff=120.0, max_attempts=8):
+        self.journal_path = journal_path
+        self.flush_fn = flush_fn
+        self.on_commit = on_commit
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+
+        # Replays anything left from a previous run
+        self._journal = Journal(journal_path)
+        self._pending = self._journal.live  # id -> entry, in insertion order
+        self._dead = self._journal.parked  # id -> entry plus "error", given up on after max_attempts
+        self._groups = {}  # (username, title) -> {"failures", "next_at", "last_error"} while failing
+        self._committed = {}  # username -> rows committed since start
+        self.last_error = None
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._flush_lock = threading.Lock()
+
+        self._worker = threading.Thread(target=self._run, name="sheet-write-queue", daemon=True)
+        self._worker.start()
+
+    # --- public API ---
+    def enqueue(self, username, title, row):
+        return self.enqueue_many(username, title, [row])[0]
+
+    def enqueue_many(self, username, title, rows):
+        """Journal several rows with a single fsync."""
+        now = time.time()
+        recs = [{"op": "add", "id": uuid.uuid4().hex, "username": username,
+                 "title": title, "row": list(row), "queued_at": now} for row in rows]
+        with self._lock:
+            self._journal.add(recs)
+        self._wake.set()
+        return [rec["id"] for rec in recs]
+
+    def pending_rows(self, username, title):
+        with self._lock:
+            return [r["row"] for r in self._pending.values()
+                    if r["username"] == username and r["title"] == title]
+
+    def dead_rows(self, username):
+        """[(title, row, error)] the queue gave up on for this user."""
+        with self._lock:
+            return [(r["title"], r["row"], r["error"]) for r in self._dead.values() if r["username"] == username]
+
+    def retry_dead(self, username):
+        """Put a user's dead-lettered rows back in the queue; returns how many."""
+        with self._lock:
+            ids = [i for i, r in self._dead.items() if r["username"] == username]
+            if not ids:
+                return 0
+            for i in ids:
+                self._groups.pop((self._dead[i]["username"], self._dead[i]["title"]), None)
+            self._journal.retry(ids)
+        self._wake.set()
+        return len(ids)
+
+    def stats(self, username):
+        with self._lock:
+            failing = [g for (u, _), g in self._groups.items() if u == username]
+            dead = [r for r in self._dead.values() if r["username"] == username]
+            return {
+                "pending": sum(1 for r in self._pending.values() if r["username"] == username),
+                "committed": self._committed.get(username, 0),
+                "failures": sum(g["failures"] for g in failing),
+                "last_error": failing[-1]["last_error"] if failing else None,
+                "dead": len(dead),
+                "dead_error": dead[-1]["error"] if dead else None,
+            }
+
+    def flush(self, username=None, title=None):
+        """
+        Push pending rows now, ignoring any backoff: every worksheet's, or
+        only `title`'s when given. Returns True if none of those rows are left.
+        """
+        with self._flush_lock:
+            return self._flush(only=(username, title) if title is not None else None, force=True)
+
+    def _flush(self, only=None, force=False):
+        now = time.time()
+        with self._lock:
+            groups = {}
+            for rec in self._pending.values():
+                group = (rec["username"], rec["title"])
+                if only is not None and group != only:
+                    continue
+                if not force and self._groups.get(group, {}).get("next_at", 0.0) > now:
+                    continue
+                groups.setdefault(group, []).append(rec)
+
+        for group, recs in groups.items():
+            for i in range(0, len(recs), self.batch_size):
+                if not self._flush_batch(group, recs[i:i + self.batch_size]):
+                    # The rest of this worksheet waits for its backoff; other worksheets go on
+                    break
+
+        with self._lock:
+            if not self._pending:
+                self._journal.compact()
+            return not any(
+                only is None or (r["username"], r["title"]) == only for r in self._pending.values()
+            )
+
+    def _flush_batch(self, group, batch):
+        username, title = group
+        ids = [r["id"] for r in batch]
+        try:
+            self.flush_fn(username, title, [r["row"] for r in batch])
+        except Exception as e:
+            with self._lock:
+                state = self._groups.setdefault(group, {"failures": 0, "next_at": 0.0, "last_error": None})
+                state["failures"] += 1
+                state["last_error"] = self.last_error = f"{type(e).__name__}: {e}"
+                if state["failures"] < self.max_attempts:
+                    state["next_at"] = time.time() + backoff_delay(state["failures"], self.interval, self.max_backoff)
+                    return False
+                # Poison batch: park it so the worksheet's other rows get their turn
+                self._journal.park(ids, state["last_error"])
+                del self._groups[group]
+            return False
+        with self._lock:
+            # Mark readers stale before the rows leave the pending view
+            if self.on_commit:
+                self.on_commit(username, title)
+            self._journal.done(ids)
+            self._committed[username] = self._committed.get(username, 0) + len(ids)
+            self._groups.pop(group, None)
+        return True
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._pending:
+                with self._flush_lock:
+                    self._flush()